@@ -8,6 +8,7 @@ from .tts_engine_kokoro_onnx import KokoroOnnxTtsEngine
 from .interfaces import (
     AudioChunk,
     AudioProcessor,
+    BatchTtsEngine,
     BookMetadata,
     ChapterAudio,
     Chapter,
@@ -29,6 +30,7 @@ __all__ = [
     "AudioProcessor",
     "BasicTextCleaner",
     "BasicTextSegmenter",
+    "BatchTtsEngine",
     "BookMetadata",
     "ChapterAudio",
     "Chapter",
@@ -22,21 +22,57 @@ def chunk_cache_key(
     sample_rate: int,
     channels: int,
 ) -> str:
+    prefix = chunk_cache_prefix(
+        model_id=model_id,
+        lang_code=lang_code,
+        ref_audio_id=ref_audio_id,
+        ref_text=ref_text,
+        speed=speed,
+        sample_rate=sample_rate,
+        channels=channels,
+    )
+    return chunk_cache_key_for_prefix(prefix, text, voice=voice)
+
+
+def chunk_cache_prefix(
+    *,
+    model_id: str,
+    lang_code: str | None,
+    ref_audio_id: str | None,
+    ref_text: str | None,
+    speed: float,
+    sample_rate: int,
+    channels: int,
+) -> hashlib._Hash:
+    """Hash the synthesis parameters that stay fixed across a run.
+
+    Returns a sha256 primed with the sorted v1 key JSON up to ``"text"``;
+    :func:`chunk_cache_key_for_prefix` copies it and feeds the per-chunk tail,
+    so keys stay byte-identical to hashing the whole payload.
+    """
     payload = {
-        "v": 1,
         "model_id": model_id,
-        "voice": voice or "",
         "lang_code": lang_code or "",
         "ref_audio_id": ref_audio_id or "",
         "ref_text": ref_text or "",
         "speed": round(speed, 4),
         "sample_rate": sample_rate,
         "channels": channels,
-        "text": text,
     }
+    # Every key here sorts before "text", "v" and "voice".
     serialized = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
-    digest = hashlib.sha256(serialized.encode("utf-8")).hexdigest()
-    return f"tts_{digest}"
+    return hashlib.sha256(f"{serialized[:-1]},".encode("utf-8"))
+
+
+def chunk_cache_key_for_prefix(prefix: hashlib._Hash, text: str, *, voice: str | None) -> str:
+    """Finish a precomputed :func:`chunk_cache_prefix` with the per-chunk inputs."""
+    tail = (
+        f'"text":{json.dumps(text, ensure_ascii=True)},"v":1,'
+        f'"voice":{json.dumps(voice or "", ensure_ascii=True)}}}'
+    )
+    digest = prefix.copy()
+    digest.update(tail.encode("utf-8"))
+    return f"tts_{digest.hexdigest()}"
 
 
 @dataclass(frozen=True)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass, field
 import json
 import logging
@@ -66,15 +67,24 @@ class FfmpegAudioProcessor(AudioProcessor):
         if not chunks:
             raise RuntimeError("No chunks provided for stitching.")
 
+        # The silence chunk recurs between every pair of chunks; read each
+        # repeated file once instead of reopening it for every gap.
+        repeated = {path for path, count in Counter(chunk.path for chunk in chunks).items() if count > 1}
+        frames_by_path: dict[Path, bytes] = {}
         with wave.open(str(out_path), "wb") as output:
             output.setnchannels(self.channels)
             output.setsampwidth(2)
             output.setframerate(self.sample_rate)
             for chunk in chunks:
-                self._append_chunk(output, chunk.path)
+                frames = frames_by_path.get(chunk.path)
+                if frames is None:
+                    frames = self._read_chunk_frames(chunk.path)
+                    if chunk.path in repeated:
+                        frames_by_path[chunk.path] = frames
+                output.writeframes(frames)
         return out_path
 
-    def _append_chunk(self, output: wave.Wave_write, path: Path) -> None:
+    def _read_chunk_frames(self, path: Path) -> bytes:
         with wave.open(str(path), "rb") as handle:
             if handle.getnchannels() != self.channels:
                 raise RuntimeError(f"Channel mismatch for {path}: expected {self.channels}")
@@ -82,8 +92,7 @@ class FfmpegAudioProcessor(AudioProcessor):
                 raise RuntimeError(f"Sample rate mismatch for {path}: expected {self.sample_rate}")
             if handle.getsampwidth() != 2:
                 raise RuntimeError(f"Sample width mismatch for {path}: expected 16-bit PCM")
-            frames = handle.readframes(handle.getnframes())
-            output.writeframes(frames)
+            return handle.readframes(handle.getnframes())
 
     def _silence_chunk(self, silence_ms: int) -> AudioChunk:
         silence_dir = ensure_dir(self.work_dir / "silence")
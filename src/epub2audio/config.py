@@ -50,9 +50,12 @@ DEFAULT_CONFIG: dict[str, Any] = {
         "onnx_model_file": "model_q8f16.onnx",
         "onnx_voices_file": "voices-v1.0.bin",
         "max_input_tokens": 510,
+        "onnx_share_runtime": False,
         "chapter_workers": "auto",
         "chapter_parallelism": "thread",
         "unsafe_mlx_parallelism": False,
+        "max_concurrent": "auto",
+        "batch_size": 1,
     },
     "audio": {
         "silence_ms": 250,
@@ -104,6 +107,9 @@ class TtsConfig:
     chapter_workers: int | None
     chapter_parallelism: str
     unsafe_mlx_parallelism: bool
+    max_concurrent: int | None = None
+    batch_size: int = 1
+    onnx_share_runtime: bool = False
 
 
 @dataclass(frozen=True)
@@ -179,6 +185,9 @@ def load_config(config_path: Path | None = None, *, cwd: Path | None = None) ->
         chapter_workers=_optional_workers(tts_raw.get("chapter_workers")),
         chapter_parallelism=_optional_parallelism(tts_raw.get("chapter_parallelism")),
         unsafe_mlx_parallelism=bool(tts_raw.get("unsafe_mlx_parallelism", False)),
+        max_concurrent=_optional_workers(tts_raw.get("max_concurrent")),
+        batch_size=max(1, int(tts_raw.get("batch_size", DEFAULT_CONFIG["tts"]["batch_size"]))),
+        onnx_share_runtime=bool(tts_raw.get("onnx_share_runtime", False)),
     )
     audio_raw = merged.get("audio", {})
     audio = AudioConfig(
@@ -222,9 +231,12 @@ def config_summary(config: Config) -> str:
         f"  onnx_model_file: {config.tts.onnx_model_file}\n"
         f"  onnx_voices_file: {config.tts.onnx_voices_file}\n"
         f"  max_input_tokens: {config.tts.max_input_tokens}\n"
+        f"  onnx_share_runtime: {config.tts.onnx_share_runtime}\n"
         f"  chapter_workers: {config.tts.chapter_workers or 'auto'}\n"
         f"  chapter_parallelism: {config.tts.chapter_parallelism}\n"
         f"  unsafe_mlx_parallelism: {config.tts.unsafe_mlx_parallelism}\n"
+        f"  max_concurrent: {config.tts.max_concurrent or 'auto'}\n"
+        f"  batch_size: {config.tts.batch_size}\n"
         "Audio\n"
         f"  silence_ms: {config.audio.silence_ms}\n"
         f"  normalize: {config.audio.normalize}\n"
@@ -378,9 +390,12 @@ execution_provider = "auto"
 onnx_model_file = "model_q8f16.onnx"
 onnx_voices_file = "voices-v1.0.bin"
 max_input_tokens = 510
+onnx_share_runtime = false
 chapter_workers = "auto"
 chapter_parallelism = "thread"
 unsafe_mlx_parallelism = false
+max_concurrent = "auto"
+batch_size = 1
 
 [audio]
 silence_ms = 250
@@ -33,7 +33,7 @@ class DoctorOptions:
     output_dir: Path | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DoctorCheck:
     name: str
     status: str
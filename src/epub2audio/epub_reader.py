@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import logging
+import os
 from pathlib import Path
 import posixpath
-import tempfile
-from collections.abc import Iterable as IterableABC
+import re
+import sys
+from types import FunctionType
 from urllib.parse import unquote
 
-from .interfaces import BookMetadata, Chapter, EpubBook, EpubReader
+from .interfaces import BookMetadata, Chapter, CoverImage, EpubBook, EpubReader
 
 try:  # pragma: no cover - exercised in integration tests once dependencies are installed
     from ebooklib import ITEM_COVER, ITEM_DOCUMENT, epub
@@ -20,12 +25,49 @@ except ImportError:  # pragma: no cover - optional dependency until Phase 1 is w
     ITEM_DOCUMENT = None
 
 try:  # pragma: no cover - exercised in integration tests once dependencies are installed
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer
 except ImportError:  # pragma: no cover - optional dependency until Phase 1 is wired in
     BeautifulSoup = None
+    SoupStrainer = None
+
+try:  # pragma: no cover - parser choice depends on installed packages
+    import lxml  # noqa: F401
+
+    _HTML_PARSER = "lxml"
+except ImportError:  # pragma: no cover - fallback when lxml is unavailable
+    _HTML_PARSER = "html.parser"
 
 _LOGGER = logging.getLogger(__name__)
 
+_TOC_EXHAUSTED = object()
+_UNSET = object()
+_INTERN_TITLE_MAX_CHARS = 128
+# Plain ``get_name`` functions per item class, so spine items skip attribute probing.
+_NAME_GETTER_BY_TYPE: dict[type, FunctionType | None] = {}
+_PARALLEL_EXTRACT_MIN_ITEMS = 4
+_EXT_BY_MEDIA_TYPE = {
+    "image/jpeg": ".jpg",
+    "image/jpg": ".jpg",
+    "image/png": ".png",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+}
+# Any character data outside a tag; documents without it are markup-only.
+_HAS_TEXT_RE = re.compile(rb"(?:^|>)\s*[^<\s]")
+# Collapses blank lines and the whitespace around line breaks in one pass.
+_LINE_BREAK_RUN_RE = re.compile(r"\s*\n\s*")
+# Filename stems become fallback titles with separators turned into spaces.
+_STEM_TRANSLATE = str.maketrans({"_": " ", "-": " "})
+# Spine ``linear`` values marking an item as non-linear (0 matches via False).
+_NON_LINEAR_VALUES = frozenset({"no", False})
+
+# Tags dropped before reading chapter text; the fallback pass keeps page chrome.
+_STRUCTURAL_TAGS = ("script", "style", "noscript", "header", "footer", "nav", "svg")
+_SCRIPT_TAGS = ("script", "style", "noscript")
+
+# Only <title> and <body> are read from chapter documents; skip building the rest.
+_CHAPTER_STRAINER = SoupStrainer(["title", "body"]) if SoupStrainer is not None else None
+
 
 @dataclass(frozen=True)
 class EbooklibEpubReader:
@@ -81,35 +123,24 @@ def _first_metadata(book: epub.EpubBook, name: str) -> str | None:
     return cleaned or None
 
 
-def _extract_cover_image(book: epub.EpubBook) -> Path | None:
-    """Extract the cover image from the EPUB and return its path.
+def _extract_cover_image(book: epub.EpubBook) -> CoverImage | None:
+    """Extract the cover image bytes from the EPUB.
 
-    Returns None if no cover is found. The cover is extracted to a
-    temporary file that should be cleaned up by the caller.
+    Returns None if no cover is found. Nothing is written to disk here;
+    the pipeline writes a temp file only when packaging needs one.
     """
     cover_item = _get_cover_item(book)
     if cover_item is None:
         return None
 
-    try:
-        content = cover_item.get_content()
-        if not content:
-            return None
-
-        # Determine file extension from media type or item name
-        media_type = getattr(cover_item, "media_type", "")
-        ext = _media_type_to_extension(media_type)
-
-        # Create a temporary file with appropriate extension
-        with tempfile.NamedTemporaryFile(
-            suffix=ext, delete=False, prefix="epub_cover_"
-        ) as tmp_file:
-            tmp_file.write(content)
-            return Path(tmp_file.name)
-    except (OSError, IOError) as e:  # pragma: no cover - defensive
-        _LOGGER.warning("Failed to extract cover image: %s", e)
+    content = cover_item.get_content()
+    if not content:
         return None
 
+    # Determine file extension from media type or item name
+    media_type = getattr(cover_item, "media_type", "")
+    return CoverImage(data=content, extension=_media_type_to_extension(media_type))
+
 
 def _get_cover_item(book: epub.EpubBook) -> object | None:
     """Find the cover item in the EPUB, handling both EPUB 2 and 3 formats."""
@@ -119,63 +150,78 @@ def _get_cover_item(book: epub.EpubBook) -> object | None:
         return cover_item
 
     # Try EPUB 2 style: <meta name="cover" content="item-id" />
-    for meta_name, meta_content in book.get_metadata("OPF", "meta"):
-        if meta_name == "cover" and meta_content:
-            cover_item = book.get_item_by_id(meta_content)
-            if cover_item:
-                return cover_item
-
+    for cover_id in _cover_meta_ids(book.get_metadata("OPF", "meta")):
+        cover_item = book.get_item_by_id(cover_id)
+        if cover_item:
+            return cover_item
     return None
 
 
+def _cover_meta_ids(metas: Iterable[tuple[object, object]]) -> Iterable[str]:
+    for value, attrs in metas:
+        # ebooklib yields (None, {"name": ..., "content": ...}) for OPF <meta>.
+        if isinstance(attrs, dict):
+            name, content = attrs.get("name"), attrs.get("content")
+        else:
+            name, content = value, attrs
+        if name == "cover" and content:
+            yield str(content)
+
+
 def _media_type_to_extension(media_type: str) -> str:
     """Convert a media type to a file extension."""
-    extensions = {
-        "image/jpeg": ".jpg",
-        "image/jpg": ".jpg",
-        "image/png": ".png",
-        "image/gif": ".gif",
-        "image/webp": ".webp",
-    }
-    return extensions.get(media_type.lower(), ".jpg")
+    if not media_type:
+        return ".jpg"
+    return _EXT_BY_MEDIA_TYPE.get(media_type.strip().lower(), ".jpg")
 
 
 def _build_toc_maps(toc: Iterable[object]) -> tuple[dict[str, str], dict[str, str]]:
     toc_map: dict[str, str] = {}
     toc_basename_map: dict[str, str] = {}
-    basename_counts: dict[str, int] = {}
+    duplicate_basenames: set[str] = set()
 
     for title, href in _walk_toc(toc):
         normalized_title = _normalize_title(title)
         normalized_href = _normalize_href(href)
         if not normalized_title or not normalized_href:
             continue
+        if len(normalized_title) <= _INTERN_TITLE_MAX_CHARS:
+            # Repeated labels ("Chapter", part names) share one string object.
+            normalized_title = sys.intern(normalized_title)
 
         if normalized_href not in toc_map:
             toc_map[normalized_href] = normalized_title
 
-        basename = posixpath.basename(normalized_href)
-        if basename:
-            basename_counts[basename] = basename_counts.get(basename, 0) + 1
-            if basename not in toc_basename_map:
-                toc_basename_map[basename] = normalized_title
-
-    for basename, count in basename_counts.items():
-        if count > 1:
-            toc_basename_map.pop(basename, None)
+        basename = normalized_href.rsplit("/", 1)[-1]
+        if not basename or basename in duplicate_basenames:
+            continue
+        if basename in toc_basename_map:
+            # Ambiguous basenames cannot be used for fallback matching.
+            del toc_basename_map[basename]
+            duplicate_basenames.add(basename)
+            continue
+        toc_basename_map[basename] = normalized_title
 
     return toc_map, toc_basename_map
 
 
 def _walk_toc(items: Iterable[object]) -> Iterable[tuple[str | None, str | None]]:
-    for item in items or []:
+    # Depth-first walk with an explicit stack of iterators so deeply nested
+    # navigation documents cannot hit the recursion limit.
+    stack = deque([iter(items or ())])
+    while stack:
+        item = next(stack[-1], _TOC_EXHAUSTED)
+        if item is _TOC_EXHAUSTED:
+            stack.pop()
+            continue
+
         if isinstance(item, tuple) and len(item) == 2:
             section, children = item
             entry = _toc_entry(section)
             if entry:
                 yield entry
             if _is_iterable_collection(children):
-                yield from _walk_toc(children)
+                stack.append(iter(children))
             continue
 
         entry = _toc_entry(item)
@@ -184,7 +230,7 @@ def _walk_toc(items: Iterable[object]) -> Iterable[tuple[str | None, str | None]
             continue
 
         if _is_iterable_collection(item):
-            yield from _walk_toc(item)
+            stack.append(iter(item))
 
 
 def _toc_entry(item: object) -> tuple[str | None, str | None] | None:
@@ -196,7 +242,7 @@ def _toc_entry(item: object) -> tuple[str | None, str | None] | None:
 
 
 def _is_iterable_collection(value: object) -> bool:
-    return isinstance(value, IterableABC) and not isinstance(value, (str, bytes))
+    return isinstance(value, Iterable) and not isinstance(value, (str, bytes))
 
 
 def _normalize_title(title: str | None) -> str | None:
@@ -228,9 +274,7 @@ def _extract_chapters(
     toc_basename_map: dict[str, str],
     skip_non_linear: bool,
 ) -> list[Chapter]:
-    chapters: list[Chapter] = []
-    index = 0
-
+    documents: list[tuple[str, str, object]] = []
     for item_id, linear in book.spine:
         if skip_non_linear and _is_non_linear(linear):
             continue
@@ -243,8 +287,13 @@ def _extract_chapters(
         if item.get_type() != ITEM_DOCUMENT:
             continue
 
-        href = _get_item_href(item)
-        html_title, text = _extract_title_and_text(_get_item_content(item))
+        documents.append((item_id, _get_item_href(item), item))
+
+    extracted = _extract_documents([item for _, _, item in documents])
+
+    chapters: list[Chapter] = []
+    index = 0
+    for (item_id, href, _), (html_title, text) in zip(documents, extracted):
         title = _resolve_title(
             href=href,
             toc_map=toc_map,
@@ -264,20 +313,54 @@ def _extract_chapters(
     return chapters
 
 
+def _extract_documents(items: list[object]) -> list[tuple[str | None, str]]:
+    """Parse spine documents, fanning out to threads for larger books.
+
+    Results keep spine order. Small spines are parsed inline because the
+    thread pool setup would cost more than it saves.
+    """
+    if len(items) < _PARALLEL_EXTRACT_MIN_ITEMS:
+        return [_extract_item(item) for item in items]
+
+    workers = min(len(items), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_extract_item, items))
+
+
+def _extract_item(item: object) -> tuple[str | None, str]:
+    content = _get_item_content(item)
+    if isinstance(content, bytes) and not _HAS_TEXT_RE.search(content):
+        # Markup-only placeholder pages have no text to read; skip the parse.
+        return None, ""
+    return _extract_title_and_text(content)
+
+
 def _is_non_linear(linear: object) -> bool:
-    if linear is None:
-        return False
     if isinstance(linear, str):
-        return linear.strip().lower() == "no"
-    return not bool(linear)
+        linear = linear.strip().lower()
+    try:
+        return linear in _NON_LINEAR_VALUES
+    except TypeError:  # pragma: no cover - unhashable spine values are not produced by ebooklib
+        return not bool(linear)
 
 
 def _get_item_href(item: object) -> str:
-    if hasattr(item, "get_name"):
-        try:
-            return str(item.get_name())
-        except (AttributeError, TypeError, OSError):  # pragma: no cover - defensive
-            return ""
+    item_type = type(item)
+    getter = _NAME_GETTER_BY_TYPE.get(item_type, _UNSET)
+    if getter is _UNSET:
+        getter = getattr(item_type, "get_name", None)
+        if not isinstance(getter, FunctionType):
+            getter = None
+        _NAME_GETTER_BY_TYPE[item_type] = getter
+
+    try:
+        if getter is not None:
+            return str(getter(item))
+        bound = getattr(item, "get_name", None)
+        if callable(bound):
+            return str(bound())
+    except (AttributeError, TypeError, OSError):  # pragma: no cover - defensive
+        return ""
     return str(getattr(item, "file_name", "")) or str(getattr(item, "href", ""))
 
 
@@ -305,26 +388,22 @@ def _resolve_title(
     index: int,
 ) -> str:
     normalized_href = _normalize_href(href)
-    if normalized_href:
-        if normalized_href in toc_map:
-            return toc_map[normalized_href]
-        basename = posixpath.basename(normalized_href)
-        if basename in toc_basename_map:
-            return toc_basename_map[basename]
-
-    if html_title:
-        return html_title.strip()
+    basename = normalized_href.rsplit("/", 1)[-1]
+    return (
+        toc_map.get(normalized_href)
+        or toc_basename_map.get(basename)
+        or (html_title and html_title.strip())
+        or _stem_title(basename)
+        or f"Section {index + 1}"
+    )
 
-    if normalized_href:
-        stem = posixpath.splitext(posixpath.basename(normalized_href))[0]
-        if stem:
-            return stem.replace("_", " ").replace("-", " ").strip()
 
-    return f"Section {index + 1}"
+def _stem_title(basename: str) -> str:
+    return posixpath.splitext(basename)[0].translate(_STEM_TRANSLATE).strip()
 
 
 def _extract_title_and_text(content: bytes | str) -> tuple[str | None, str]:
-    soup = BeautifulSoup(content, "html.parser")
+    soup = _parse_chapter_html(content)
 
     title = None
     if soup.title and soup.title.string:
@@ -333,7 +412,7 @@ def _extract_title_and_text(content: bytes | str) -> tuple[str | None, str]:
     primary_text = _extract_text_from_soup(soup, remove_structural=True)
     if _should_fallback_to_full_text(primary_text):
         fallback_text = _extract_text_from_soup(
-            BeautifulSoup(content, "html.parser"),
+            _parse_chapter_html(content),
             remove_structural=False,
         )
         if _use_fallback_text(primary_text, fallback_text):
@@ -342,19 +421,17 @@ def _extract_title_and_text(content: bytes | str) -> tuple[str | None, str]:
     return title, primary_text
 
 
+def _parse_chapter_html(content: bytes | str) -> BeautifulSoup:
+    return BeautifulSoup(content, _HTML_PARSER, parse_only=_CHAPTER_STRAINER)
+
+
 def _extract_text_from_soup(soup: BeautifulSoup, *, remove_structural: bool) -> str:
-    if remove_structural:
-        for tag in soup(["script", "style", "noscript", "header", "footer", "nav", "svg"]):
-            tag.decompose()
-    else:
-        for tag in soup(["script", "style", "noscript"]):
-            tag.decompose()
+    for tag in soup(list(_STRUCTURAL_TAGS if remove_structural else _SCRIPT_TAGS)):
+        tag.decompose()
 
     root = soup.body if soup.body else soup
-    text = root.get_text(separator="\n")
-    lines = [line.strip() for line in text.splitlines()]
-    lines = [line for line in lines if line]
-    return "\n".join(lines)
+    text = root.get_text("\n", strip=True)
+    return _LINE_BREAK_RUN_RE.sub("\n", text).strip()
 
 
 def _should_fallback_to_full_text(text: str) -> bool:
@@ -6,15 +6,27 @@ diagnostics and error analysis.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from dataclasses import InitVar, dataclass, field
 from enum import Enum
 import json
+import os
 from pathlib import Path
-from typing import Any
+import re
+import time
+from typing import Any, Sequence
 import traceback
 
-from .utils import ensure_dir, slugify
+from .utils import atomic_write_bytes, ensure_dir, slugify
+
+try:  # pragma: no cover - optional speedup, exercised when orjson is installed
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json fallback
+    orjson = None
+
+try:  # pragma: no cover - optional SIMD parser for loads when orjson is missing
+    import simdjson
+except ImportError:  # pragma: no cover - stdlib json fallback
+    simdjson = None
 
 
 class ErrorCategory(Enum):
@@ -61,7 +73,19 @@ class ErrorSeverity(Enum):
     CRITICAL = "critical"
 
 
-@dataclass(frozen=True)
+# Plain dict lookups for enum <-> value conversion on the save/load paths.
+_CATEGORY_VALUE = {category: category.value for category in ErrorCategory}
+_CATEGORY_BY_VALUE = {category.value: category for category in ErrorCategory}
+_SEVERITY_VALUE = {severity: severity.value for severity in ErrorSeverity}
+_SEVERITY_BY_VALUE = {severity.value: severity for severity in ErrorSeverity}
+# Snapshots are written with run_id first; escaped values fall back to a full load.
+_RUN_ID_HEAD_BYTES = 256
+_RUN_ID_HEAD_RE = re.compile(rb'^\s*\{\s*"run_id"\s*:\s*"([^"\\]*)"')
+# Formatting a traceback walks every frame; only failures worth debugging pay for it.
+_TRACED_SEVERITIES = frozenset({ErrorSeverity.ERROR, ErrorSeverity.CRITICAL})
+
+
+@dataclass(frozen=True, slots=True)
 class ErrorEntry:
     """A single structured error entry."""
 
@@ -74,14 +98,40 @@ class ErrorEntry:
     details: dict[str, Any] | None = None
     exception_type: str | None = None
     exception_message: str | None = None
-    stack_trace: str | None = None
+    # Exposed as a str through the ``stack_trace`` property below.
+    stack_trace: InitVar[str | None] = None
+    _stack_trace: str | None = field(default=None, init=False, repr=False, compare=False)
+    # Raw traceback lines from add_error, joined on first access.
+    _stack_trace_lines: tuple[str, ...] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self, stack_trace: str | None) -> None:
+        object.__setattr__(self, "_stack_trace", stack_trace)
+
+    @classmethod
+    def _from_raw(cls, raw: dict[str, Any]) -> ErrorEntry:
+        """Rebuild an entry from its ``to_dict`` form without the keyword ``__init__``."""
+        entry = object.__new__(cls)
+        setter = object.__setattr__
+        get = raw.get
+        setter(entry, "category", _CATEGORY_BY_VALUE[raw["category"]])
+        setter(entry, "severity", _SEVERITY_BY_VALUE[raw["severity"]])
+        setter(entry, "message", raw["message"])
+        setter(entry, "timestamp", raw["timestamp"])
+        setter(entry, "step", get("step"))
+        setter(entry, "chapter_index", get("chapter_index"))
+        setter(entry, "details", get("details"))
+        setter(entry, "exception_type", get("exception_type"))
+        setter(entry, "exception_message", get("exception_message"))
+        setter(entry, "_stack_trace", get("stack_trace"))
+        setter(entry, "_stack_trace_lines", None)
+        return entry
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
             "timestamp": self.timestamp,
-            "category": self.category.value,
-            "severity": self.severity.value,
+            "category": _CATEGORY_VALUE[self.category],
+            "severity": _SEVERITY_VALUE[self.severity],
             "step": self.step,
             "chapter_index": self.chapter_index,
             "message": self.message,
@@ -92,7 +142,20 @@ class ErrorEntry:
         }
 
 
-@dataclass
+def _entry_stack_trace(entry: ErrorEntry) -> str | None:
+    lines = entry._stack_trace_lines
+    if lines is not None:
+        object.__setattr__(entry, "_stack_trace", "".join(lines).strip())
+        object.__setattr__(entry, "_stack_trace_lines", None)
+    return entry._stack_trace
+
+
+# Assigned after the dataclass is built so ``stack_trace`` stays an __init__
+# argument while reads always return the joined string.
+ErrorEntry.stack_trace = property(_entry_stack_trace)  # type: ignore[assignment]
+
+
+@dataclass(slots=True)
 class ErrorLog:
     """Structured error log for a single book."""
 
@@ -113,16 +176,16 @@ class ErrorLog:
         exc: BaseException | None = None,
     ) -> ErrorEntry:
         """Add a new error entry to the log."""
-        timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        timestamp = _utc_now_iso()
         exception_type = None
         exception_message = None
-        stack_trace = None
+        stack_trace_lines = None
 
         if exc is not None:
             exception_type = type(exc).__name__
             exception_message = str(exc)
-            stack_trace = traceback.format_exception(type(exc), exc, exc.__traceback__)
-            stack_trace = "".join(stack_trace).strip()
+            if severity in _TRACED_SEVERITIES:
+                stack_trace_lines = tuple(traceback.format_exception(type(exc), exc, exc.__traceback__))
 
         entry = ErrorEntry(
             category=category,
@@ -134,8 +197,8 @@ class ErrorLog:
             details=details,
             exception_type=exception_type,
             exception_message=exception_message,
-            stack_trace=stack_trace,
         )
+        object.__setattr__(entry, "_stack_trace_lines", stack_trace_lines)
         self.errors.append(entry)
         return entry
 
@@ -153,32 +216,27 @@ class ErrorLog:
 class ErrorLogStore:
     """Persistent storage for structured error logs."""
 
-    def __init__(self, root: Path) -> None:
+    def __init__(self, root: Path, *, fsync_every: int = 32) -> None:
         self.root = ensure_dir(root)
+        self.fsync_every = fsync_every
+        self._path_cache: dict[str, Path] = {}
+        self._pending_appends: dict[str, int] = {}
 
     def load(self, book_slug: str) -> ErrorLog | None:
-        """Load an error log for a book."""
+        """Load an error log for a book, including entries appended since the last save."""
+        log = self._load_snapshot(book_slug)
+        sidecar = self._sidecar_for(book_slug)
+        if not sidecar.exists():
+            return log
+        return _merge_sidecar(log, book_slug, sidecar)
+
+    def _load_snapshot(self, book_slug: str) -> ErrorLog | None:
         path = self._path_for(book_slug)
         if not path.exists():
             return None
         try:
-            data = json.loads(path.read_text("utf-8"))
-            errors = []
-            for error_data in data.get("errors", []):
-                errors.append(
-                    ErrorEntry(
-                        category=ErrorCategory(error_data["category"]),
-                        severity=ErrorSeverity(error_data["severity"]),
-                        message=error_data["message"],
-                        timestamp=error_data["timestamp"],
-                        step=error_data.get("step"),
-                        chapter_index=error_data.get("chapter_index"),
-                        details=error_data.get("details"),
-                        exception_type=error_data.get("exception_type"),
-                        exception_message=error_data.get("exception_message"),
-                        stack_trace=error_data.get("stack_trace"),
-                    )
-                )
+            data = _json_loads(path.read_bytes())
+            errors = [ErrorEntry._from_raw(error_data) for error_data in data.get("errors", [])]
             return ErrorLog(
                 book_slug=data["book_slug"],
                 book_id=data["book_id"],
@@ -192,14 +250,64 @@ class ErrorLogStore:
     def save(self, log: ErrorLog) -> None:
         """Save an error log for a book."""
         path = self._path_for(log.book_slug)
-        tmp_path = path.with_suffix(".json.tmp")
-        tmp_path.write_text(json.dumps(log.to_dict(), indent=2, ensure_ascii=True), "utf-8")
-        tmp_path.replace(path)
+        # Entries are serialized by _entry_default as the encoder reaches them,
+        # so no parallel list of per-entry dicts is built.
+        # run_id leads the object so get_logger can read it from the file head.
+        payload = {
+            "run_id": log.run_id,
+            "book_slug": log.book_slug,
+            "book_id": log.book_id,
+            "error_count": len(log.errors),
+            "errors": log.errors,
+        }
+        atomic_write_bytes(path, _json_dumps(payload))
+        # The snapshot now holds every appended entry.
+        self._sidecar_for(log.book_slug).unlink(missing_ok=True)
+        self._pending_appends.pop(log.book_slug, None)
+
+    def append(self, log: ErrorLog, entries: Sequence[ErrorEntry]) -> None:
+        """Append entries to the book's ``.ndjson`` sidecar, one line each.
+
+        Cheaper than ``save`` for error-heavy runs: nothing already on disk is
+        rewritten. The sidecar is fsynced once ``fsync_every`` entries have
+        accumulated (never when it is 0) and folded into the snapshot by the
+        next ``save``.
+        """
+        if not entries:
+            return
+        lines = b"".join(
+            _json_dumps({"book_id": log.book_id, "run_id": log.run_id, "entry": entry}, indent=False) + b"\n"
+            for entry in entries
+        )
+        # Unbuffered: all lines go out in a single write() with no buffer copy.
+        with self._sidecar_for(log.book_slug).open("ab", buffering=0) as handle:
+            handle.write(lines)
+            pending = self._pending_appends.get(log.book_slug, 0) + len(entries)
+            if self.fsync_every and pending >= self.fsync_every:
+                os.fsync(handle.fileno())
+                pending = 0
+        self._pending_appends[log.book_slug] = pending
+
+    def _peek_run_id(self, book_slug: str) -> str | None:
+        """Read ``run_id`` from the first bytes of the snapshot, or None if unsure."""
+        try:
+            with self._path_for(book_slug).open("rb") as handle:
+                head = handle.read(_RUN_ID_HEAD_BYTES)
+        except OSError:
+            return None
+        match = _RUN_ID_HEAD_RE.search(head)
+        return match.group(1).decode("utf-8") if match else None
+
+    def _sidecar_for(self, book_slug: str) -> Path:
+        return self._path_for(book_slug).with_suffix(".ndjson")
 
     def _path_for(self, book_slug: str) -> Path:
         """Get the path to an error log file."""
-        safe_slug = slugify(book_slug)
-        return self.root / f"{safe_slug}.json"
+        path = self._path_cache.get(book_slug)
+        if path is None:
+            path = self.root / f"{slugify(book_slug)}.json"
+            self._path_cache[book_slug] = path
+        return path
 
     def get_logger(
         self,
@@ -208,9 +316,78 @@ class ErrorLogStore:
         run_id: str,
     ) -> ErrorLog:
         """Get or create an error log for a book."""
+        head_run_id = self._peek_run_id(book_slug)
+        if head_run_id is not None and head_run_id != run_id and not self._sidecar_for(book_slug).exists():
+            # A log from another run is discarded anyway; skip parsing its entries.
+            return ErrorLog(book_slug=book_slug, book_id=book_id, run_id=run_id)
+
         existing = self.load(book_slug)
         if existing is not None:
             # Only reuse if it's from the same run
             if existing.run_id == run_id:
                 return existing
         return ErrorLog(book_slug=book_slug, book_id=book_id, run_id=run_id)
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time as ``YYYY-MM-DDTHH:MM:SS+00:00`` (isoformat, seconds precision)."""
+    now = time.gmtime()
+    return "%04d-%02d-%02dT%02d:%02d:%02d+00:00" % (
+        now.tm_year,
+        now.tm_mon,
+        now.tm_mday,
+        now.tm_hour,
+        now.tm_min,
+        now.tm_sec,
+    )
+
+
+def _merge_sidecar(log: ErrorLog | None, book_slug: str, sidecar: Path) -> ErrorLog | None:
+    try:
+        lines = sidecar.read_bytes().splitlines()
+    except OSError:
+        return log
+
+    records = []
+    for line in lines:
+        try:
+            record = _json_loads(line)
+            records.append((record["book_id"], record["run_id"], ErrorEntry._from_raw(record["entry"])))
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+            # A torn final line from an interrupted append is expected; skip it.
+            continue
+    if not records:
+        return log
+
+    book_id, run_id, _ = records[-1]
+    entries = [entry for _, entry_run_id, entry in records if entry_run_id == run_id]
+    if log is not None and log.run_id == run_id:
+        log.errors.extend(entries)
+        return log
+    return ErrorLog(book_slug=book_slug, book_id=book_id, run_id=run_id, errors=entries)
+
+
+def _entry_default(obj: object) -> dict[str, Any]:
+    if type(obj) is ErrorEntry:
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(data: dict[str, Any], *, indent: bool = True) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_entry_default, option=option)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=True, default=_entry_default).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=True, default=_entry_default).encode("utf-8")
+
+
+def _json_loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    if simdjson is not None:
+        # Raises ValueError on malformed input, which callers already treat as corrupt.
+        return simdjson.loads(raw)
+    return json.loads(raw)
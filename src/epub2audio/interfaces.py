@@ -7,12 +7,20 @@ from pathlib import Path
 from typing import Iterable, Mapping, Protocol, Sequence, runtime_checkable
 
 
+@dataclass(frozen=True)
+class CoverImage:
+    """Cover art bytes and the file extension matching their media type."""
+
+    data: bytes
+    extension: str = ".jpg"
+
+
 @dataclass(frozen=True)
 class BookMetadata:
     title: str
     author: str | None = None
     language: str | None = None
-    cover_image: Path | None = None
+    cover_image: CoverImage | Path | None = None
 
 
 @dataclass(frozen=True)
@@ -22,13 +30,13 @@ class Chapter:
     text: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Segment:
     index: int
     text: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AudioChunk:
     index: int
     path: Path
@@ -84,6 +92,19 @@ class TtsEngine(Protocol):
         ...
 
 
+@runtime_checkable
+class BatchTtsEngine(TtsEngine, Protocol):
+    """A TTS engine that can synthesize several texts in one call."""
+
+    def synthesize_batch(
+        self,
+        texts: Sequence[str],
+        voice: str | None = None,
+        configs: Sequence[Mapping[str, object] | None] | None = None,
+    ) -> list[AudioChunk]:  # pragma: no cover - interface
+        ...
+
+
 @runtime_checkable
 class AudioProcessor(Protocol):
     def insert_silence(
@@ -2,16 +2,24 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 import platform
 
 
 def get_available_onnx_providers() -> list[str]:
+    return list(_available_onnx_providers())
+
+
+@lru_cache(maxsize=1)
+def _available_onnx_providers() -> tuple[str, ...]:
+    # onnxruntime probes each execution provider library when asked; the set
+    # cannot change within a process, so enumerate it once.
     try:
         import onnxruntime as ort  # type: ignore
 
-        return list(ort.get_available_providers())
+        return tuple(ort.get_available_providers())
     except Exception:
-        return []
+        return ()
 
 
 def resolve_onnx_provider_chain(
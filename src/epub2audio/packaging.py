@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from itertools import accumulate
 import logging
+import os
 from pathlib import Path
+import shutil
+import struct
 import subprocess
-import wave
 from typing import Sequence
 
 from .interfaces import BookMetadata, ChapterAudio, Packager
@@ -14,6 +17,28 @@ from .utils import ensure_dir
 
 _LOGGER = logging.getLogger(__name__)
 
+_FFMPEG_PATH = shutil.which("ffmpeg")
+_FFMPEG_MISSING_MESSAGE = "ffmpeg is required for M4B packaging but was not found in PATH."
+_WAV_HEADER_SIZE = 44
+_FFMPEG_CONCAT_INPUT = ("ffmpeg", "-hide_banner", "-nostats", "-y", "-f", "concat", "-safe", "0", "-i")
+_FFMPEG_COVER_ARGS = (
+    "-disposition:v:0",
+    "attached_pic",
+    "-metadata:s:v",
+    "title=Album cover",
+    "-metadata:s:v",
+    "comment=Cover (front)",
+)
+_METADATA_ESCAPES = str.maketrans(
+    {
+        "\\": "\\\\",
+        "\n": "\\n",
+        "=": "\\=",
+        ";": "\\;",
+        "#": "\\#",
+    }
+)
+
 
 @dataclass
 class FfmpegPackager(Packager):
@@ -57,10 +82,23 @@ def _ensure_m4b_path(out_path: Path) -> Path:
 
 
 def _validate_chapter_files(chapters: Sequence[ChapterAudio]) -> None:
+    # Chapters usually share one directory; a single scandir pass serves every
+    # lookup instead of an exists() plus stat() per chapter.
+    entries_by_dir: dict[Path, dict[str, os.DirEntry[str]]] = {}
     for chapter in chapters:
-        if not chapter.path.exists():
+        parent = chapter.path.parent
+        entries = entries_by_dir.get(parent)
+        if entries is None:
+            try:
+                with os.scandir(parent) as scan:
+                    entries = {entry.name: entry for entry in scan}
+            except OSError:
+                entries = {}
+            entries_by_dir[parent] = entries
+        entry = entries.get(chapter.path.name)
+        if entry is None:
             raise RuntimeError(f"Chapter audio missing: {chapter.path}")
-        if chapter.path.stat().st_size <= 0:
+        if entry.stat().st_size <= 0:
             raise RuntimeError(f"Chapter audio is empty: {chapter.path}")
 
 
@@ -83,18 +121,7 @@ def _build_ffmpeg_cmd(
     cover_image: Path | None,
     audio_bitrate: str,
 ) -> list[str]:
-    cmd = [
-        "ffmpeg",
-        "-hide_banner",
-        "-nostats",
-        "-y",
-        "-f",
-        "concat",
-        "-safe",
-        "0",
-        "-i",
-        str(concat_file),
-    ]
+    cmd = [*_FFMPEG_CONCAT_INPUT, str(concat_file)]
     if cover_image is not None:
         cmd.extend(["-i", str(cover_image)])
     cmd.extend(["-f", "ffmetadata", "-i", str(meta_file)])
@@ -106,26 +133,15 @@ def _build_ffmpeg_cmd(
     cmd.extend(["-map_metadata", metadata_index])
     cmd.extend(["-c:a", "aac", "-b:a", audio_bitrate])
     if cover_image is not None:
-        cmd.extend(
-            [
-                "-disposition:v:0",
-                "attached_pic",
-                "-metadata:s:v",
-                "title=Album cover",
-                "-metadata:s:v",
-                "comment=Cover (front)",
-            ]
-        )
+        cmd.extend(_FFMPEG_COVER_ARGS)
     cmd.append(str(out_path))
     return cmd
 
 
 def _write_concat_file(path: Path, chapters: Sequence[ChapterAudio]) -> None:
-    lines = []
-    for chapter in chapters:
-        escaped = _escape_concat_path(chapter.path)
-        lines.append(f"file '{escaped}'")
-    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    path.write_bytes(
+        "".join(f"file '{_escape_concat_path(chapter.path)}'\n" for chapter in chapters).encode("utf-8")
+    )
 
 
 def _write_metadata_file(path: Path, chapters: Sequence[ChapterAudio], metadata: BookMetadata) -> None:
@@ -138,56 +154,75 @@ def _write_metadata_file(path: Path, chapters: Sequence[ChapterAudio], metadata:
     lines.append("genre=Audiobook")
     lines.append("stik=2")
 
+    durations = [max(_wav_duration_ms(chapter.path), 1) for chapter in chapters]
+    ends = accumulate(durations)
     start_ms = 0
-    for chapter in chapters:
-        duration_ms = _wav_duration_ms(chapter.path)
-        if duration_ms <= 0:
-            duration_ms = 1
-        end_ms = start_ms + duration_ms
+    for chapter, end_ms in zip(chapters, ends):
         title = chapter.title or f"Chapter {chapter.index + 1}"
-        lines.extend(
-            [
-                "",
-                "[CHAPTER]",
-                "TIMEBASE=1/1000",
-                f"START={start_ms}",
-                f"END={end_ms}",
-                f"title={_escape_metadata_value(title)}",
-            ]
+        lines.append(
+            f"\n[CHAPTER]\nTIMEBASE=1/1000\nSTART={start_ms}\nEND={end_ms}\n"
+            f"title={_escape_metadata_value(title)}"
         )
         start_ms = end_ms
 
-    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    lines.append("")
+    path.write_bytes("\n".join(lines).encode("utf-8"))
 
 
 def _wav_duration_ms(path: Path) -> int:
-    with wave.open(str(path), "rb") as handle:
-        frames = handle.getnframes()
-        rate = handle.getframerate()
-    if rate <= 0:
+    """Read the duration from the RIFF header without parsing the sample data."""
+    with path.open("rb") as handle:
+        head = handle.read(_WAV_HEADER_SIZE)
+        if len(head) < 12 or head[0:4] != b"RIFF" or head[8:12] != b"WAVE":
+            raise RuntimeError(f"Not a RIFF/WAVE file: {path}")
+
+        def read_at(offset: int, size: int) -> bytes:
+            # Canonical files fit in the first 44 bytes; only extra chunks
+            # (LIST, fact, ...) before ``data`` need another read.
+            if offset + size <= len(head):
+                return head[offset : offset + size]
+            handle.seek(offset)
+            return handle.read(size)
+
+        rate = block_align = 0
+        offset = 12
+        while True:
+            chunk_header = read_at(offset, 8)
+            if len(chunk_header) < 8:
+                raise RuntimeError(f"WAV data chunk missing: {path}")
+            chunk_id = chunk_header[:4]
+            (chunk_size,) = struct.unpack_from("<I", chunk_header, 4)
+            if chunk_id == b"data":
+                break
+            if chunk_id == b"fmt ":
+                rate, _, block_align = struct.unpack("<IIH", read_at(offset + 12, 10))
+            offset += 8 + chunk_size + (chunk_size & 1)
+    if rate <= 0 or block_align <= 0:
         return 0
+    frames = chunk_size // block_align
     return int(round((frames / rate) * 1000))
 
 
 def _escape_metadata_value(value: str) -> str:
-    escaped = value.replace("\\", "\\\\")
-    escaped = escaped.replace("\n", "\\n")
-    escaped = escaped.replace("=", "\\=")
-    escaped = escaped.replace(";", "\\;")
-    escaped = escaped.replace("#", "\\#")
-    return escaped
+    return value.translate(_METADATA_ESCAPES)
 
 
 def _escape_concat_path(path: Path) -> str:
     raw = str(path)
+    if "'" not in raw:
+        return raw
     return raw.replace("'", "'\\''")
 
 
 def _run_ffmpeg(cmd: list[str], logger: logging.Logger) -> None:
+    if cmd[0] == "ffmpeg":
+        if _FFMPEG_PATH is None:
+            raise RuntimeError(_FFMPEG_MISSING_MESSAGE)
+        cmd = [_FFMPEG_PATH, *cmd[1:]]
     try:
         result = subprocess.run(cmd, check=False, capture_output=True, text=True)
     except FileNotFoundError as exc:
-        raise RuntimeError("ffmpeg is required for M4B packaging but was not found in PATH.") from exc
+        raise RuntimeError(_FFMPEG_MISSING_MESSAGE) from exc
 
     if result.returncode != 0:
         stderr = (result.stderr or "").strip()
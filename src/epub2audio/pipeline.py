@@ -4,9 +4,11 @@ from __future__ import annotations
 
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
 from dataclasses import dataclass
+import hashlib
 import logging
 import os
 from pathlib import Path
+import tempfile
 import threading
 import time
 from typing import TYPE_CHECKING, Iterable, Sequence
@@ -16,14 +18,14 @@ from .audio_processing import FfmpegAudioProcessor, LoudnessConfig
 from .config import Config
 from .epub_reader import EbooklibEpubReader
 from .error_log import ErrorCategory, ErrorEntry, ErrorLogStore, ErrorSeverity
-from .interfaces import AudioChunk, Chapter, ChapterAudio, EpubBook, PipelineState, TtsEngine
+from .interfaces import AudioChunk, Chapter, ChapterAudio, CoverImage, EpubBook, Packager, PipelineState, TtsEngine
 from .logging_setup import LoggingContext
 from .packaging import FfmpegPackager
 from .text_cleaner import BasicTextCleaner
 from .text_segmenter import BasicTextSegmenter
 from .tts_engine import TtsError
 from .tts_factory import build_tts_engine
-from .tts_pipeline import TtsSynthesisSettings, synthesize_text
+from .tts_pipeline import TtsSynthesisSettings, clear_audio_memory_cache, clear_split_cache, synthesize_text
 from .state_store import JsonStateStore
 from .utils import ensure_dir, slugify
 
@@ -165,8 +167,9 @@ def run_pipeline(
             true_peak=config.audio.true_peak,
         ),
     )
-    packager = FfmpegPackager(work_dir=ensure_dir(config.paths.cache / "packaging"))
-    state_store = JsonStateStore(ensure_dir(config.paths.cache / "state"))
+    packager = _build_packager(config)
+    state_dir = ensure_dir(config.paths.cache / "state")
+    state_store = JsonStateStore(state_dir)
 
     sources = _expand_inputs(inputs)
     for source in sources:
@@ -190,6 +193,26 @@ def run_pipeline(
                 progress.print_book_missing(source)
             continue
 
+        slug_index_path = _slug_index_path(state_dir, source)
+        packaged_output = _packaged_output_for(slug_index_path, source, state_store, config.paths.out)
+        if packaged_output is not None:
+            # Unchanged source with its M4B still in place: skip without parsing the EPUB.
+            packaged_slug, out_path = packaged_output
+            message = f"Already packaged: {out_path}"
+            log_ctx.get_book_logger(packaged_slug).info(message)
+            results.append(
+                BookResult(
+                    source=source,
+                    book_slug=packaged_slug,
+                    status="skipped",
+                    message=message,
+                    output_path=out_path,
+                )
+            )
+            if progress:
+                progress.print_book_skipped(packaged_slug, packaged_slug, out_path)
+            continue
+
         try:
             book = reader.read(source)
         except Exception as exc:
@@ -221,9 +244,10 @@ def run_pipeline(
                 message = f"Already packaged: {out_path}"
                 state = _state_with(
                     state,
-                    artifacts={"output_m4b": str(out_path)},
+                    artifacts={"output_m4b": str(out_path), "source_fingerprint": _source_fingerprint(source)},
                 )
                 _save_state(state_store, state, book_logger)
+                _write_slug_index(slug_index_path, book_slug, book_logger)
                 results.append(
                     BookResult(
                         source=source,
@@ -235,7 +259,6 @@ def run_pipeline(
                 )
                 if progress:
                     progress.print_book_skipped(book_slug, book.metadata.title or book_slug, out_path)
-                _cleanup_cover_image(book.metadata.cover_image, book_logger)
                 continue
             book_logger.info("State marked packaged but output missing; reprocessing.")
             state = _state_with(state, steps={"packaged": False})
@@ -260,6 +283,7 @@ def run_pipeline(
                 book_logger,
                 error_log,
                 progress,
+                error_log_store=log_ctx.error_log_store,
             )
         except Exception as exc:
             message = f"Failed during audio pipeline: {exc}"
@@ -280,6 +304,11 @@ def run_pipeline(
             if progress:
                 progress.print_book_failed(book_slug, book.metadata.title or book_slug, message)
             continue
+        finally:
+            clear_split_cache()
+            # Memory hits skip the stat on the chunk WAV; don't trust them once
+            # the book is done, in case the cache directory is pruned later.
+            clear_audio_memory_cache()
 
         ok_count = sum(1 for r in chapter_results if r.status == "ok")
         empty_count = sum(1 for r in chapter_results if r.status == "empty")
@@ -298,17 +327,17 @@ def run_pipeline(
             results.append(BookResult(source=source, book_slug=book_slug, status="ok", message=message))
             if progress:
                 progress.print_book_complete(book_slug, book.metadata.title or book_slug)
-            _cleanup_cover_image(book.metadata.cover_image, book_logger)
             continue
 
         out_path = _resolve_output_path(config.paths.out, book_slug)
+        cover_path = _materialize_cover_image(book.metadata.cover_image, book_logger)
         try:
             _validate_output_path(out_path, config.paths.out, book_slug)
             packaged = packager.package(
                 chapter_audio,
                 book.metadata,
                 out_path,
-                cover_image=book.metadata.cover_image,
+                cover_image=cover_path,
             )
         except Exception as exc:
             fail_message = f"{message} Packaging failed: {exc}"
@@ -327,23 +356,28 @@ def run_pipeline(
             _save_state(state_store, state, book_logger)
             if progress:
                 progress.print_book_failed(book_slug, book.metadata.title or book_slug, fail_message)
-            _cleanup_cover_image(book.metadata.cover_image, book_logger)
+            _cleanup_cover_image(cover_path, book_logger)
             continue
 
         final_message = f"{message} Packaged: {packaged}"
         state = _state_with(
             state,
             steps={"packaged": True},
-            artifacts={"output_m4b": str(packaged), "last_error": ""},
+            artifacts={
+                "output_m4b": str(packaged),
+                "last_error": "",
+                "source_fingerprint": _source_fingerprint(source),
+            },
         )
         _save_state(state_store, state, book_logger)
+        _write_slug_index(slug_index_path, book_slug, book_logger)
         log_ctx.error_log_store.save(error_log)
         results.append(
             BookResult(source=source, book_slug=book_slug, status="ok", message=final_message, output_path=packaged)
         )
         if progress:
             progress.print_book_complete(book_slug, book.metadata.title or book_slug)
-        _cleanup_cover_image(book.metadata.cover_image, book_logger)
+        _cleanup_cover_image(cover_path, book_logger)
 
     return results
 
@@ -373,6 +407,10 @@ def _build_engine(config: Config) -> TtsEngine:
     return build_tts_engine(config, ensure_dir(config.paths.cache / "tts"))
 
 
+def _build_packager(config: Config) -> Packager:
+    return FfmpegPackager(work_dir=ensure_dir(config.paths.cache / "packaging"))
+
+
 def _build_settings(config: Config) -> TtsSynthesisSettings:
     ref_audio_id = _ref_audio_cache_id(config.tts.ref_audio)
     return TtsSynthesisSettings(
@@ -390,9 +428,26 @@ def _build_settings(config: Config) -> TtsSynthesisSettings:
         ref_audio=config.tts.ref_audio,
         ref_text=config.tts.ref_text,
         ref_audio_id=ref_audio_id,
+        max_concurrent=_resolve_max_concurrent(config),
+        batch_size=config.tts.batch_size,
     )
 
 
+def _resolve_max_concurrent(config: Config) -> int:
+    """Chunks synthesized ahead of the consumer within one chapter.
+
+    Both bundled engines run a local model, so ``auto`` keeps synthesis
+    serial; MLX shares a single Metal device and stays at 1 unless the user
+    opted into unsafe MLX parallelism.
+    """
+    configured = config.tts.max_concurrent
+    if configured is None:
+        return 1
+    if config.tts.engine == "mlx" and not config.tts.unsafe_mlx_parallelism:
+        return 1
+    return max(1, int(configured))
+
+
 def _ref_audio_cache_id(ref_audio: Path | None) -> str | None:
     if ref_audio is None:
         return None
@@ -468,11 +523,25 @@ def _process_book(
     logger: logging.Logger,
     error_log: ErrorLogStore,
     progress: "ProgressDisplay | None" = None,
+    *,
+    error_log_store: ErrorLogStore | None = None,
 ) -> list[ChapterResult]:
     cache.ensure_chapter_dir(book_slug)
     chapter_results: list[ChapterResult] = []
     total_chapters = len(book.chapters)
     workers = _resolve_chapter_workers(config, total_chapters, logger)
+    appended = len(error_log.errors)
+
+    def _append_new_errors() -> None:
+        # Entries logged by finished chapters go to the sidecar so they survive
+        # a crash before the book's final save.
+        nonlocal appended
+        if error_log_store is None:
+            return
+        entries = error_log.errors[appended:]
+        error_log_store.append(error_log, entries)
+        appended += len(entries)
+
     if workers <= 1:
         for chapter in book.chapters:
             # Emit chapter progress
@@ -498,6 +567,7 @@ def _process_book(
                     error_log,
                 )
             )
+            _append_new_errors()
         return chapter_results
 
     use_processes = config.tts.chapter_parallelism == "process"
@@ -610,6 +680,7 @@ def _process_book(
                             exc=exc,
                         )
                         result = ChapterResult(chapter_index=chapter.index, status="failed", output_paths=())
+                    _append_new_errors()
                     chapter_results.append(result)
                     completed += 1
                     if progress:
@@ -660,6 +731,58 @@ def _collect_chapter_audio(
     return chapters
 
 
+def _slug_index_path(state_dir: Path, source: Path) -> Path:
+    source_id = hashlib.blake2b(str(source.resolve()).encode("utf-8"), digest_size=8).hexdigest()
+    return state_dir / f"{slugify(source.stem)}-{source_id}.slug"
+
+
+def _source_fingerprint(source: Path) -> str:
+    stat = source.stat()
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _packaged_output_for(
+    slug_index_path: Path,
+    source: Path,
+    state_store: JsonStateStore,
+    out_root: Path,
+) -> tuple[str, Path] | None:
+    """Return ``(book_slug, m4b_path)`` if ``source`` is unchanged since it was packaged.
+
+    State is keyed by the title slug, which is only known after parsing the
+    EPUB, so a small per-source index file remembers the slug. The decision
+    itself rests on that book's state: it must still be marked packaged, carry
+    the current size/mtime fingerprint, and point at the M4B the current
+    ``paths.out`` would produce.
+    """
+    try:
+        book_slug = slug_index_path.read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    if not book_slug:
+        return None
+    try:
+        state = state_store.load(book_slug)
+    except Exception:
+        return None
+    if state is None or not state.steps.get("packaged"):
+        return None
+    artifacts = state.artifacts or {}
+    if artifacts.get("source_fingerprint") != _source_fingerprint(source):
+        return None
+    out_path = _resolve_output_path(out_root, book_slug)
+    if artifacts.get("output_m4b") != str(out_path) or not out_path.is_file():
+        return None
+    return book_slug, out_path
+
+
+def _write_slug_index(slug_index_path: Path, book_slug: str, logger: logging.Logger) -> None:
+    try:
+        slug_index_path.write_text(f"{book_slug}\n", encoding="utf-8")
+    except OSError as exc:
+        logger.warning("Failed to record source slug index: %s", exc)
+
+
 def _resolve_output_path(out_root: Path, book_slug: str) -> Path:
     return out_root / book_slug / f"{book_slug}.m4b"
 
@@ -673,6 +796,19 @@ def _validate_output_path(out_path: Path, out_root: Path, book_slug: str) -> Non
         raise RuntimeError(f"Output filename must be {expected_name} (got {out_path.name}).")
 
 
+def _materialize_cover_image(cover_image: CoverImage | Path | None, logger: logging.Logger) -> Path | None:
+    """Return a file path for the cover, writing in-memory cover bytes to a temp file."""
+    if not isinstance(cover_image, CoverImage):
+        return cover_image
+    try:
+        with tempfile.NamedTemporaryFile(suffix=cover_image.extension, delete=False, prefix="epub_cover_") as tmp_file:
+            tmp_file.write(cover_image.data)
+    except OSError as exc:
+        logger.warning("Failed to write cover image: %s (skipping cover embed).", exc)
+        return None
+    return Path(tmp_file.name)
+
+
 def _cleanup_cover_image(cover_image: Path | None, logger: logging.Logger) -> None:
     if cover_image is None:
         return
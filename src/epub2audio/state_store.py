@@ -3,25 +3,35 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import lru_cache
 import json
 from pathlib import Path
 from typing import Any, Mapping
 
 from .interfaces import PipelineState, StateStore
-from .utils import ensure_dir, slugify
+from .utils import atomic_write_bytes, ensure_dir, slugify
+
+try:  # pragma: no cover - optional speedup, exercised when orjson is installed
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json fallback
+    orjson = None
+
+_UTC = timezone.utc
 
 
 class JsonStateStore(StateStore):
     def __init__(self, root: Path) -> None:
         self.root = ensure_dir(root)
+        # Last steps/artifacts written per book; re-saving identical state is a no-op.
+        self._last_saved: dict[str, tuple[dict[str, bool], dict[str, str | None]]] = {}
 
     def load(self, book_id: str) -> PipelineState | None:
         path = self._path_for(book_id)
         if not path.exists():
             return None
         try:
-            payload = json.loads(path.read_text("utf-8"))
-        except (OSError, json.JSONDecodeError) as exc:
+            payload = _json_loads(path.read_bytes())
+        except (OSError, ValueError) as exc:
             raise RuntimeError(f"Failed to read state file {path}: {exc}") from exc
         steps = _coerce_steps(payload.get("steps"))
         artifacts = _coerce_artifacts(payload.get("artifacts"))
@@ -29,39 +39,63 @@ class JsonStateStore(StateStore):
 
     def save(self, state: PipelineState) -> None:
         path = self._path_for(state.book_id)
+        # The payload's steps/artifacts are already fresh dict copies; reuse
+        # them as the snapshot rather than copying the state a second time.
         payload = _serialize_state(state)
-        tmp_path = path.with_suffix(".json.tmp")
-        tmp_path.write_text(json.dumps(payload, indent=2, ensure_ascii=True), "utf-8")
-        tmp_path.replace(path)
+        snapshot = (payload["steps"], payload["artifacts"])
+        if self._last_saved.get(state.book_id) == snapshot and path.exists():
+            return
+        atomic_write_bytes(path, _json_dumps(payload))
+        self._last_saved[state.book_id] = snapshot
 
     def _path_for(self, book_id: str) -> Path:
-        return self.root / f"{slugify(book_id)}.json"
+        return self.root / f"{_slug_cached(book_id)}.json"
+
+
+@lru_cache(maxsize=1024)
+def _slug_cached(book_id: str) -> str:
+    return slugify(book_id)
 
 
 def _serialize_state(state: PipelineState) -> Mapping[str, Any]:
     payload = {
         "version": 1,
         "book_id": state.book_id,
-        "updated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "updated_at": datetime.now(_UTC).isoformat(timespec="seconds"),
         "steps": dict(state.steps),
         "artifacts": dict(state.artifacts or {}),
     }
     return payload
 
 
+def _json_dumps(payload: Mapping[str, Any]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload)
+        except orjson.JSONEncodeError:
+            # Surrogate-escaped paths are not valid UTF-8; the stdlib escapes them.
+            pass
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=True).encode("ascii")
+
+
+def _json_loads(raw: bytes) -> Any:
+    # orjson.JSONDecodeError and json.JSONDecodeError are both ValueErrors.
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects escaped lone surrogates that the stdlib writes and reads.
+            pass
+    return json.loads(raw)
+
+
 def _coerce_steps(raw: object) -> dict[str, bool]:
     if not isinstance(raw, dict):
         return {}
-    steps: dict[str, bool] = {}
-    for key, value in raw.items():
-        steps[str(key)] = bool(value)
-    return steps
+    return {str(key): bool(value) for key, value in raw.items()}
 
 
 def _coerce_artifacts(raw: object) -> dict[str, str]:
     if not isinstance(raw, dict):
         return {}
-    artifacts: dict[str, str | None] = {}
-    for key, value in raw.items():
-        artifacts[str(key)] = value if value is None else str(value)
-    return artifacts
+    return {str(key): value if value is None else str(value) for key, value in raw.items()}
@@ -9,20 +9,24 @@ from typing import Final
 
 _LOGGER = logging.getLogger(__name__)
 
-# Control characters to remove (excluding newline \n and tab \t)
-_CONTROL_CHARS_PATTERN: Final = re.compile(
-    r"[\x00-\x08\x0b\x0c\x0d\x0e-\x1f\x7f-\x9f]"
-)
+# Control characters dropped from the text (everything below 0x20 and in
+# 0x7f-0x9f except newline \n and tab \t). They are treated exactly like
+# spaces, so they are folded into the whitespace patterns below instead of
+# being replaced in a pass of their own.
+_CONTROL_CHARS: Final = r"\x00-\x08\x0b\x0c\x0d\x0e-\x1f\x7f-\x9f"
 
 # Citation pattern: [1], [Chapter X], [Note 123], etc.
 # Matches brackets containing at least one digit
 _CITATION_PATTERN: Final = re.compile(r"\[[^\]]*\d[^\]]*\]")
 
-# Multiple whitespace pattern (spaces, tabs)
-_WHITESPACE_PATTERN: Final = re.compile(r"[ \t]+")
+# Runs of spaces, tabs and control characters
+_WHITESPACE_PATTERN: Final = re.compile(rf"[ \t{_CONTROL_CHARS}]+")
 
-# Multiple newlines pattern (2+ newlines with possible spaces/tabs between)
-_MULTIPLE_NEWLINE_PATTERN: Final = re.compile(r"\n[ \t]*\n+")
+# Runs of any whitespace or control characters, newlines included
+_WHITESPACE_AND_NEWLINE_PATTERN: Final = re.compile(rf"[ \t\n{_CONTROL_CHARS}]+")
+
+# Multiple newlines pattern (2+ newlines with possible spaces/tabs/control characters between)
+_MULTIPLE_NEWLINE_PATTERN: Final = re.compile(rf"\n[ \t{_CONTROL_CHARS}]*\n+")
 
 
 class BasicTextCleaner:
@@ -74,28 +78,25 @@ class BasicTextCleaner:
             return ""
 
         # 1. Unicode normalization
-        if self.normalize_unicode:
+        # Most EPUB text is already NFC; the quick check avoids rebuilding it.
+        if self.normalize_unicode and not unicodedata.is_normalized("NFC", text):
             text = unicodedata.normalize("NFC", text)
 
-        # 2. Remove control characters (except newline and tab)
-        text = _CONTROL_CHARS_PATTERN.sub(" ", text)
-
-        # 3. Remove citations if enabled
+        # 2. Remove citations if enabled
         if self.remove_citations:
             text = _CITATION_PATTERN.sub("", text)
 
-        # 4. Normalize whitespace and newlines
+        # 3. Normalize whitespace, newlines and control characters
         if self.preserve_paragraph_breaks:
             # Collapse multiple newlines to single newline (preserving paragraphs)
             text = _MULTIPLE_NEWLINE_PATTERN.sub("\n\n", text)
+            # Collapse multiple spaces/tabs/control characters to single space
+            text = _WHITESPACE_PATTERN.sub(" ", text)
         else:
-            # Convert all newlines to spaces
-            text = text.replace("\n", " ")
-
-        # Collapse multiple spaces/tabs to single space
-        text = _WHITESPACE_PATTERN.sub(" ", text)
+            # Newlines become spaces along with everything else
+            text = _WHITESPACE_AND_NEWLINE_PATTERN.sub(" ", text)
 
-        # 5. Strip leading/trailing whitespace
+        # 4. Strip leading/trailing whitespace
         text = text.strip()
 
         return text
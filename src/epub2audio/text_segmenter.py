@@ -4,17 +4,17 @@ from __future__ import annotations
 
 import logging
 import re
-from dataclasses import dataclass
-from typing import Iterable
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator
 
 from .interfaces import Segment
 
 _LOGGER = logging.getLogger(__name__)
 
 _PARAGRAPH_SPLIT_RE = re.compile(r"\n{2,}")
-_WHITESPACE_RE = re.compile(r"\s+")
-_SENTENCE_END_RE = re.compile(r"([.!?]+[\"')\]]*)")
-_TERMINAL_PUNCT_RE = re.compile(r"[.!?;:]+[\"')\]]*$")
+_SENTENCE_END_RE = re.compile(r"[.!?]+[\"')\]]*")
+_TERMINAL_PUNCT = (".", "!", "?", ";", ":")
+_CLOSING_CHARS = "\"')]"
 
 
 @dataclass(frozen=True)
@@ -31,6 +31,10 @@ class BasicTextSegmenter:
     min_chars: int = 200
     hard_max_chars: int | None = None
     ensure_terminal_punctuation: bool = True
+    # Derived limits, computed once in __post_init__.
+    _hard_max: int = field(init=False, repr=False, compare=False)
+    _max_limit: int = field(init=False, repr=False, compare=False)
+    _hard_limit: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if self.max_chars <= 0:
@@ -42,79 +46,91 @@ class BasicTextSegmenter:
         if self.ensure_terminal_punctuation and self.max_chars < 2:
             raise ValueError("max_chars must be at least 2 when ensure_terminal_punctuation is True")
 
-    @property
-    def _hard_max(self) -> int:
         if self.hard_max_chars is None:
-            return int(self.max_chars * 1.25)
-        return max(self.max_chars, self.hard_max_chars)
-
-    @property
-    def _max_limit(self) -> int:
-        if not self.ensure_terminal_punctuation:
-            return self.max_chars
-        return max(1, self.max_chars - 1)
-
-    @property
-    def _hard_limit(self) -> int:
-        if not self.ensure_terminal_punctuation:
-            return self._hard_max
-        return max(1, self._hard_max - 1)
+            hard_max = int(self.max_chars * 1.25)
+        else:
+            hard_max = max(self.max_chars, self.hard_max_chars)
+        if self.ensure_terminal_punctuation:
+            # Reserve one character for the period appended on flush.
+            max_limit = max(1, self.max_chars - 1)
+            hard_limit = max(1, hard_max - 1)
+        else:
+            max_limit = self.max_chars
+            hard_limit = hard_max
+        object.__setattr__(self, "_hard_max", hard_max)
+        object.__setattr__(self, "_max_limit", max_limit)
+        object.__setattr__(self, "_hard_limit", hard_limit)
 
     def segment(self, text: str) -> Iterable[Segment]:
         if not text:
             return []
 
         paragraphs = self._split_paragraphs(text)
+        if len(paragraphs) == 1 and len(paragraphs[0]) <= self._max_limit:
+            # Short text: if the sentences still fit once joined, packing
+            # could never flush early, so they form exactly one chunk.
+            chunk = " ".join(_split_sentences(paragraphs[0]))
+            if len(chunk) <= self._max_limit:
+                if self.ensure_terminal_punctuation:
+                    chunk = _ensure_terminal_punctuation(chunk)
+                return [Segment(index=0, text=chunk)]
+
         segments: list[Segment] = []
-        current = ""
+        # The open chunk is kept as its pieces plus the joined length, so
+        # packing a sentence is integer arithmetic and the string is built
+        # once per chunk in flush() rather than once per appended piece.
+        parts: list[str] = []
+        current_len = 0
         index = 0
+        max_limit = self._max_limit
+        hard_limit = self._hard_limit
+        min_chars = self.min_chars
+        ensure_terminal = self.ensure_terminal_punctuation
 
         def flush() -> None:
-            nonlocal current, index
-            chunk = current.strip()
+            nonlocal current_len, index
+            chunk = " ".join(parts)
+            parts.clear()
+            current_len = 0
             if not chunk:
-                current = ""
                 return
-            if self.ensure_terminal_punctuation:
+            if ensure_terminal:
                 chunk = _ensure_terminal_punctuation(chunk)
             segments.append(Segment(index=index, text=chunk))
             index += 1
-            current = ""
 
         def append_piece(piece: str) -> None:
-            nonlocal current
+            nonlocal current_len
             piece = piece.strip()
             if not piece:
                 return
-            if not current:
-                current = piece
-                return
-
-            candidate = f"{current} {piece}"
-            if len(candidate) <= self._max_limit:
-                current = candidate
+            if not parts:
+                parts.append(piece)
+                current_len = len(piece)
                 return
 
-            if len(current) < self.min_chars and len(candidate) <= self._hard_limit:
-                current = candidate
+            candidate_len = current_len + 1 + len(piece)
+            if candidate_len > max_limit and not (current_len < min_chars and candidate_len <= hard_limit):
+                flush()
+                parts.append(piece)
+                current_len = len(piece)
                 return
 
-            flush()
-            current = piece
+            parts.append(piece)
+            current_len = candidate_len
 
         for paragraph in paragraphs:
-            sentences = _split_sentences(paragraph)
-            for sentence in sentences:
-                if len(sentence) > self._hard_limit:
+            for sentence in _split_sentences(paragraph):
+                if len(sentence) > hard_limit:
                     for piece in self._split_long_sentence(sentence):
                         append_piece(piece)
                     continue
                 append_piece(sentence)
 
-            if current and len(current) >= self.min_chars:
+            if parts and current_len >= min_chars:
                 flush()
 
-        if current:
+        if parts:
             flush()
 
         _LOGGER.debug("Segmented text into %d chunk(s)", len(segments))
@@ -125,27 +141,33 @@ class BasicTextSegmenter:
         if not words:
             return []
 
+        hard_limit = self._hard_limit
         pieces: list[str] = []
-        current = ""
+        current: list[str] = []
+        current_len = 0
         for word in words:
             if not current:
-                current = word
+                current.append(word)
+                current_len = len(word)
                 continue
 
-            candidate = f"{current} {word}"
-            if len(candidate) <= self._hard_limit:
-                current = candidate
+            candidate_len = current_len + 1 + len(word)
+            if candidate_len <= hard_limit:
+                current.append(word)
+                current_len = candidate_len
                 continue
 
-            pieces.append(current)
-            current = word
+            pieces.append(" ".join(current))
+            current = [word]
+            current_len = len(word)
 
-            if len(word) > self._hard_limit:
+            if len(word) > hard_limit:
                 pieces.extend(self._split_long_word(word))
-                current = ""
+                current = []
+                current_len = 0
 
         if current:
-            pieces.append(current)
+            pieces.append(" ".join(current))
 
         return pieces
 
@@ -158,34 +180,31 @@ class BasicTextSegmenter:
         paragraphs = _PARAGRAPH_SPLIT_RE.split(text)
         cleaned: list[str] = []
         for paragraph in paragraphs:
-            paragraph = _WHITESPACE_RE.sub(" ", paragraph.strip())
+            # str.split() breaks on exactly the characters \s matches, and
+            # drops leading/trailing runs, in one C pass.
+            paragraph = " ".join(paragraph.split())
             if paragraph:
                 cleaned.append(paragraph)
         return cleaned
 
 
-def _split_sentences(text: str) -> list[str]:
-    parts = _SENTENCE_END_RE.split(text)
-    sentences: list[str] = []
-    buffer = ""
-    for part in parts:
-        if not part:
-            continue
-        if _SENTENCE_END_RE.fullmatch(part):
-            buffer += part
-            sentence = buffer.strip()
-            if sentence:
-                sentences.append(sentence)
-            buffer = ""
-        else:
-            buffer += part
+def _split_sentences(text: str) -> Iterator[str]:
+    # Slice sentences straight out of the paragraph from match spans rather
+    # than materializing every re.split part and re-concatenating them.
+    start = 0
+    for match in _SENTENCE_END_RE.finditer(text):
+        end = match.end()
+        sentence = text[start:end].strip()
+        if sentence:
+            yield sentence
+        start = end
 
-    if buffer.strip():
-        sentences.append(buffer.strip())
-    return sentences
+    tail = text[start:].strip()
+    if tail:
+        yield tail
 
 
 def _ensure_terminal_punctuation(text: str) -> str:
-    if _TERMINAL_PUNCT_RE.search(text):
+    if text.rstrip(_CLOSING_CHARS).endswith(_TERMINAL_PUNCT):
         return text
     return f"{text}."
@@ -0,0 +1,81 @@
+"""In-memory LRU tier in front of the on-disk chunk cache."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+import threading
+from typing import Callable
+
+from .interfaces import AudioChunk
+
+DEFAULT_CAPACITY = 4096
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    size: int
+    capacity: int
+
+
+class PhonemeAudioCache:
+    """Remember synthesized chunks by their content-addressed cache path.
+
+    Chunk paths from :class:`~epub2audio.audio_cache.AudioCacheLayout` already
+    hash model, voice, speed, language and text, so the path is the key and the
+    WAV on disk is the durable tier. A memory hit skips the engine call and
+    the per-chunk stat/WAV header read; recurring phrases such as chapter
+    headings resolve without touching disk.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self.capacity = max(0, int(capacity))
+        self._entries: OrderedDict[Path, int | None] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_compute(self, path: Path, compute_fn: Callable[[], AudioChunk]) -> AudioChunk:
+        chunk = self.get(path)
+        if chunk is not None:
+            return chunk
+        chunk = compute_fn()
+        self.put(path, chunk)
+        return chunk
+
+    def get(self, path: Path) -> AudioChunk | None:
+        with self._lock:
+            if path not in self._entries:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(path)
+            self._hits += 1
+            return AudioChunk(index=0, path=path, duration_ms=self._entries[path])
+
+    def put(self, path: Path, chunk: AudioChunk) -> None:
+        """Remember ``chunk`` if the engine wrote it to the requested cache path."""
+        if not self.capacity or chunk.path != path:
+            return
+        with self._lock:
+            self._entries[path] = chunk.duration_ms
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._entries),
+                capacity=self.capacity,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
@@ -17,6 +17,9 @@ _LOGGER = logging.getLogger(__name__)
 
 _MISTRAL_TOKENIZER_PATCHED = False
 
+# Any letter or digit; search() stops at the first one.
+_HAS_WORD_CHAR_RE = re.compile(r"[^\W_]")
+
 
 def _patch_mistral_tokenizer() -> None:
     """Patch Hugging Face tokenizer to fix Mistral regex pattern.
@@ -407,12 +410,7 @@ def _chunk_id(
 
 
 def _is_speakable_text(text: str) -> bool:
-    stripped = text.strip()
-    if not stripped:
-        return False
-    if re.fullmatch(r"[\W_]+", stripped):
-        return False
-    return True
+    return _HAS_WORD_CHAR_RE.search(text) is not None
 
 
 def _coerce_optional_str(value: object) -> str | None:
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+from contextlib import nullcontext
 from dataclasses import dataclass, field
+from functools import lru_cache
 import inspect
 import logging
 from pathlib import Path
 import re
-from typing import Mapping
+import threading
+from typing import Mapping, Sequence
 import wave
 
 from .audio_cache import chunk_cache_key
@@ -16,8 +19,21 @@ from .onnx_provider import resolve_onnx_provider_chain
 from .tts_engine import TtsInputError, TtsModelError, TtsSizeError, TtsTransientError
 from .utils import ensure_dir
 
+try:  # pragma: no cover - numpy ships with kokoro-onnx; exercised when installed
+    import numpy as np
+except ImportError:  # pragma: no cover - pure-Python PCM conversion fallback
+    np = None
+
 _LOGGER = logging.getLogger(__name__)
 
+# Loaded kokoro-onnx runtimes keyed by (class, model path, voices path, providers).
+_RUNTIMES: dict[tuple[object, str, str, tuple[str, ...]], tuple[object, threading.Lock]] = {}
+_RUNTIMES_LOCK = threading.Lock()
+
+# Any letter or digit; search() stops at the first one.
+_HAS_WORD_CHAR_RE = re.compile(r"[^\W_]")
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
 
 @dataclass
 class KokoroOnnxTtsEngine(TtsEngine):
@@ -33,11 +49,15 @@ class KokoroOnnxTtsEngine(TtsEngine):
     execution_provider: str = "auto"
     onnx_model_file: str = "model_q8f16.onnx"
     onnx_voices_file: str = "voices-v1.0.bin"
+    # Opt-in: reuse one process-wide runtime (and its call lock) instead of
+    # loading a private one, trading chapter-level parallelism for memory.
+    share_runtime: bool = False
 
     _kokoro: object | None = field(default=None, init=False, repr=False)
     _provider_chain: tuple[str, ...] = field(default=tuple(), init=False, repr=False)
     _model_path: Path | None = field(default=None, init=False, repr=False)
     _voices_path: Path | None = field(default=None, init=False, repr=False)
+    _runtime_lock: threading.Lock | None = field(default=None, init=False, repr=False)
 
     def ensure_loaded(self) -> None:
         if self._kokoro is not None:
@@ -78,12 +98,20 @@ class KokoroOnnxTtsEngine(TtsEngine):
             ) from exc
 
         try:
-            self._kokoro = _build_kokoro_runtime(
-                Kokoro,
-                model_path=self._model_path,
-                voices_path=self._voices_path,
-                providers=providers,
-            )
+            if self.share_runtime:
+                self._kokoro, self._runtime_lock = _shared_kokoro_runtime(
+                    Kokoro,
+                    model_path=self._model_path,
+                    voices_path=self._voices_path,
+                    providers=providers,
+                )
+            else:
+                self._kokoro = _build_kokoro_runtime(
+                    Kokoro,
+                    model_path=self._model_path,
+                    voices_path=self._voices_path,
+                    providers=providers,
+                )
             _LOGGER.info(
                 "Loaded Kokoro ONNX model %s (%s).",
                 self.model_id,
@@ -110,6 +138,34 @@ class KokoroOnnxTtsEngine(TtsEngine):
         voice: str | None = None,
         config: Mapping[str, object] | None = None,
     ) -> AudioChunk:
+        return self._render(self._prepare_request(text, voice, config))
+
+    def synthesize_batch(
+        self,
+        texts: Sequence[str],
+        voice: str | None = None,
+        configs: Sequence[Mapping[str, object] | None] | None = None,
+    ) -> list[AudioChunk]:
+        """Synthesize several texts against one loaded runtime.
+
+        kokoro-onnx only exposes a single-utterance ``create()``, so the texts
+        are still rendered one at a time. The batch validates every input
+        before any audio is generated, resolves the runtime once, and returns
+        cached chunks without touching it.
+        """
+        if configs is None:
+            configs = [None] * len(texts)
+        if len(configs) != len(texts):
+            raise TtsInputError(f"Got {len(configs)} config(s) for {len(texts)} text(s).")
+        requests = [self._prepare_request(text, voice, config) for text, config in zip(texts, configs)]
+        return [self._render(request) for request in requests]
+
+    def _prepare_request(
+        self,
+        text: str,
+        voice: str | None,
+        config: Mapping[str, object] | None,
+    ) -> _KokoroRequest:
         text = text or ""
         if not _is_speakable_text(text):
             raise TtsInputError("Input text is empty or contains no speakable content.")
@@ -130,7 +186,6 @@ class KokoroOnnxTtsEngine(TtsEngine):
         sample_rate = _coerce_int(cfg.get("sample_rate"), self.sample_rate)
         channels = _coerce_int(cfg.get("channels"), self.channels)
 
-        ensure_dir(self.output_dir)
         output_path = cfg.get("output_path")
         if output_path is None:
             chunk_id = chunk_cache_key(
@@ -148,22 +203,37 @@ class KokoroOnnxTtsEngine(TtsEngine):
         else:
             output_path = Path(str(output_path))
 
+        return _KokoroRequest(
+            text=text,
+            output_path=output_path,
+            voice=resolved_voice,
+            lang_code=resolved_lang,
+            speed=resolved_speed,
+            sample_rate=sample_rate,
+            channels=channels,
+        )
+
+    def _render(self, request: _KokoroRequest) -> AudioChunk:
+        ensure_dir(self.output_dir)
+        output_path = request.output_path
         if output_path.exists() and output_path.stat().st_size > 0:
             return AudioChunk(index=0, path=output_path, duration_ms=_wav_duration_ms(output_path))
 
-        self.ensure_loaded()
-        if self._kokoro is None:  # pragma: no cover - defensive
-            raise TtsModelError("Kokoro runtime did not initialize.")
+        if self._kokoro is None:
+            self.ensure_loaded()
+            if self._kokoro is None:  # pragma: no cover - defensive
+                raise TtsModelError("Kokoro runtime did not initialize.")
 
         try:
-            audio, rate, detected_channels = _generate_audio(
-                self._kokoro,
-                text,
-                voice=resolved_voice,
-                lang_code=resolved_lang,
-                speed=resolved_speed,
-                sample_rate=sample_rate,
-            )
+            with self._runtime_lock or nullcontext():
+                audio, rate, detected_channels = _generate_audio(
+                    self._kokoro,
+                    request.text,
+                    voice=request.voice,
+                    lang_code=request.lang_code,
+                    speed=request.speed,
+                    sample_rate=request.sample_rate,
+                )
         except TtsSizeError:
             raise
         except TtsModelError:
@@ -171,9 +241,10 @@ class KokoroOnnxTtsEngine(TtsEngine):
         except Exception as exc:  # pragma: no cover - runtime dependency
             raise TtsTransientError(f"Kokoro synthesis failed: {exc}") from exc
 
-        if not audio:
+        if len(audio) == 0:
             raise TtsTransientError("Kokoro synthesis returned empty audio.")
 
+        channels = request.channels
         if detected_channels and detected_channels != channels:
             _LOGGER.warning(
                 "Detected %d channel(s) from Kokoro output; overriding configured %d.",
@@ -182,10 +253,51 @@ class KokoroOnnxTtsEngine(TtsEngine):
             )
             channels = detected_channels
 
-        _write_wav(output_path, audio, sample_rate=rate or sample_rate, channels=channels)
+        _write_wav(output_path, audio, sample_rate=rate or request.sample_rate, channels=channels)
         return AudioChunk(index=0, path=output_path, duration_ms=_wav_duration_ms(output_path))
 
 
+@dataclass(frozen=True)
+class _KokoroRequest:
+    text: str
+    output_path: Path
+    voice: str
+    lang_code: str
+    speed: float
+    sample_rate: int
+    channels: int
+
+
+def _shared_kokoro_runtime(
+    kokoro_cls: object,
+    *,
+    model_path: Path,
+    voices_path: Path,
+    providers: list[str],
+) -> tuple[object, threading.Lock]:
+    """Return the process-wide runtime for these model files and providers.
+
+    Used when ``share_runtime`` is enabled: chapter workers keep a single copy
+    of the model weights and ONNX session in memory instead of one each. The
+    returned lock serializes calls into the runtime, since kokoro-onnx does
+    not document its phonemizer as thread-safe, so workers sharing it no
+    longer synthesize in parallel.
+    """
+    key = (kokoro_cls, str(model_path), str(voices_path), tuple(providers))
+    with _RUNTIMES_LOCK:
+        shared = _RUNTIMES.get(key)
+        if shared is None:
+            runtime = _build_kokoro_runtime(
+                kokoro_cls,
+                model_path=model_path,
+                voices_path=voices_path,
+                providers=providers,
+            )
+            shared = (runtime, threading.Lock())
+            _RUNTIMES[key] = shared
+        return shared
+
+
 def _build_kokoro_runtime(
     kokoro_cls: object,
     *,
@@ -224,7 +336,7 @@ def _generate_audio(
     lang_code: str,
     speed: float,
     sample_rate: int,
-) -> tuple[list[float], int, int]:
+) -> tuple[Sequence[float], int, int]:
     create = getattr(runtime, "create", None)
     if callable(create):
         result = _call_with_supported_kwargs(
@@ -277,7 +389,7 @@ def _call_with_supported_kwargs(func: object, **kwargs: object) -> object:
     return func(text, **payload)  # type: ignore[misc]
 
 
-def _extract_audio_result(result: object, *, fallback_rate: int) -> tuple[list[float], int, int]:
+def _extract_audio_result(result: object, *, fallback_rate: int) -> tuple[Sequence[float], int, int]:
     audio = result
     sample_rate = fallback_rate
 
@@ -301,7 +413,20 @@ def _extract_audio_result(result: object, *, fallback_rate: int) -> tuple[list[f
         if isinstance(maybe_rate, (int, float)):
             sample_rate = int(maybe_rate)
 
-    return _normalize_audio_list(_to_list(audio), sample_rate=fallback_rate if sample_rate <= 0 else sample_rate)
+    if sample_rate <= 0:
+        sample_rate = fallback_rate
+    if np is not None and isinstance(audio, np.ndarray) and 1 <= audio.ndim <= 2:
+        return _normalize_audio_array(audio, sample_rate=sample_rate)
+    return _normalize_audio_list(_to_list(audio), sample_rate=sample_rate)
+
+
+def _normalize_audio_array(audio: np.ndarray, *, sample_rate: int) -> tuple[np.ndarray, int, int]:
+    # Mirrors _normalize_audio_list: 2-D output is read channels-first and interleaved.
+    if audio.size == 0:
+        return audio.reshape(0), sample_rate, 0
+    if audio.ndim == 1:
+        return audio, sample_rate, 1
+    return audio.T.reshape(-1), sample_rate, audio.shape[0]
 
 
 def _normalize_audio_list(audio_list: list[object], *, sample_rate: int) -> tuple[list[float], int, int]:
@@ -366,18 +491,15 @@ def _to_list(audio: object) -> list[object]:
 
 
 def _is_speakable_text(text: str) -> bool:
-    stripped = text.strip()
-    if not stripped:
-        return False
-    if re.fullmatch(r"[\W_]+", stripped):
-        return False
-    return True
+    return _HAS_WORD_CHAR_RE.search(text) is not None
 
 
+@lru_cache(maxsize=4096)
 def _estimate_tokens(text: str) -> int:
     # Conservative heuristic used for pre-split protection. Real tokenization
-    # may vary by model implementation.
-    return len(re.findall(r"\w+|[^\w\s]", text))
+    # may vary by model implementation. Cached because retries, splits and
+    # recurring short phrases estimate the same text repeatedly.
+    return len(_TOKEN_RE.findall(text))
 
 
 def _coerce_optional_str(value: object) -> str | None:
@@ -409,7 +531,7 @@ def _coerce_int(value: object, default: int) -> int:
         return default
 
 
-def _write_wav(path: Path, samples: list[float], sample_rate: int, channels: int) -> None:
+def _write_wav(path: Path, samples: Sequence[float], sample_rate: int, channels: int) -> None:
     pcm = _float_to_pcm16(samples)
     ensure_dir(path.parent)
     with wave.open(str(path), "wb") as handle:
@@ -419,7 +541,14 @@ def _write_wav(path: Path, samples: list[float], sample_rate: int, channels: int
         handle.writeframes(pcm)
 
 
-def _float_to_pcm16(samples: list[float]) -> bytes:
+def _float_to_pcm16(samples: Sequence[float]) -> bytes:
+    if np is not None and isinstance(samples, np.ndarray):
+        # Same clip-scale-truncate as the loop below, in one vectorized pass.
+        if samples.dtype.kind in "iu":
+            return np.clip(samples, -32768, 32767).astype("<i2").tobytes()
+        scaled = np.clip(samples.astype(np.float64, copy=False), -1.0, 1.0) * 32767
+        return scaled.astype("<i2").tobytes()
+
     import array
 
     pcm = array.array("h")
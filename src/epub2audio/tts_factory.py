@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 import os
 from pathlib import Path
+from typing import Callable
 
 from .config import Config
 from .interfaces import TtsEngine
@@ -13,7 +15,7 @@ from .tts_engine import MlxTtsEngine, TtsModelError
 from .tts_engine_kokoro_onnx import KokoroOnnxTtsEngine
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BackendDiagnostic:
     name: str
     status: str
@@ -28,44 +30,69 @@ class ModelCacheStatus:
 
 def build_tts_engine(config: Config, output_dir: Path) -> TtsEngine:
     engine = (config.tts.engine or "").strip().lower()
-    ref_audio_id = _ref_audio_cache_id(config.tts.ref_audio)
+    builder = _ENGINE_BUILDERS.get(engine)
+    if builder is None:
+        raise TtsModelError(f"Unsupported TTS engine '{config.tts.engine}'.")
+    return builder(config, output_dir)
+
+
+def _build_mlx_engine(config: Config, output_dir: Path) -> TtsEngine:
+    return MlxTtsEngine(
+        model_id=config.tts.model_id,
+        output_dir=output_dir,
+        sample_rate=config.tts.sample_rate,
+        channels=config.tts.channels,
+        voice=config.tts.voice,
+        lang_code=config.tts.lang_code,
+        ref_audio=config.tts.ref_audio,
+        ref_text=config.tts.ref_text,
+        ref_audio_id=_ref_audio_cache_id(config.tts.ref_audio),
+        speed=config.tts.speed,
+        max_input_chars=config.tts.max_chars,
+    )
+
+
+def _build_kokoro_onnx_engine(config: Config, output_dir: Path) -> TtsEngine:
+    return KokoroOnnxTtsEngine(
+        model_id=config.tts.model_id,
+        output_dir=output_dir,
+        sample_rate=config.tts.sample_rate,
+        channels=config.tts.channels,
+        voice=config.tts.voice,
+        lang_code=config.tts.lang_code,
+        speed=config.tts.speed,
+        max_input_chars=config.tts.max_chars,
+        max_input_tokens=config.tts.max_input_tokens,
+        execution_provider=config.tts.execution_provider,
+        onnx_model_file=config.tts.onnx_model_file,
+        onnx_voices_file=config.tts.onnx_voices_file,
+        share_runtime=config.tts.onnx_share_runtime,
+    )
+
+
+# Normalized engine name -> builder; the Kokoro aliases share one builder.
+_ENGINE_BUILDERS: dict[str, Callable[[Config, Path], TtsEngine]] = {
+    "mlx": _build_mlx_engine,
+    "kokoro": _build_kokoro_onnx_engine,
+    "kokoro_onnx": _build_kokoro_onnx_engine,
+    "onnx": _build_kokoro_onnx_engine,
+}
 
-    if engine == "mlx":
-        return MlxTtsEngine(
-            model_id=config.tts.model_id,
-            output_dir=output_dir,
-            sample_rate=config.tts.sample_rate,
-            channels=config.tts.channels,
-            voice=config.tts.voice,
-            lang_code=config.tts.lang_code,
-            ref_audio=config.tts.ref_audio,
-            ref_text=config.tts.ref_text,
-            ref_audio_id=ref_audio_id,
-            speed=config.tts.speed,
-            max_input_chars=config.tts.max_chars,
-        )
 
-    if engine in {"kokoro", "kokoro_onnx", "onnx"}:
-        return KokoroOnnxTtsEngine(
-            model_id=config.tts.model_id,
-            output_dir=output_dir,
-            sample_rate=config.tts.sample_rate,
-            channels=config.tts.channels,
-            voice=config.tts.voice,
-            lang_code=config.tts.lang_code,
-            speed=config.tts.speed,
-            max_input_chars=config.tts.max_chars,
-            max_input_tokens=config.tts.max_input_tokens,
-            execution_provider=config.tts.execution_provider,
-            onnx_model_file=config.tts.onnx_model_file,
-            onnx_voices_file=config.tts.onnx_voices_file,
-        )
+def backend_diagnostics(config: Config) -> list[BackendDiagnostic]:
+    return list(_backend_diagnostics_cached(config.tts.engine, config.tts.execution_provider))
 
-    raise TtsModelError(f"Unsupported TTS engine '{config.tts.engine}'.")
 
+def clear_backend_diagnostics_cache() -> None:
+    """Forget memoized backend probes, e.g. after installing a backend."""
+    _backend_diagnostics_cached.cache_clear()
 
-def backend_diagnostics(config: Config) -> list[BackendDiagnostic]:
-    engine = (config.tts.engine or "").strip().lower()
+
+@lru_cache(maxsize=8)
+def _backend_diagnostics_cached(engine_name: str, execution_provider: str) -> tuple[BackendDiagnostic, ...]:
+    # Probing imports mlx-audio / kokoro-onnx / onnxruntime; the result only
+    # depends on the engine and requested provider, so repeat calls reuse it.
+    engine = (engine_name or "").strip().lower()
     checks: list[BackendDiagnostic] = []
 
     if engine == "mlx":
@@ -81,7 +108,7 @@ def backend_diagnostics(config: Config) -> list[BackendDiagnostic]:
                     "mlx-audio missing. Install with `pip install -e '.[tts-mlx]'`.",
                 )
             )
-        return checks
+        return tuple(checks)
 
     if engine in {"kokoro", "kokoro_onnx", "onnx"}:
         try:
@@ -105,7 +132,7 @@ def backend_diagnostics(config: Config) -> list[BackendDiagnostic]:
                 BackendDiagnostic(
                     "Execution provider",
                     "OK",
-                    render_onnx_provider_resolution(config.tts.execution_provider, available=providers),
+                    render_onnx_provider_resolution(execution_provider, available=providers),
                 )
             )
         except Exception:
@@ -116,10 +143,10 @@ def backend_diagnostics(config: Config) -> list[BackendDiagnostic]:
                     "onnxruntime missing. Install with `pip install -e '.[tts-kokoro]'`.",
                 )
             )
-        return checks
+        return tuple(checks)
 
-    checks.append(BackendDiagnostic("TTS backend", "FAIL", f"Unsupported TTS engine '{config.tts.engine}'."))
-    return checks
+    checks.append(BackendDiagnostic("TTS backend", "FAIL", f"Unsupported TTS engine '{engine_name}'."))
+    return tuple(checks)
 
 
 def _ref_audio_cache_id(ref_audio: Path | None) -> str | None:
@@ -132,10 +159,36 @@ def _ref_audio_cache_id(ref_audio: Path | None) -> str | None:
         return str(ref_audio)
 
 
-def model_cache_status(model_id: str, *, required_files: tuple[str, ...] = ()) -> ModelCacheStatus:
+def model_cache_status(
+    model_id: str,
+    *,
+    required_files: tuple[str, ...] = (),
+    cache_root: Path | None = None,
+) -> ModelCacheStatus:
     model_dir = model_id.replace("/", "--")
-    candidates: list[Path] = []
+    candidates = [cache_root] if cache_root is not None else _hub_cache_candidates()
+
+    for root in candidates:
+        direct = root / f"models--{model_dir}"
+        if not direct.is_dir():
+            continue
+        if not required_files:
+            return ModelCacheStatus(path=direct, missing_files=())
+        latest_snapshot = _latest_snapshot(direct / "snapshots")
+        if latest_snapshot is None:
+            return ModelCacheStatus(path=direct, missing_files=tuple(required_files))
+        present = _snapshot_files(latest_snapshot)
+        missing = tuple(
+            filename
+            for filename in required_files
+            if filename not in present and ("/" not in filename or not (latest_snapshot / filename).exists())
+        )
+        return ModelCacheStatus(path=direct, missing_files=missing)
+    return ModelCacheStatus(path=None, missing_files=tuple(required_files))
+
 
+def _hub_cache_candidates() -> list[Path]:
+    candidates: list[Path] = []
     for key in ("HUGGINGFACE_HUB_CACHE", "HF_HUB_CACHE", "HF_HOME"):
         value = os.environ.get(key)
         if not value:
@@ -148,31 +201,25 @@ def model_cache_status(model_id: str, *, required_files: tuple[str, ...] = ()) -
 
     if not candidates:
         candidates.append(Path.home() / ".cache" / "huggingface" / "hub")
-
-    for root in candidates:
-        if not root.exists():
-            continue
-        direct = root / f"models--{model_dir}"
-        if direct.exists():
-            missing: list[str] = []
-            snapshot_root = direct / "snapshots"
-            if required_files:
-                if not snapshot_root.exists():
-                    missing.extend(required_files)
-                else:
-                    latest_snapshot = _latest_snapshot(snapshot_root)
-                    if latest_snapshot is None:
-                        missing.extend(required_files)
-                    else:
-                        for filename in required_files:
-                            if not (latest_snapshot / filename).exists():
-                                missing.append(filename)
-            return ModelCacheStatus(path=direct, missing_files=tuple(missing))
-    return ModelCacheStatus(path=None, missing_files=tuple(required_files))
+    return candidates
 
 
 def _latest_snapshot(snapshot_root: Path) -> Path | None:
-    snapshots = [path for path in snapshot_root.iterdir() if path.is_dir()]
+    try:
+        with os.scandir(snapshot_root) as entries:
+            snapshots = [(entry.stat().st_mtime_ns, entry.path) for entry in entries if entry.is_dir()]
+    except OSError:
+        return None
     if not snapshots:
         return None
-    return sorted(snapshots, key=lambda path: path.stat().st_mtime_ns, reverse=True)[0]
+    return Path(max(snapshots)[1])
+
+
+def _snapshot_files(snapshot: Path) -> set[str]:
+    # Hub snapshots hold symlinks into blobs/, so is_file() must follow them;
+    # a dangling link counts as missing, as exists() did.
+    try:
+        with os.scandir(snapshot) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return set()
@@ -2,22 +2,39 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+import functools
+import hashlib
 import logging
+import re
 import time
 from pathlib import Path
-from typing import Callable
+from typing import AsyncIterator, Callable, Iterator, Sequence, Union
 
-from .audio_cache import AudioCacheLayout, chunk_cache_key
-from .interfaces import AudioChunk, Segment, TextSegmenter, TtsEngine
+from .audio_cache import AudioCacheLayout, chunk_cache_key, chunk_cache_key_for_prefix, chunk_cache_prefix
+from .interfaces import AudioChunk, BatchTtsEngine, Segment, TextSegmenter, TtsEngine
 from .text_segmenter import BasicTextSegmenter
+from .tts_cache import PhonemeAudioCache
 from .tts_engine import TtsError, TtsInputError, TtsSizeError, TtsTransientError
 from .utils import ensure_dir
 
 _LOGGER = logging.getLogger(__name__)
 
+_STREAM_SENTENCE_END_RE = re.compile(r"[.?!][\"')\]]*\s*$")
+_STREAM_CLAUSE_MIN_WORDS = 4
+_STREAM_MAX_WORDS = 80
+_SPLIT_CACHE_MAX_TEXT = 4096
+_LEAD_WINDOW_CHARS = 200
+_LEAD_MAX_CHARS = 120
+_LEAD_SENTENCE_END_RE = re.compile(r"[.!?]+[\"')\]]*\s+")
+_AUDIO_MEMORY_CACHE = PhonemeAudioCache()
 
-@dataclass(frozen=True)
+# A segment, or a group of segments sent to the engine in one batch call.
+_WorkItem = Union[Segment, tuple[Segment, ...]]
+
+
+@dataclass(frozen=True, slots=True)
 class TtsSynthesisSettings:
     model_id: str
     max_chars: int
@@ -33,6 +50,27 @@ class TtsSynthesisSettings:
     ref_audio: Path | None
     ref_text: str | None
     ref_audio_id: str | None
+    max_concurrent: int = 1
+    batch_size: int = 1
+    _config_hash_prefix: hashlib._Hash = field(init=False, repr=False, compare=False)
+    _backoff_delays: tuple[float, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # The cache key hashes these once per run; per chunk only text + voice vary.
+        prefix = chunk_cache_prefix(
+            model_id=self.model_id,
+            lang_code=self.lang_code,
+            ref_audio_id=self.ref_audio_id,
+            ref_text=self.ref_text,
+            speed=self.speed,
+            sample_rate=self.sample_rate,
+            channels=self.channels,
+        )
+        object.__setattr__(self, "_config_hash_prefix", prefix)
+        delays = tuple(
+            _backoff_delay(attempt, self.backoff_base, self.backoff_jitter) for attempt in range(max(0, self.max_retries))
+        )
+        object.__setattr__(self, "_backoff_delays", delays)
 
 
 def synthesize_text(
@@ -48,10 +86,73 @@ def synthesize_text(
     logger: logging.Logger | None = None,
     sleep_fn: Callable[[float], None] = time.sleep,
 ) -> list[AudioChunk]:
-    logger = logger or _LOGGER
     if not text:
         return []
+    segments, synthesize = _prepare_synthesis(
+        text,
+        engine,
+        settings,
+        segmenter=segmenter,
+        voice=voice,
+        output_dir=output_dir,
+        cache=cache,
+        output_format=output_format,
+        logger=logger or _LOGGER,
+        sleep_fn=sleep_fn,
+    )
+    return OrderlyParallelProcessor(settings.max_concurrent).run(segments, synthesize)
+
+
+def iter_synthesize_text(
+    text: str,
+    engine: TtsEngine,
+    settings: TtsSynthesisSettings,
+    *,
+    segmenter: TextSegmenter | None = None,
+    voice: str | None = None,
+    output_dir: Path | None = None,
+    cache: AudioCacheLayout | None = None,
+    output_format: str = "wav",
+    logger: logging.Logger | None = None,
+    sleep_fn: Callable[[float], None] = time.sleep,
+) -> Iterator[AudioChunk]:
+    """Yield chunks in order while the next segment synthesizes in the background.
 
+    With the default ``max_concurrent=1`` this is a one-ahead prefetch on a
+    single worker: segment N+1 is being synthesized while the caller handles
+    the chunks of segment N.
+    """
+    if not text:
+        return
+    segments, synthesize = _prepare_synthesis(
+        text,
+        engine,
+        settings,
+        segmenter=segmenter,
+        voice=voice,
+        output_dir=output_dir,
+        cache=cache,
+        output_format=output_format,
+        logger=logger or _LOGGER,
+        sleep_fn=sleep_fn,
+    )
+    for chunks in OrderlyParallelProcessor(settings.max_concurrent).iter_ordered(segments, synthesize):
+        yield from chunks
+
+
+def _prepare_synthesis(
+    text: str,
+    engine: TtsEngine,
+    settings: TtsSynthesisSettings,
+    *,
+    segmenter: TextSegmenter | None,
+    voice: str | None,
+    output_dir: Path | None,
+    cache: AudioCacheLayout | None,
+    output_format: str,
+    logger: logging.Logger,
+    sleep_fn: Callable[[float], None],
+) -> tuple[list[_WorkItem], Callable[[_WorkItem], list[AudioChunk]]]:
     segmenter = segmenter or BasicTextSegmenter(
         max_chars=settings.max_chars,
         min_chars=settings.min_chars,
@@ -61,24 +162,296 @@ def synthesize_text(
     if output_dir is not None:
         ensure_dir(output_dir)
 
-    segments = list(segmenter.segment(text))
-    audio_chunks: list[AudioChunk] = []
-    for segment in segments:
-        audio_chunks.extend(
-            _synthesize_with_retry(
-                segment,
-                engine,
-                settings,
-                voice=voice,
-                lang_code=settings.lang_code,
-                logger=logger,
-                sleep_fn=sleep_fn,
-                cache=cache,
-                output_dir=output_dir,
-                output_format=output_format,
-            )
+    segments = _plan_segments(text, segmenter, settings)
+    synthesize = functools.partial(
+        _synthesize_with_retry,
+        engine=engine,
+        settings=settings,
+        voice=voice,
+        lang_code=settings.lang_code,
+        logger=logger,
+        sleep_fn=sleep_fn,
+        cache=cache,
+        output_dir=output_dir,
+        output_format=output_format,
+    )
+    if settings.batch_size <= 1 or not isinstance(engine, BatchTtsEngine) or len(segments) <= 1:
+        return segments, synthesize
+
+    size = settings.batch_size
+    groups = [tuple(segments[start : start + size]) for start in range(0, len(segments), size)]
+    synthesize_group = functools.partial(
+        _synthesize_group,
+        synthesize_one=synthesize,
+        engine=engine,
+        settings=settings,
+        voice=voice,
+        logger=logger,
+        cache=cache,
+        output_dir=output_dir,
+        output_format=output_format,
+    )
+    return groups, synthesize_group
+
+
+def _synthesize_group(
+    group: tuple[Segment, ...],
+    *,
+    synthesize_one: Callable[[Segment], list[AudioChunk]],
+    engine: BatchTtsEngine,
+    settings: TtsSynthesisSettings,
+    voice: str | None,
+    logger: logging.Logger,
+    cache: AudioCacheLayout | None,
+    output_dir: Path | None,
+    output_format: str,
+) -> list[AudioChunk]:
+    """Synthesize a group of segments with one ``engine.synthesize_batch`` call.
+
+    Oversized segments and memory-cache hits stay out of the batch. If the
+    batch call raises a TTS error it is halved and each half re-dispatched,
+    so the segments that succeed stay batched; a lone failing segment goes
+    back through ``synthesize_one`` so skips, splits and retries behave
+    exactly as on the per-segment path.
+    """
+    results: list[list[AudioChunk]] = [[] for _ in group]
+    batch: list[tuple[int, Segment, dict[str, object]]] = []
+    for pos, segment in enumerate(group):
+        if len(segment.text) > settings.max_chars:
+            results[pos] = synthesize_one(segment)
+            continue
+        engine_config = _engine_config(
+            segment.text,
+            engine,
+            settings,
+            voice,
+            settings.lang_code,
+            cache=cache,
+            output_dir=output_dir,
+            output_format=output_format,
         )
-    return audio_chunks
+        output_path = engine_config.get("output_path")
+        if isinstance(output_path, Path):
+            hit = _AUDIO_MEMORY_CACHE.get(output_path)
+            if hit is not None:
+                results[pos] = [hit]
+                continue
+        batch.append((pos, segment, engine_config))
+
+    if batch:
+        _dispatch_batch(batch, results, synthesize_one=synthesize_one, engine=engine, voice=voice, logger=logger)
+    return [chunk for chunks_for_segment in results for chunk in chunks_for_segment]
+
+
+def _dispatch_batch(
+    batch: list[tuple[int, Segment, dict[str, object]]],
+    results: list[list[AudioChunk]],
+    *,
+    synthesize_one: Callable[[Segment], list[AudioChunk]],
+    engine: BatchTtsEngine,
+    voice: str | None,
+    logger: logging.Logger,
+) -> None:
+    if len(batch) == 1:
+        pos, segment, _ = batch[0]
+        results[pos] = synthesize_one(segment)
+        return
+
+    try:
+        chunks = engine.synthesize_batch(
+            [segment.text for _, segment, _ in batch],
+            voice=voice,
+            configs=[engine_config for _, _, engine_config in batch],
+        )
+    except TtsError as exc:
+        logger.warning("Batch of %d chunk(s) failed: %s. Retrying in halves.", len(batch), exc)
+        middle = len(batch) // 2
+        for half in (batch[:middle], batch[middle:]):
+            _dispatch_batch(half, results, synthesize_one=synthesize_one, engine=engine, voice=voice, logger=logger)
+        return
+
+    if len(chunks) != len(batch):
+        logger.warning("Batch returned %d chunk(s) for %d text(s). Retrying individually.", len(chunks), len(batch))
+        for pos, segment, _ in batch:
+            results[pos] = synthesize_one(segment)
+        return
+
+    for (pos, _, engine_config), chunk in zip(batch, chunks):
+        output_path = engine_config.get("output_path")
+        if isinstance(output_path, Path):
+            _AUDIO_MEMORY_CACHE.put(output_path, chunk)
+        results[pos] = [chunk]
+
+
+class OrderlyParallelProcessor:
+    """Run per-segment synthesis on a bounded pool, emitting chunks in segment order.
+
+    Up to ``max_concurrent`` segments are in flight at once. Results are kept
+    in ``pending`` keyed by segment position and drained from the ``next_emit``
+    cursor, so a slow early segment delays emission but never reorders it.
+    Each submitted call carries its own retry/split handling.
+    """
+
+    def __init__(self, max_concurrent: int = 1) -> None:
+        self.max_concurrent = max(1, int(max_concurrent))
+
+    def run(
+        self,
+        segments: Sequence[_WorkItem],
+        synthesize: Callable[[_WorkItem], list[AudioChunk]],
+    ) -> list[AudioChunk]:
+        if self.max_concurrent == 1 or len(segments) <= 1:
+            # Nothing consumes chunks before the list is returned, so there is
+            # no work for a prefetch to overlap; keep engine calls on this thread.
+            return [chunk for segment in segments for chunk in synthesize(segment)]
+        return [chunk for chunks in self.iter_ordered(segments, synthesize) for chunk in chunks]
+
+    def iter_ordered(
+        self,
+        segments: Sequence[_WorkItem],
+        synthesize: Callable[[_WorkItem], list[AudioChunk]],
+    ) -> Iterator[list[AudioChunk]]:
+        """Yield each segment's chunks in order, keeping the pool filled ahead of the consumer."""
+        pending: dict[int, Future[list[AudioChunk]]] = {}
+        next_submit = 0
+        with ThreadPoolExecutor(max_workers=self.max_concurrent, thread_name_prefix="tts-chunk") as pool:
+            try:
+                for next_emit in range(len(segments)):
+                    while next_submit < len(segments) and len(pending) < self.max_concurrent:
+                        pending[next_submit] = pool.submit(synthesize, segments[next_submit])
+                        next_submit += 1
+                    chunks = pending.pop(next_emit).result()
+                    if next_submit < len(segments):
+                        pending[next_submit] = pool.submit(synthesize, segments[next_submit])
+                        next_submit += 1
+                    yield chunks
+            except BaseException:
+                for future in pending.values():
+                    future.cancel()
+                raise
+
+
+def _plan_segments(text: str, segmenter: TextSegmenter, settings: TtsSynthesisSettings) -> list[Segment]:
+    """Segment text, splitting the first segment into a small lead so audio starts sooner.
+
+    Only the supplied segmenter's first segment is re-split: whole sentences
+    from its first ``_LEAD_WINDOW_CHARS`` characters are packed within a
+    ``_LEAD_MAX_CHARS`` budget and the rest of it stays one segment. Every
+    later segment keeps the segmenter's text unchanged.
+    """
+    segments = list(segmenter.segment(text))
+    if len(segments) < 2:
+        return segments
+
+    lead = _split_lead(segments[0].text, min(_LEAD_MAX_CHARS, settings.max_chars))
+    if len(lead) < 2:
+        return segments
+
+    planned = [Segment(index=index, text=piece) for index, piece in enumerate(lead)]
+    offset = len(lead) - 1
+    for segment in segments[1:]:
+        planned.append(Segment(index=offset + segment.index, text=segment.text))
+    return planned
+
+
+def _split_lead(text: str, budget: int) -> list[str]:
+    pieces: list[str] = []
+    start = end = 0
+    for match in _LEAD_SENTENCE_END_RE.finditer(text, 0, _LEAD_WINDOW_CHARS):
+        if match.end() - start > budget and end > start:
+            pieces.append(text[start:end].strip())
+            start = end
+        end = match.end()
+    if end > start:
+        pieces.append(text[start:end].strip())
+    rest = text[end:].strip()
+    if rest:
+        pieces.append(rest)
+    return pieces
+
+
+async def synthesize_stream(
+    text_iter: AsyncIterator[str],
+    engine: TtsEngine,
+    settings: TtsSynthesisSettings,
+    *,
+    segmenter: TextSegmenter | None = None,
+    voice: str | None = None,
+    output_dir: Path | None = None,
+    cache: AudioCacheLayout | None = None,
+    output_format: str = "wav",
+    logger: logging.Logger | None = None,
+    sleep_fn: Callable[[float], None] = time.sleep,
+) -> AsyncIterator[AudioChunk]:
+    """Synthesize text as it arrives, flushing to TTS at sentence boundaries.
+
+    Incoming fragments are buffered until the buffer ends a sentence, ends a
+    clause of at least a few words, or grows past a word budget. Each flushed
+    buffer is synthesized off the event loop and its chunks are yielded in
+    arrival order, so audio for the first sentence is available before the
+    rest of the text has been produced.
+    """
+    buffer = ""
+    async for fragment in text_iter:
+        if not fragment:
+            continue
+        buffer += fragment
+        if not _is_sentence_boundary(buffer):
+            continue
+        pending, buffer = buffer, ""
+        for chunk in await _synthesize_buffer(
+            pending,
+            engine,
+            settings,
+            segmenter=segmenter,
+            voice=voice,
+            output_dir=output_dir,
+            cache=cache,
+            output_format=output_format,
+            logger=logger,
+            sleep_fn=sleep_fn,
+        ):
+            yield chunk
+
+    if buffer.strip():
+        for chunk in await _synthesize_buffer(
+            buffer,
+            engine,
+            settings,
+            segmenter=segmenter,
+            voice=voice,
+            output_dir=output_dir,
+            cache=cache,
+            output_format=output_format,
+            logger=logger,
+            sleep_fn=sleep_fn,
+        ):
+            yield chunk
+
+
+async def _synthesize_buffer(
+    text: str,
+    engine: TtsEngine,
+    settings: TtsSynthesisSettings,
+    **kwargs: object,
+) -> list[AudioChunk]:
+    text = text.strip()
+    if not text:
+        return []
+    # Imported here: a running event loop has already loaded asyncio, and the
+    # synchronous CLI path never needs it.
+    import asyncio
+
+    return await asyncio.to_thread(synthesize_text, text, engine, settings, **kwargs)
+
+
+def _is_sentence_boundary(buffer: str) -> bool:
+    if _STREAM_SENTENCE_END_RE.search(buffer):
+        return True
+    words = buffer.split()
+    if len(words) > _STREAM_MAX_WORDS:
+        return True
+    return buffer.rstrip().endswith(",") and len(words) >= _STREAM_CLAUSE_MIN_WORDS
 
 
 def _synthesize_with_retry(
@@ -114,29 +487,23 @@ def _synthesize_with_retry(
     attempts = 0
     while True:
         try:
-            resolved_voice = voice or getattr(engine, "voice", None)
-            resolved_lang = lang_code or getattr(engine, "lang_code", None)
-            engine_config = {
-                "speed": settings.speed,
-                "lang_code": resolved_lang,
-                "sample_rate": settings.sample_rate,
-                "channels": settings.channels,
-                "ref_audio": settings.ref_audio,
-                "ref_text": settings.ref_text,
-                "ref_audio_id": settings.ref_audio_id,
-            }
-            output_path = _resolve_output_path(
+            engine_config = _engine_config(
                 text,
+                engine,
                 settings,
-                resolved_voice,
-                resolved_lang,
+                voice,
+                lang_code,
                 cache=cache,
                 output_dir=output_dir,
                 output_format=output_format,
             )
-            if output_path is not None:
-                engine_config["output_path"] = output_path
-            chunk = engine.synthesize(text, voice=voice, config=engine_config)
+            output_path = engine_config.get("output_path")
+            if not isinstance(output_path, Path):
+                return [engine.synthesize(text, voice=voice, config=engine_config)]
+            chunk = _AUDIO_MEMORY_CACHE.get_or_compute(
+                output_path,
+                functools.partial(engine.synthesize, text, voice=voice, config=engine_config),
+            )
             return [chunk]
         except TtsInputError as exc:
             logger.warning("Skipping chunk %d: %s", segment.index, exc)
@@ -158,14 +525,51 @@ def _synthesize_with_retry(
         except TtsTransientError as exc:
             if attempts >= settings.max_retries:
                 raise
-            delay = _backoff_delay(attempts, settings.backoff_base, settings.backoff_jitter)
+            delay = settings._backoff_delays[attempts]
             logger.warning("Transient TTS error on chunk %d: %s. Retrying in %.2fs", segment.index, exc, delay)
-            sleep_fn(delay)
+            if delay > 0:
+                sleep_fn(delay)
             attempts += 1
         except TtsError:
             raise
 
 
+def _engine_config(
+    text: str,
+    engine: TtsEngine,
+    settings: TtsSynthesisSettings,
+    voice: str | None,
+    lang_code: str | None,
+    *,
+    cache: AudioCacheLayout | None,
+    output_dir: Path | None,
+    output_format: str,
+) -> dict[str, object]:
+    resolved_voice = voice or getattr(engine, "voice", None)
+    resolved_lang = lang_code or getattr(engine, "lang_code", None)
+    engine_config: dict[str, object] = {
+        "speed": settings.speed,
+        "lang_code": resolved_lang,
+        "sample_rate": settings.sample_rate,
+        "channels": settings.channels,
+        "ref_audio": settings.ref_audio,
+        "ref_text": settings.ref_text,
+        "ref_audio_id": settings.ref_audio_id,
+    }
+    output_path = _resolve_output_path(
+        text,
+        settings,
+        resolved_voice,
+        resolved_lang,
+        cache=cache,
+        output_dir=output_dir,
+        output_format=output_format,
+    )
+    if output_path is not None:
+        engine_config["output_path"] = output_path
+    return engine_config
+
+
 def _split_and_synthesize(
     text: str,
     engine: TtsEngine,
@@ -187,38 +591,65 @@ def _split_and_synthesize(
     if not pieces:
         raise TtsSizeError("Unable to split text for synthesis.")
 
-    chunks: list[AudioChunk] = []
-    for idx, piece in enumerate(pieces):
-        segment = Segment(index=idx, text=piece)
-        chunks.extend(
-            _synthesize_with_retry(
-                segment,
-                engine,
-                settings,
-                voice=voice,
-                lang_code=lang_code,
-                logger=logger,
-                sleep_fn=sleep_fn,
-                depth=depth + 1,
-                cache=cache,
-                output_dir=output_dir,
-                output_format=output_format,
-            )
+    return [
+        chunk
+        for idx, piece in enumerate(pieces)
+        for chunk in _synthesize_with_retry(
+            Segment(index=idx, text=piece),
+            engine,
+            settings,
+            voice=voice,
+            lang_code=lang_code,
+            logger=logger,
+            sleep_fn=sleep_fn,
+            depth=depth + 1,
+            cache=cache,
+            output_dir=output_dir,
+            output_format=output_format,
         )
-    return chunks
+    ]
 
 
 def _split_text(text: str, settings: TtsSynthesisSettings) -> list[str]:
+    if len(text) < _SPLIT_CACHE_MAX_TEXT:
+        return list(
+            _split_text_cached(text, settings.max_chars, settings.min_chars, settings.hard_max_chars)
+        )
+    return list(_split_text_uncached(text, settings.max_chars, settings.min_chars, settings.hard_max_chars))
+
+
+def clear_split_cache() -> None:
+    """Drop memoized split results; called once a book has been processed."""
+    _split_text_cached.cache_clear()
+
+
+def clear_audio_memory_cache() -> None:
+    """Forget in-memory chunk hits; called once a book has been processed.
+
+    The on-disk chunk cache is left intact.
+    """
+    _AUDIO_MEMORY_CACHE.clear()
+
+
+def _split_text_uncached(
+    text: str,
+    max_chars: int,
+    min_chars: int,
+    hard_max_chars: int | None,
+) -> tuple[str, ...]:
     splitter = BasicTextSegmenter(
-        max_chars=settings.max_chars,
-        min_chars=settings.min_chars,
-        hard_max_chars=settings.hard_max_chars,
+        max_chars=max_chars,
+        min_chars=min_chars,
+        hard_max_chars=hard_max_chars,
     )
-    segments = [segment.text for segment in splitter.segment(text)]
+    segments = tuple(segment.text for segment in splitter.segment(text))
     if len(segments) > 1:
         return segments
 
-    return _hard_split(text, settings.max_chars)
+    return tuple(_hard_split(text, max_chars))
+
+
+_split_text_cached = functools.lru_cache(maxsize=1024)(_split_text_uncached)
 
 
 def _hard_split(text: str, max_chars: int) -> list[str]:
@@ -257,17 +688,20 @@ def _resolve_output_path(
 ) -> Path | None:
     if cache is None and output_dir is None:
         return None
-    key = chunk_cache_key(
-        text,
-        model_id=settings.model_id,
-        voice=resolved_voice,
-        lang_code=resolved_lang,
-        ref_audio_id=settings.ref_audio_id,
-        ref_text=settings.ref_text,
-        speed=settings.speed,
-        sample_rate=settings.sample_rate,
-        channels=settings.channels,
-    )
+    if resolved_lang == settings.lang_code:
+        key = chunk_cache_key_for_prefix(settings._config_hash_prefix, text, voice=resolved_voice)
+    else:
+        key = chunk_cache_key(
+            text,
+            model_id=settings.model_id,
+            voice=resolved_voice,
+            lang_code=resolved_lang,
+            ref_audio_id=settings.ref_audio_id,
+            ref_text=settings.ref_text,
+            speed=settings.speed,
+            sample_rate=settings.sample_rate,
+            channels=settings.channels,
+        )
     if cache is not None:
         cache.ensure_chunk_dir(key)
         return cache.chunk_path(key, ext=output_format)
@@ -3,17 +3,20 @@
 from __future__ import annotations
 
 from datetime import datetime
+import os
 from pathlib import Path
 import re
 
 
 _SLUG_RE = re.compile(r"[^a-z0-9]+")
+# O_BINARY keeps Windows from translating newlines in raw os.write calls.
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
 
 
 def slugify(value: str) -> str:
-    cleaned = _SLUG_RE.sub("-", value.strip().lower())
-    cleaned = cleaned.strip("-")
-    return cleaned or "book"
+    # Surrounding whitespace becomes "-" like any other separator, so one
+    # strip("-") covers it.
+    return _SLUG_RE.sub("-", value.lower()).strip("-") or "book"
 
 
 def generate_run_id() -> str:
@@ -23,3 +26,33 @@ def generate_run_id() -> str:
 def ensure_dir(path: Path) -> Path:
     path.mkdir(parents=True, exist_ok=True)
     return path
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` via a fsynced temp file and an atomic rename."""
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    fd = os.open(tmp_path, _WRITE_FLAGS, 0o644)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Never leave a half-written sidecar behind; the original file is intact.
+        tmp_path.unlink(missing_ok=True)
+        raise
+    _fsync_dir(path.parent)
+
+
+def _fsync_dir(path: Path) -> None:
+    if os.name == "nt":  # pragma: no cover - directories cannot be opened for fsync on Windows
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
@@ -2,9 +2,123 @@
 
 from __future__ import annotations
 
+import itertools
 import sys
 from pathlib import Path
 
+import pytest
+
 SRC_PATH = Path(__file__).resolve().parents[1] / "src"
 if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
+
+
+@pytest.fixture(autouse=True)
+def _deterministic_run_ids(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give each test its own run-000001, run-000002, ... sequence of run ids."""
+    counter = itertools.count(1)
+
+    def fake_generate_run_id() -> str:
+        return f"run-{next(counter):06d}"
+
+    for module in ("epub2audio.utils", "epub2audio.doctor", "epub2audio.cli.commands"):
+        monkeypatch.setattr(f"{module}.generate_run_id", fake_generate_run_id)
+
+
+@pytest.fixture(scope="session")
+def _session_sample_epub(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the minimal valid EPUB once; tests take per-test copies."""
+    try:
+        from ebooklib import epub
+    except ImportError:
+        pytest.skip("ebooklib not installed")
+
+    epub_path = tmp_path_factory.mktemp("epub") / "test_book.epub"
+
+    # Create a minimal EPUB
+    book = epub.EpubBook()
+
+    # Set metadata
+    book.set_identifier("test-id-123")
+    book.set_title("Test Audiobook")
+    book.set_language("en")
+    book.add_author("Test Author")
+
+    # Create chapters
+    chapter1 = epub.EpubHtml(
+        title="Chapter One",
+        file_name="chapter1.xhtml",
+        content="<h1>Chapter One</h1><p>This is the first chapter with some sample text for the audiobook.</p>",
+    )
+    chapter2 = epub.EpubHtml(
+        title="Chapter Two",
+        file_name="chapter2.xhtml",
+        content="<h1>Chapter Two</h1><p>This is the second chapter with more sample text for the audiobook.</p>",
+    )
+
+    # Add chapters to the book
+    book.add_item(chapter1)
+    book.add_item(chapter2)
+
+    # Define the spine (reading order)
+    book.spine = ["nav", chapter1, chapter2]
+
+    # Set the table of contents
+    book.toc = (chapter1, chapter2)
+
+    # Add navigation files
+    book.add_item(epub.EpubNcx())
+    book.add_item(epub.EpubNav())
+
+    # Write the EPUB
+    epub.write_epub(str(epub_path), book, {})
+
+    return epub_path
+
+
+@pytest.fixture(scope="session")
+def _session_sample_epub_with_cover(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the EPUB with a cover image once; tests take per-test copies."""
+    try:
+        from ebooklib import epub
+    except ImportError:
+        pytest.skip("ebooklib not installed")
+
+    epub_path = tmp_path_factory.mktemp("epub") / "test_book_cover.epub"
+
+    # Create a minimal EPUB with cover
+    book = epub.EpubBook()
+
+    # Set metadata
+    book.set_identifier("test-id-cover")
+    book.set_title("Book With Cover")
+    book.set_language("en")
+    book.add_author("Cover Author")
+
+    # Create a simple cover image (1x1 red pixel JPEG)
+    cover_data = b"\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00\xff\xdb\x00C\x00\x03\x02\x02\x03\x02\x02\x03\x03\x03\x03\x04\x03\x03\x04\x05\x08\x05\x05\x04\x04\x05\n\x07\x07\x06\x08\x0c\n\x0c\x0c\x0b\n\x0b\x0b\r\x0e\x12\x10\r\x0e\x11\x0e\x0b\x0b\x10\x16\x10\x11\x13\x14\x15\x15\x15\x0c\x0f\x17\x18\x16\x14\x18\x12\x14\x15\x14\xff\xc0\x00\x0b\x08\x00\x01\x00\x01\x01\x01\x11\x00\xff\xc4\x00\x1f\x00\x00\x01\x05\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\xff\xc4\x00\xb5\x10\x00\x02\x01\x03\x03\x02\x04\x03\x05\x05\x04\x04\x00\x00\x01}\x01\x02\x03\x00\x04\x11\x05\x12!\x06\x13AQa\x07\"q\x142\x81\x91\xa1\x08#B\xb1\xc1R\x15r\xd1\xf0$3br\x82\t\n\x16\x17\x18\x19\x1a%&'()*456789:CDEFGHIJSTUVWXYZcdefghijstuvwxyz\x83\x84\x85\x86\x87\x88\x89\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\xa2\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\xb9\xba\xc2\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\xd7\xd8\xd9\xda\xe1\xe2\xe3\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf1\xf2\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xff\xc4\x00\x1f\x01\x00\x03\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\xff\xc4\x00\xb5\x11\x00\x02\x01\x02\x04\x04\x03\x04\x07\x05\x04\x04\x00\x01\x02w\x00\x01\x02\x03\x11\x04\x05!1\x06\x12AQ\x07q\x13\"2\x81\x08\x14B\x91\xa1\xb1\xc1\t#3R\xf0\x15br\xd1\n\x16\x17\x18\x19\x1a%&'()*456789:CDEFGHIJSTUVWXYZcdefghijstuvwxyz\x83\x84\x85\x86\x87\x88\x89\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\xa2\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\xb9\xba\xc2\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\xd7\xd8\xd9\xda\xe2\xe3\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf2\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xff\xda\x00\x08\x01\x01\x00\x00?\x00T\x9f\xff\xd9"
+
+    cover = epub.EpubItem(
+        uid="cover",
+        file_name="cover.jpg",
+        media_type="image/jpeg",
+        content=cover_data,
+    )
+    book.add_item(cover)
+
+    # Add a single chapter
+    chapter = epub.EpubHtml(
+        title="Single Chapter",
+        file_name="chapter.xhtml",
+        content="<h1>Single Chapter</h1><p>Content with cover image.</p>",
+    )
+    book.add_item(chapter)
+    book.spine = ["nav", chapter]
+    book.toc = (chapter,)
+
+    book.add_item(epub.EpubNcx())
+    book.add_item(epub.EpubNav())
+
+    epub.write_epub(str(epub_path), book, {})
+
+    return epub_path
@@ -5,7 +5,12 @@ from __future__ import annotations
 from pathlib import Path
 
 import pytest
-from epub2audio.audio_cache import AudioCacheLayout, chunk_cache_key
+from epub2audio.audio_cache import (
+    AudioCacheLayout,
+    chunk_cache_key,
+    chunk_cache_key_for_prefix,
+    chunk_cache_prefix,
+)
 
 
 class TestChunkCacheKey:
@@ -223,6 +228,38 @@ class TestChunkCacheKey:
         key3 = chunk_cache_key(text="Hello World", **base_params)
         assert key1 != key3
 
+    def test_precomputed_prefix_matches_full_key(self) -> None:
+        """Keys built from a precomputed prefix should match chunk_cache_key."""
+        stable_params = {
+            "model_id": "test-model",
+            "lang_code": "en",
+            "ref_audio_id": None,
+            "ref_text": None,
+            "speed": 1.0,
+            "sample_rate": 24000,
+            "channels": 1,
+        }
+        prefix = chunk_cache_prefix(**stable_params)
+        assert chunk_cache_key_for_prefix(prefix, "Hello", voice="default") == chunk_cache_key(
+            text="Hello", voice="default", **stable_params
+        )
+
+    def test_precomputed_prefix_keeps_v1_keys(self) -> None:
+        """The prefix path must reproduce the original v1 full-payload digest."""
+        prefix = chunk_cache_prefix(
+            model_id="test-model",
+            lang_code="en",
+            ref_audio_id=None,
+            ref_text=None,
+            speed=1.0,
+            sample_rate=24000,
+            channels=1,
+        )
+        expected = "tts_4f019dceddf28043fda07efcb762f0cd55e544e81491f761616d220b2ab6a0e9"
+        assert chunk_cache_key_for_prefix(prefix, "Hello 世界", voice="default") == expected
+        # The primed hash is copied, so reusing the prefix gives the same key.
+        assert chunk_cache_key_for_prefix(prefix, "Hello 世界", voice="default") == expected
+
 
 class TestAudioCacheLayout:
     """Tests for AudioCacheLayout directory and path management."""
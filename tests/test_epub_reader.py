@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
@@ -11,6 +11,7 @@ import pytest
 from epub2audio.epub_reader import (
     EbooklibEpubReader,
     _build_toc_maps,
+    _extract_item,
     _extract_metadata,
     _extract_title_and_text,
     _first_metadata,
@@ -24,6 +25,7 @@ from epub2audio.epub_reader import (
     _toc_entry,
     _walk_toc,
 )
+from epub2audio.interfaces import CoverImage
 
 
 # ============================================================================
@@ -31,6 +33,13 @@ from epub2audio.epub_reader import (
 # ============================================================================
 
 
+@pytest.fixture(autouse=True, scope="module")
+def _patch_item_document():
+    """Give spine items a plain int type; the reader only compares against it."""
+    with patch("epub2audio.epub_reader.ITEM_DOCUMENT", 1):
+        yield
+
+
 @dataclass
 class MockEpubItem:
     """Mock ebooklib item for testing."""
@@ -58,6 +67,40 @@ class MockTocItem:
     href: str | None = "chapter1.xhtml"
 
 
+@dataclass
+class FakeTag:
+    """Stand-in for a BeautifulSoup tag exposing ``.string``."""
+
+    string: str | None = None
+
+
+@dataclass
+class FakeBody:
+    """Stand-in for a BeautifulSoup ``<body>`` tag."""
+
+    _text: str = ""
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        return self._text
+
+
+@dataclass
+class FakeSoup:
+    """Stand-in for a parsed BeautifulSoup document."""
+
+    title: FakeTag | None = None
+    body: FakeBody | None = None
+    _text: str = ""
+    removed: list[list[str]] = field(default_factory=list)
+
+    def __call__(self, names: list[str]) -> list:
+        self.removed.append(list(names))
+        return []
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        return self._text
+
+
 @dataclass
 class MockEpubBook:
     """Mock ebooklib EPUB book for testing."""
@@ -540,16 +583,10 @@ def test_resolve_title_prefer_toc_over_html() -> None:
 
 @patch("epub2audio.epub_reader.BeautifulSoup")
 def test_extract_title_and_text_basic(mock_bs: MagicMock) -> None:
-    from bs4 import Tag
-
-    # Mock the HTML structure
-    mock_title_tag = MagicMock()
-    mock_title_tag.string = "  Chapter Title  "
-    mock_soup = MagicMock()
-    mock_soup.title = mock_title_tag
-    mock_soup.body = MagicMock()
-    mock_soup.body.get_text.return_value = "Line 1\n\nLine 2\n\n"
-    mock_bs.return_value = mock_soup
+    mock_bs.return_value = FakeSoup(
+        title=FakeTag("  Chapter Title  "),
+        body=FakeBody("Line 1\n\nLine 2\n\n"),
+    )
 
     title, text = _extract_title_and_text(b"<html></html>")
     assert title == "Chapter Title"
@@ -558,26 +595,17 @@ def test_extract_title_and_text_basic(mock_bs: MagicMock) -> None:
 
 @patch("epub2audio.epub_reader.BeautifulSoup")
 def test_extract_title_and_text_removes_script_tags(mock_bs: MagicMock) -> None:
-    mock_soup = MagicMock()
-    mock_soup.title = None
-    mock_soup.body = MagicMock()
-    mock_soup.body.get_text.return_value = "content"
-    mock_soup.return_value = mock_soup
-    # Call to soup() should remove tags
-    mock_soup.__call__ = MagicMock(return_value=mock_soup)
+    soup = FakeSoup(title=None, body=FakeBody("content"))
+    mock_bs.return_value = soup
 
     _extract_title_and_text(b"<html><script>alert('test')</script></html>")
-    # Verify soup was called with the content
-    mock_bs.assert_called_once()
+    mock_bs.assert_called()
+    assert all("script" in names for names in soup.removed)
 
 
 @patch("epub2audio.epub_reader.BeautifulSoup")
 def test_extract_title_and_text_no_body(mock_bs: MagicMock) -> None:
-    mock_soup = MagicMock()
-    mock_soup.title = None
-    mock_soup.body = None
-    mock_soup.get_text.return_value = "direct text"
-    mock_bs.return_value = mock_soup
+    mock_bs.return_value = FakeSoup(title=None, body=None, _text="direct text")
 
     title, text = _extract_title_and_text(b"<p>direct text</p>")
     assert title is None
@@ -586,51 +614,88 @@ def test_extract_title_and_text_no_body(mock_bs: MagicMock) -> None:
 
 @patch("epub2audio.epub_reader.BeautifulSoup")
 def test_extract_title_and_text_none_title_string(mock_bs: MagicMock) -> None:
-    mock_title_tag = MagicMock()
-    mock_title_tag.string = None
-    mock_soup = MagicMock()
-    mock_soup.title = mock_title_tag
-    mock_soup.body = MagicMock()
-    mock_soup.body.get_text.return_value = "content"
-    mock_bs.return_value = mock_soup
+    mock_bs.return_value = FakeSoup(title=FakeTag(None), body=FakeBody("content"))
 
     title, text = _extract_title_and_text(b"<html></html>")
     assert title is None
     assert text == "content"
 
 
+@patch("epub2audio.epub_reader.BeautifulSoup")
+def test_extract_item_skips_markup_only_documents(mock_bs: MagicMock) -> None:
+    item = MockEpubItem(content=b"<html><body>\n  <div><br/></div>\n</body></html>")
+
+    assert _extract_item(item) == (None, "")
+    mock_bs.assert_not_called()
+
+
 # ============================================================================
 # Tests for EbooklibEpubReader.read()
 # ============================================================================
 
 
-@patch("epub2audio.epub_reader.ITEM_DOCUMENT", 1)  # Mock ITEM_DOCUMENT constant
-@patch("epub2audio.epub_reader.epub")
-@patch("epub2audio.epub_reader.BeautifulSoup")
-def test_read_basic_epub(mock_bs: MagicMock, mock_epub: MagicMock) -> None:
-    """Test reading a basic EPUB file."""
-    # Setup mock book
-    mock_book = MockEpubBook(
-        title="Test Book",
-        author="Test Author",
-        language="en",
-        spine=[("item1", True), ("item2", True)],
+def _as_documents(book: MockEpubBook) -> MockEpubBook:
+    for item in book._items.values():
+        item.item_type = 1  # Matches the patched ITEM_DOCUMENT constant
+    return book
+
+
+@pytest.fixture(scope="module")
+def basic_mock_book() -> MockEpubBook:
+    return _as_documents(
+        MockEpubBook(
+            title="Test Book",
+            author="Test Author",
+            language="en",
+            spine=[("item1", True), ("item2", True)],
+        )
+    )
+
+
+@pytest.fixture(scope="module")
+def non_linear_mock_book() -> MockEpubBook:
+    return _as_documents(
+        MockEpubBook(
+            title="Test Book",
+            spine=[
+                ("item1", True),
+                ("non_linear", "no"),  # Non-linear
+                ("item2", True),
+            ],
+        )
     )
-    mock_epub.read_epub.return_value = mock_book
 
-    # Mock BeautifulSoup
-    mock_soup_instance = MagicMock()
-    mock_soup_instance.title = None
-    mock_soup_instance.body = MagicMock()
-    mock_soup_instance.body.get_text.return_value = "Test content"
-    mock_bs.return_value = mock_soup_instance
 
-    # Update MockEpubItem to return the mocked ITEM_DOCUMENT type
-    for item_id in ["item1", "item2"]:
-        if item := mock_book.get_item_with_id(item_id):
-            item.item_type = 1
+@pytest.fixture(scope="module")
+def mock_bs_default() -> MagicMock:
+    return MagicMock(return_value=FakeSoup(title=None, body=FakeBody("Content")))
+
+
+@pytest.fixture
+def reader_factory(monkeypatch: pytest.MonkeyPatch, mock_bs_default: MagicMock):
+    """Patch the ebooklib/bs4 modules for one test and build a reader."""
+
+    def factory(
+        book: MockEpubBook,
+        *,
+        soup: MagicMock | None = None,
+        **reader_kwargs: object,
+    ) -> EbooklibEpubReader:
+        mock_epub = MagicMock()
+        mock_epub.read_epub.return_value = book
+        monkeypatch.setattr("epub2audio.epub_reader.epub", mock_epub)
+        monkeypatch.setattr(
+            "epub2audio.epub_reader.BeautifulSoup",
+            soup if soup is not None else mock_bs_default,
+        )
+        return EbooklibEpubReader(**reader_kwargs)
 
-    reader = EbooklibEpubReader()
+    return factory
+
+
+def test_read_basic_epub(basic_mock_book: MockEpubBook, reader_factory) -> None:
+    """Test reading a basic EPUB file."""
+    reader = reader_factory(basic_mock_book)
     result = reader.read(Path("test.epub"))
 
     assert result.metadata.title == "Test Book"
@@ -639,93 +704,35 @@ def test_read_basic_epub(mock_bs: MagicMock, mock_epub: MagicMock) -> None:
     assert len(result.chapters) == 2
 
 
-@patch("epub2audio.epub_reader.ITEM_DOCUMENT", 1)  # Mock ITEM_DOCUMENT constant
-@patch("epub2audio.epub_reader.epub")
-@patch("epub2audio.epub_reader.BeautifulSoup")
-def test_read_skips_non_linear_items(mock_bs: MagicMock, mock_epub: MagicMock) -> None:
+def test_read_skips_non_linear_items(
+    non_linear_mock_book: MockEpubBook, reader_factory
+) -> None:
     """Test that non-linear spine items are skipped when skip_non_linear=True."""
-    mock_book = MockEpubBook(
-        title="Test Book",
-        spine=[
-            ("item1", True),
-            ("non_linear", "no"),  # Non-linear
-            ("item2", True),
-        ],
-    )
-    mock_epub.read_epub.return_value = mock_book
-
-    mock_soup_instance = MagicMock()
-    mock_soup_instance.title = None
-    mock_soup_instance.body = MagicMock()
-    mock_soup_instance.body.get_text.return_value = "Content"
-    mock_bs.return_value = mock_soup_instance
-
-    for item_id in ["item1", "non_linear", "item2"]:
-        if item := mock_book.get_item_with_id(item_id):
-            item.item_type = 1
-
-    reader = EbooklibEpubReader(skip_non_linear=True)
+    reader = reader_factory(non_linear_mock_book, skip_non_linear=True)
     result = reader.read(Path("test.epub"))
 
     assert len(result.chapters) == 2
 
 
-@patch("epub2audio.epub_reader.ITEM_DOCUMENT", 1)  # Mock ITEM_DOCUMENT constant
-@patch("epub2audio.epub_reader.epub")
-@patch("epub2audio.epub_reader.BeautifulSoup")
 def test_read_includes_non_linear_when_disabled(
-    mock_bs: MagicMock, mock_epub: MagicMock
+    non_linear_mock_book: MockEpubBook, reader_factory
 ) -> None:
     """Test that non-linear items are included when skip_non_linear=False."""
-    mock_book = MockEpubBook(
-        title="Test Book",
-        spine=[
-            ("item1", True),
-            ("non_linear", "no"),
-            ("item2", True),
-        ],
-    )
-    mock_epub.read_epub.return_value = mock_book
-
-    mock_soup_instance = MagicMock()
-    mock_soup_instance.title = None
-    mock_soup_instance.body = MagicMock()
-    mock_soup_instance.body.get_text.return_value = "Content"
-    mock_bs.return_value = mock_soup_instance
-
-    for item_id in ["item1", "non_linear", "item2"]:
-        if item := mock_book.get_item_with_id(item_id):
-            item.item_type = 1
-
-    reader = EbooklibEpubReader(skip_non_linear=False)
+    reader = reader_factory(non_linear_mock_book, skip_non_linear=False)
     result = reader.read(Path("test.epub"))
 
     assert len(result.chapters) == 3
 
 
-@patch("epub2audio.epub_reader.ITEM_DOCUMENT", 1)  # Mock ITEM_DOCUMENT constant
-@patch("epub2audio.epub_reader.epub")
-@patch("epub2audio.epub_reader.BeautifulSoup")
-def test_read_skips_empty_documents(mock_bs: MagicMock, mock_epub: MagicMock) -> None:
+def test_read_skips_empty_documents(basic_mock_book: MockEpubBook, reader_factory) -> None:
     """Test that documents with no text content are skipped."""
-    mock_book = MockEpubBook(
-        title="Test Book",
-        spine=[("item1", True), ("item2", True)],
-    )
-    mock_epub.read_epub.return_value = mock_book
 
-    mock_soup_instance = MagicMock()
-    mock_soup_instance.title = None
-    mock_soup_instance.body = MagicMock()
     # Second item has empty content
-    mock_soup_instance.body.get_text.side_effect = ["Content", "   "]
-    mock_bs.return_value = mock_soup_instance
-
-    for item_id in ["item1", "item2"]:
-        if item := mock_book.get_item_with_id(item_id):
-            item.item_type = 1
+    def soup_for(content, parser, **kwargs):
+        text = "   " if b"chapter two" in content else "Content"
+        return FakeSoup(title=None, body=FakeBody(text))
 
-    reader = EbooklibEpubReader()
+    reader = reader_factory(basic_mock_book, soup=MagicMock(side_effect=soup_for))
     result = reader.read(Path("test.epub"))
 
     assert len(result.chapters) == 1
@@ -745,74 +752,44 @@ def test_read_raises_error_when_dependencies_missing(mock_epub: MagicMock) -> No
 # ============================================================================
 
 
-@patch("epub2audio.epub_reader.ITEM_DOCUMENT", 1)  # Mock ITEM_DOCUMENT constant
-@patch("epub2audio.epub_reader.epub")
-@patch("epub2audio.epub_reader.BeautifulSoup")
-def test_read_uses_toc_titles(mock_bs: MagicMock, mock_epub: MagicMock) -> None:
+def test_read_uses_toc_titles(reader_factory) -> None:
     """Test that chapter titles from TOC are used."""
-    mock_book = MockEpubBook(
-        title="Test Book",
-        toc=[
-            MockTocItem(title="First Chapter", href="chapter1.xhtml"),
-            MockTocItem(title="Second Chapter", href="chapter2.xhtml"),
-        ],
-        spine=[("item1", True), ("item2", True)],
+    mock_book = _as_documents(
+        MockEpubBook(
+            title="Test Book",
+            toc=[
+                MockTocItem(title="First Chapter", href="chapter1.xhtml"),
+                MockTocItem(title="Second Chapter", href="chapter2.xhtml"),
+            ],
+            spine=[("item1", True), ("item2", True)],
+        )
     )
-    mock_epub.read_epub.return_value = mock_book
-
-    mock_soup_instance = MagicMock()
-    mock_soup_instance.title = None
-    mock_soup_instance.body = MagicMock()
-    mock_soup_instance.body.get_text.return_value = "Content"
-    mock_bs.return_value = mock_soup_instance
 
-    for item_id in ["item1", "item2"]:
-        if item := mock_book.get_item_with_id(item_id):
-            item.item_type = 1
-
-    reader = EbooklibEpubReader()
+    reader = reader_factory(mock_book)
     result = reader.read(Path("test.epub"))
 
     assert result.chapters[0].title == "First Chapter"
     assert result.chapters[1].title == "Second Chapter"
 
 
-@patch("epub2audio.epub_reader.ITEM_DOCUMENT", 1)  # Mock ITEM_DOCUMENT constant
-@patch("epub2audio.epub_reader.epub")
-@patch("epub2audio.epub_reader.BeautifulSoup")
-def test_read_falls_back_to_html_title(mock_bs: MagicMock, mock_epub: MagicMock) -> None:
+def test_read_falls_back_to_html_title(reader_factory) -> None:
     """Test falling back to HTML <title> when TOC doesn't have the chapter."""
     # TOC only has a different chapter, not the ones in spine
-    mock_book = MockEpubBook(
-        title="Test Book",
-        toc=[MockTocItem(title="Preface", href="preface.xhtml")],  # Not in spine
-        spine=[("item1", True), ("item2", True)],
+    mock_book = _as_documents(
+        MockEpubBook(
+            title="Test Book",
+            toc=[MockTocItem(title="Preface", href="preface.xhtml")],  # Not in spine
+            spine=[("item1", True), ("item2", True)],
+        )
     )
-    mock_epub.read_epub.return_value = mock_book
 
     # For second chapter, we want to have an HTML title
-    mock_soup_with_title = MagicMock()
-    mock_title = MagicMock()
-    mock_title.string = "HTML Chapter Title"
-    mock_soup_with_title.title = mock_title
-    mock_soup_with_title.body = MagicMock()
-    mock_soup_with_title.body.get_text.return_value = "Content"
-
-    call_count = [0]
-
-    def soup_side_effect(content, parser):
-        call_count[0] += 1
-        if call_count[0] == 2:
-            return mock_soup_with_title
-        return MagicMock(title=None, body=MagicMock(get_text=MagicMock(return_value="Content")))
-
-    mock_bs.side_effect = soup_side_effect
-
-    for item_id in ["item1", "item2"]:
-        if item := mock_book.get_item_with_id(item_id):
-            item.item_type = 1
+    def soup_for(content, parser, **kwargs):
+        if b"chapter two" in content:
+            return FakeSoup(title=FakeTag("HTML Chapter Title"), body=FakeBody("Content"))
+        return FakeSoup(title=None, body=FakeBody("Content"))
 
-    reader = EbooklibEpubReader()
+    reader = reader_factory(mock_book, soup=MagicMock(side_effect=soup_for))
     result = reader.read(Path("test.epub"))
 
     # First chapter falls back to filename-derived title (from "chapter1.xhtml")
@@ -919,6 +896,34 @@ def test_get_cover_item_epub2_style() -> None:
     assert result is cover_item
 
 
+def test_get_cover_item_epub2_style_ebooklib_meta_attrs() -> None:
+    """Test EPUB 2 cover lookup with ebooklib's (None, attrs) meta tuples."""
+    book = MockEpubBook()
+    cover_item = object()
+
+    book.get_metadata = lambda namespace, name: [
+        (None, {"name": "generator", "content": "tool"}),
+        (None, {"name": "cover", "content": "cover-img"}),
+    ]
+    book.get_item_by_id = lambda item_id: cover_item if item_id == "cover-img" else None
+
+    assert _get_cover_item(book) is cover_item
+
+
+def test_get_cover_item_epub2_style_skips_missing_cover_ids() -> None:
+    """A cover meta pointing at a missing item should fall through to the next one."""
+    book = MockEpubBook()
+    cover_item = object()
+
+    book.get_metadata = lambda namespace, name: [
+        (None, {"name": "cover", "content": "missing-img"}),
+        (None, {"name": "cover", "content": "cover-img"}),
+    ]
+    book.get_item_by_id = lambda item_id: cover_item if item_id == "cover-img" else None
+
+    assert _get_cover_item(book) is cover_item
+
+
 def test_get_cover_item_no_cover() -> None:
     """Test when no cover is present."""
     book = MockEpubBook()
@@ -956,12 +961,8 @@ def test_extract_metadata_cover_none_when_no_cover(mock_get_cover: MagicMock) ->
 
 
 @patch("epub2audio.epub_reader._get_cover_item")
-@patch("epub2audio.epub_reader.tempfile.NamedTemporaryFile")
-def test_extract_metadata_cover_extracted_when_present(
-    mock_tmp_file: MagicMock, mock_get_cover: MagicMock
-) -> None:
-    """Test that cover_image is extracted when cover is present."""
-    from pathlib import Path
+def test_extract_metadata_cover_extracted_when_present(mock_get_cover: MagicMock) -> None:
+    """Test that cover_image carries the cover bytes without touching disk."""
 
     @dataclass
     class MockCoverItem:
@@ -974,16 +975,9 @@ def test_extract_metadata_cover_extracted_when_present(
     cover_item = MockCoverItem()
     mock_get_cover.return_value = cover_item
 
-    # Mock temporary file
-    mock_file = MagicMock()
-    mock_file.name = "/tmp/epub_cover_abc123.jpg"
-    mock_tmp_file.return_value.__enter__ = MagicMock(return_value=mock_file)
-    mock_tmp_file.return_value.__exit__ = MagicMock(return_value=False)
-
     book = MockEpubBook(title="Book Title", author="Author Name", language="en")
 
     metadata = _extract_metadata(book, fallback_title="Fallback")
 
     assert metadata.title == "Book Title"
-    assert metadata.cover_image == Path("/tmp/epub_cover_abc123.jpg")
-    mock_file.write.assert_called_once_with(b"fake cover content")
+    assert metadata.cover_image == CoverImage(data=b"fake cover content", extension=".jpg")
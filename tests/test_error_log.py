@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timedelta
 import json
 from pathlib import Path
 
@@ -80,6 +81,23 @@ class TestErrorEntry:
         with pytest.raises(Exception):  # FrozenInstanceError from dataclasses
             entry.message = "modified"
 
+    def test_from_raw_round_trips_to_dict(self) -> None:
+        """_from_raw should rebuild an equal, still-frozen entry."""
+        entry = ErrorEntry(
+            category=ErrorCategory.AUDIO_STITCHING,
+            severity=ErrorSeverity.WARNING,
+            message="Gap detected",
+            timestamp="2024-01-01T00:00:00+00:00",
+            chapter_index=4,
+            details={"gap_ms": 120},
+        )
+
+        rebuilt = ErrorEntry._from_raw(entry.to_dict())
+
+        assert rebuilt == entry
+        with pytest.raises(Exception):
+            rebuilt.message = "modified"
+
 
 class TestErrorLog:
     """Tests for ErrorLog dataclass."""
@@ -119,6 +137,15 @@ class TestErrorLog:
         )
         assert log.errors[0].details == {"lufs": -12, "target": -16}
 
+    def test_add_error_keeps_details_by_reference(self) -> None:
+        """details should be stored and serialized without defensive copies."""
+        log = ErrorLog(book_slug="b", book_id="id", run_id="r")
+        details = {"segments": [1, 2, 3]}
+        entry = log.add_error(ErrorCategory.TTS_SIZE, ErrorSeverity.WARNING, "Split", details=details)
+
+        assert entry.details is details
+        assert entry.to_dict()["details"] is details
+
     def test_add_error_with_exception(self) -> None:
         """add_error should capture exception info."""
         log = ErrorLog(book_slug="b", book_id="id", run_id="r")
@@ -139,6 +166,19 @@ class TestErrorLog:
         assert entry.stack_trace is not None
         assert "ValueError: test exception" in entry.stack_trace
 
+    def test_add_error_skips_stack_trace_below_error(self) -> None:
+        """Warnings keep the exception summary but not the formatted traceback."""
+        log = ErrorLog(book_slug="b", book_id="id", run_id="r")
+
+        try:
+            raise ValueError("recoverable")
+        except ValueError as e:
+            entry = log.add_error(ErrorCategory.TTS_TRANSIENT, ErrorSeverity.WARNING, "Retrying", exc=e)
+
+        assert entry.exception_type == "ValueError"
+        assert entry.exception_message == "recoverable"
+        assert entry.stack_trace is None
+
     def test_add_error_without_exception(self) -> None:
         """add_error without exception should have None exception fields."""
         log = ErrorLog(book_slug="b", book_id="id", run_id="r")
@@ -174,6 +214,15 @@ class TestErrorLog:
         # Should be ISO format with Z or +00:00
         assert entry.timestamp.endswith("+00:00") or entry.timestamp.endswith("Z")
 
+    def test_add_error_timestamp_round_trips_through_fromisoformat(self) -> None:
+        """Timestamps keep the seconds-precision isoformat layout."""
+        log = ErrorLog(book_slug="b", book_id="id", run_id="r")
+        entry = log.add_error(ErrorCategory.UNKNOWN, ErrorSeverity.INFO, "test")
+
+        parsed = datetime.fromisoformat(entry.timestamp)
+        assert parsed.utcoffset() == timedelta(0)
+        assert parsed.isoformat(timespec="seconds") == entry.timestamp
+
     def test_to_dict_includes_metadata(self) -> None:
         """to_dict should include log metadata."""
         log = ErrorLog(
@@ -331,6 +380,78 @@ class TestErrorLogStore:
         assert data["error_count"] == 1
         assert data["errors"][0]["message"] == "Missing author"
 
+    def test_stack_trace_is_a_str_before_and_after_load(self, tmp_path: Path) -> None:
+        """Fresh and reloaded entries should expose the same joined stack trace."""
+        store = ErrorLogStore(tmp_path)
+        log = ErrorLog(book_slug="trace-book", book_id="id", run_id="r")
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError as exc:
+            entry = log.add_error(ErrorCategory.UNKNOWN, ErrorSeverity.ERROR, "failed", exc=exc)
+
+        store.save(log)
+        loaded = store.load("trace-book")
+
+        assert isinstance(entry.stack_trace, str)
+        assert loaded is not None
+        assert loaded.errors[0].stack_trace == entry.stack_trace
+
+    def test_save_and_load_without_orjson(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The stdlib json fallback should round-trip the same log."""
+        monkeypatch.setattr("epub2audio.error_log.orjson", None)
+        store = ErrorLogStore(tmp_path)
+        log = ErrorLog(book_slug="stdlib-json", book_id="id", run_id="r")
+        log.add_error(ErrorCategory.FILE_IO, ErrorSeverity.ERROR, "Disk read failed", details={"path": "a.wav"})
+
+        store.save(log)
+        loaded = store.load("stdlib-json")
+
+        assert loaded is not None
+        assert loaded.to_dict() == log.to_dict()
+
+    def test_append_entries_are_merged_on_load(self, tmp_path: Path) -> None:
+        """Entries appended after a save should show up on the next load."""
+        store = ErrorLogStore(tmp_path)
+        log = ErrorLog(book_slug="append-book", book_id="id", run_id="r1")
+        log.add_error(ErrorCategory.TTS_INPUT, ErrorSeverity.WARNING, "first")
+        store.save(log)
+
+        entry = log.add_error(ErrorCategory.TTS_SIZE, ErrorSeverity.ERROR, "second", chapter_index=2)
+        store.append(log, [entry])
+
+        loaded = store.load("append-book")
+        assert loaded is not None
+        assert [e.message for e in loaded.errors] == ["first", "second"]
+        assert loaded.errors[1].chapter_index == 2
+
+    def test_save_folds_sidecar_into_snapshot(self, tmp_path: Path) -> None:
+        """save should remove the ndjson sidecar so entries are not merged twice."""
+        store = ErrorLogStore(tmp_path, fsync_every=1)
+        log = ErrorLog(book_slug="fold-book", book_id="id", run_id="r1")
+        store.append(log, [log.add_error(ErrorCategory.UNKNOWN, ErrorSeverity.INFO, "only")])
+        sidecar = store._path_for("fold-book").with_suffix(".ndjson")
+        assert sidecar.exists()
+
+        store.save(log)
+
+        assert not sidecar.exists()
+        loaded = store.load("fold-book")
+        assert loaded is not None
+        assert [e.message for e in loaded.errors] == ["only"]
+
+    def test_load_skips_torn_sidecar_line(self, tmp_path: Path) -> None:
+        """An interrupted append should not hide the entries before it."""
+        store = ErrorLogStore(tmp_path)
+        log = ErrorLog(book_slug="torn-book", book_id="id", run_id="r1")
+        store.append(log, [log.add_error(ErrorCategory.UNKNOWN, ErrorSeverity.INFO, "kept")])
+        with store._path_for("torn-book").with_suffix(".ndjson").open("ab") as handle:
+            handle.write(b'{"book_id": "id", "run_')
+
+        loaded = store.load("torn-book")
+        assert loaded is not None
+        assert loaded.run_id == "r1"
+        assert [e.message for e in loaded.errors] == ["kept"]
+
     def test_save_is_atomic(self, tmp_path: Path) -> None:
         """Save should use atomic write (temp file then rename)."""
         store = ErrorLogStore(tmp_path)
@@ -423,6 +544,24 @@ class TestErrorLogStore:
         assert len(log2.errors) == 0
         assert log2.run_id == "run-2"
 
+    def test_get_logger_skips_full_load_for_different_run(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A run_id mismatch in the file head should not parse the whole log."""
+        store = ErrorLogStore(tmp_path)
+        log1 = ErrorLog(book_slug="head-book", book_id="id", run_id="run-1")
+        log1.add_error(ErrorCategory.EPUB_PARSING, ErrorSeverity.ERROR, "old error")
+        store.save(log1)
+
+        def fail_load(book_slug: str) -> None:
+            raise AssertionError("load should not be called")
+
+        monkeypatch.setattr(store, "load", fail_load)
+        log2 = store.get_logger(book_slug="head-book", book_id="id", run_id="run-2")
+
+        assert log2.run_id == "run-2"
+        assert log2.errors == []
+
     def test_save_and_load_with_all_categories(self, tmp_path: Path) -> None:
         """Saving and loading should preserve all error categories."""
         store = ErrorLogStore(tmp_path)
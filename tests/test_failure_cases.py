@@ -10,7 +10,10 @@ This module tests how the pipeline handles various failure scenarios:
 from __future__ import annotations
 
 from dataclasses import dataclass
+import threading
+import time
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -24,9 +27,9 @@ from epub2audio.tts_engine import (
     TtsTransientError,
     MlxTtsEngine,
 )
-from epub2audio.tts_pipeline import TtsSynthesisSettings, synthesize_text
+from epub2audio.tts_pipeline import TtsSynthesisSettings, iter_synthesize_text, synthesize_text
 from epub2audio.error_log import ErrorCategory, ErrorSeverity, ErrorLog, ErrorLogStore
-from epub2audio.interfaces import AudioChunk
+from epub2audio.interfaces import AudioChunk, BatchTtsEngine
 
 
 # ============================================================================
@@ -57,15 +60,16 @@ class MockEpubBook:
     spine: list[tuple[str, bool | str | None]] = ()
     cover: str | None = None
 
+    def __post_init__(self) -> None:
+        self._meta = {
+            "title": [(self.title, {})] if self.title else [],
+            "creator": [(self.author, {})] if self.author else [],
+            "language": [(self.language, {})] if self.language else [],
+        }
+
     def get_metadata(self, namespace: str, name: str) -> list:
         """Get metadata in ebooklib format."""
-        if name == "title" and self.title:
-            return [(self.title, {})]
-        if name == "creator" and self.author:
-            return [(self.author, {})]
-        if name == "language" and self.language:
-            return [(self.language, {})]
-        return []
+        return self._meta.get(name, [])
 
     def get_item_with_id(self, item_id: str) -> MockEpubItem | None:
         """Get item by ID."""
@@ -81,6 +85,17 @@ class MockEpubBook:
         return None
 
 
+class _NamespaceSoup(SimpleNamespace):
+    """Plain-attribute soup stand-in; calling it finds no tags to strip."""
+
+    def __call__(self, names: list[str]) -> list:
+        return []
+
+
+def _make_bs_mock(body_text: str) -> _NamespaceSoup:
+    return _NamespaceSoup(title=None, body=SimpleNamespace(get_text=lambda *args, **kwargs: body_text))
+
+
 # ============================================================================
 # Bad EPUB Tests
 # ============================================================================
@@ -116,11 +131,7 @@ class TestBadEpubHandling:
         mock_book = MockEpubBook(title="Empty Spine Book", spine=[])
         mock_epub.read_epub.return_value = mock_book
 
-        mock_soup = MagicMock()
-        mock_soup.title = None
-        mock_soup.body = MagicMock()
-        mock_soup.body.get_text.return_value = "Content"
-        mock_bs.return_value = mock_soup
+        mock_bs.return_value = _make_bs_mock("Content")
 
         reader = EbooklibEpubReader()
         result = reader.read(Path("empty_spine.epub"))
@@ -137,11 +148,7 @@ class TestBadEpubHandling:
         mock_book = MockEpubBook(title=None, author=None, language=None, spine=[("item1", True)])
         mock_epub.read_epub.return_value = mock_book
 
-        mock_soup = MagicMock()
-        mock_soup.title = None
-        mock_soup.body = MagicMock()
-        mock_soup.body.get_text.return_value = "Content"
-        mock_bs.return_value = mock_soup
+        mock_bs.return_value = _make_bs_mock("Content")
 
         reader = EbooklibEpubReader()
         result = reader.read(Path("no_metadata.epub"))
@@ -166,12 +173,8 @@ class TestBadEpubHandling:
         mock_epub.read_epub.return_value = mock_book
 
         # Mock BeautifulSoup to handle None content gracefully
-        mock_soup = MagicMock()
-        mock_soup.title = None
-        mock_soup.body = MagicMock()
         # When content extraction fails, empty text is returned
-        mock_soup.body.get_text.return_value = ""
-        mock_bs.return_value = mock_soup
+        mock_bs.return_value = _make_bs_mock("")
 
         reader = EbooklibEpubReader()
 
@@ -188,12 +191,8 @@ class TestBadEpubHandling:
         mock_epub.read_epub.return_value = mock_book
 
         # Mock BeautifulSoup to handle malformed HTML gracefully
-        mock_soup = MagicMock()
-        mock_soup.title = None
-        mock_soup.body = MagicMock()
         # Even with malformed HTML, BeautifulSoup should return something
-        mock_soup.body.get_text.return_value = ""
-        mock_bs.return_value = mock_soup
+        mock_bs.return_value = _make_bs_mock("")
 
         reader = EbooklibEpubReader()
         result = reader.read(Path("malformed_html.epub"))
@@ -211,11 +210,7 @@ class TestBadEpubHandling:
         mock_book.get_item_with_id = lambda item_id: None
         mock_epub.read_epub.return_value = mock_book
 
-        mock_soup = MagicMock()
-        mock_soup.title = None
-        mock_soup.body = MagicMock()
-        mock_soup.body.get_text.return_value = "Content"
-        mock_bs.return_value = mock_soup
+        mock_bs.return_value = _make_bs_mock("Content")
 
         reader = EbooklibEpubReader()
         result = reader.read(Path("missing_items.epub"))
@@ -414,6 +409,54 @@ class TestTtsPipelineFailures:
         assert attempts["count"] == 3
         assert len(chunks) == 1
 
+    def test_pipeline_prefetches_next_chunk_during_retry_flow(self, tmp_path: Path) -> None:
+        """Test the next chunk starts synthesizing before the first chunk is consumed."""
+        first_text = "The first sentence is here."
+        attempts = {"count": 0}
+        second_started = threading.Event()
+
+        class PrefetchProbeEngine:
+            def synthesize(self, text: str, voice: str | None = None, config: dict | None = None) -> AudioChunk:
+                if text == first_text:
+                    attempts["count"] += 1
+                    if attempts["count"] < 2:
+                        raise TtsTransientError("Temporary failure")
+                else:
+                    second_started.set()
+                path = tmp_path / f"{len(text)}_{attempts['count']}.wav"
+                path.write_bytes(b"fake wav")
+                return AudioChunk(index=0, path=path)
+
+        settings = TtsSynthesisSettings(
+            model_id="test",
+            max_chars=30,
+            min_chars=0,
+            hard_max_chars=None,
+            max_retries=5,
+            backoff_base=0.0,
+            backoff_jitter=0.0,
+            sample_rate=24000,
+            channels=1,
+            speed=1.0,
+            lang_code=None,
+            ref_audio=None,
+            ref_text=None,
+            ref_audio_id=None,
+        )
+
+        chunks = iter_synthesize_text(
+            f"{first_text} And a second one follows.",
+            PrefetchProbeEngine(),
+            settings,
+            sleep_fn=lambda _: None,
+        )
+        first = next(chunks)
+
+        # The worker is already on chunk two while chunk one is still held here.
+        assert second_started.wait(timeout=5)
+        assert attempts["count"] == 2
+        assert len([first, *chunks]) == 2
+
     def test_pipeline_gives_up_after_max_retries(self, tmp_path: Path) -> None:
         """Test pipeline gives up after max retries."""
         settings = TtsSynthesisSettings(
@@ -441,6 +484,64 @@ class TestTtsPipelineFailures:
         with pytest.raises(TtsTransientError, match="Always fails"):
             synthesize_text("Hello", AlwaysFailingEngine(), settings, sleep_fn=lambda _: None)
 
+    def test_pipeline_backs_off_exponentially_between_retries(self, tmp_path: Path) -> None:
+        """Test retry delays double each attempt and include the jitter factor."""
+        settings = TtsSynthesisSettings(
+            model_id="test",
+            max_chars=200,
+            min_chars=10,
+            hard_max_chars=None,
+            max_retries=3,
+            backoff_base=0.5,
+            backoff_jitter=0.1,
+            sample_rate=24000,
+            channels=1,
+            speed=1.0,
+            lang_code=None,
+            ref_audio=None,
+            ref_text=None,
+            ref_audio_id=None,
+        )
+
+        class AlwaysFailingEngine:
+            def synthesize(self, text: str, voice: str | None = None, config: dict | None = None) -> AudioChunk:
+                raise TtsTransientError("Always fails")
+
+        delays: list[float] = []
+        with pytest.raises(TtsTransientError):
+            synthesize_text("Backoff schedule", AlwaysFailingEngine(), settings, sleep_fn=delays.append)
+
+        assert delays == pytest.approx([0.55, 1.1, 2.2])
+
+    def test_pipeline_does_not_sleep_without_backoff(self, tmp_path: Path) -> None:
+        """Test a zero backoff retries immediately without calling sleep_fn."""
+        settings = TtsSynthesisSettings(
+            model_id="test",
+            max_chars=200,
+            min_chars=10,
+            hard_max_chars=None,
+            max_retries=2,
+            backoff_base=0.0,
+            backoff_jitter=0.0,
+            sample_rate=24000,
+            channels=1,
+            speed=1.0,
+            lang_code=None,
+            ref_audio=None,
+            ref_text=None,
+            ref_audio_id=None,
+        )
+
+        class AlwaysFailingEngine:
+            def synthesize(self, text: str, voice: str | None = None, config: dict | None = None) -> AudioChunk:
+                raise TtsTransientError("Always fails")
+
+        delays: list[float] = []
+        with pytest.raises(TtsTransientError):
+            synthesize_text("No backoff", AlwaysFailingEngine(), settings, sleep_fn=delays.append)
+
+        assert delays == []
+
     def test_pipeline_propagates_unexpected_errors(self, tmp_path: Path) -> None:
         """Test pipeline propagates unexpected (non-TTS) errors."""
         settings = TtsSynthesisSettings(
@@ -468,6 +569,139 @@ class TestTtsPipelineFailures:
         with pytest.raises(ValueError, match="Unexpected error"):
             synthesize_text("Hello", UnexpectedErrorEngine(), settings, sleep_fn=lambda _: None)
 
+    def test_parallel_synthesis_preserves_chunk_order(self, tmp_path: Path) -> None:
+        """Test concurrent synthesis emits chunks in segment order despite uneven latency."""
+        sentences = [f"Sentence number {word} is here." for word in ("one", "two", "three", "four", "five", "six")]
+        delays = {sentence: 0.05 * ((5 - idx) % 3) for idx, sentence in enumerate(sentences)}
+        failed_once: set[str] = set()
+        lock = threading.Lock()
+
+        class SlowFailingEngine:
+            def synthesize(self, text: str, voice: str | None = None, config: dict | None = None) -> AudioChunk:
+                time.sleep(delays[text])
+                with lock:
+                    if text not in failed_once:
+                        failed_once.add(text)
+                        raise TtsTransientError("Temporary failure")
+                path = tmp_path / f"{sentences.index(text)}.wav"
+                path.write_bytes(b"fake wav")
+                return AudioChunk(index=0, path=path)
+
+        settings = TtsSynthesisSettings(
+            model_id="test",
+            max_chars=30,
+            min_chars=0,
+            hard_max_chars=None,
+            max_retries=1,
+            backoff_base=0.0,
+            backoff_jitter=0.0,
+            sample_rate=24000,
+            channels=1,
+            speed=1.0,
+            lang_code=None,
+            ref_audio=None,
+            ref_text=None,
+            ref_audio_id=None,
+            max_concurrent=3,
+        )
+
+        chunks = synthesize_text(" ".join(sentences), SlowFailingEngine(), settings, sleep_fn=lambda _: None)
+
+        assert [chunk.path.name for chunk in chunks] == [f"{idx}.wav" for idx in range(len(sentences))]
+        assert failed_once == set(sentences)
+
+
+class TestTtsBatching:
+    """Test batched synthesis for engines that expose synthesize_batch."""
+
+    @staticmethod
+    def _settings(batch_size: int) -> TtsSynthesisSettings:
+        return TtsSynthesisSettings(
+            model_id="test",
+            max_chars=30,
+            min_chars=0,
+            hard_max_chars=None,
+            max_retries=1,
+            backoff_base=0.0,
+            backoff_jitter=0.0,
+            sample_rate=24000,
+            channels=1,
+            speed=1.0,
+            lang_code=None,
+            ref_audio=None,
+            ref_text=None,
+            ref_audio_id=None,
+            batch_size=batch_size,
+        )
+
+    def test_segments_are_sent_in_batches(self, tmp_path: Path) -> None:
+        """Test groups of segments reach synthesize_batch in order."""
+        batches: list[list[str]] = []
+        sentences = [f"Sentence number {word} is here." for word in ("one", "two", "three", "four", "five")]
+
+        class BatchEngine:
+            def synthesize(self, text: str, voice: str | None = None, config: dict | None = None) -> AudioChunk:
+                raise AssertionError("per-segment path should not be used")
+
+            def synthesize_batch(
+                self, texts: list[str], voice: str | None = None, configs: list[dict] | None = None
+            ) -> list[AudioChunk]:
+                batches.append(list(texts))
+                return [AudioChunk(index=0, path=tmp_path / f"{sentences.index(text)}.wav") for text in texts]
+
+        chunks = synthesize_text(" ".join(sentences), BatchEngine(), self._settings(3), sleep_fn=lambda _: None)
+
+        assert batches == [sentences[:3], sentences[3:]]
+        assert [chunk.path.name for chunk in chunks] == [f"{idx}.wav" for idx in range(5)]
+
+    def test_failed_batch_falls_back_to_per_segment_retry(self, tmp_path: Path) -> None:
+        """Test a batch-level TTS error reroutes its segments through the retry path."""
+        calls: list[str] = []
+
+        class FlakyBatchEngine:
+            def synthesize(self, text: str, voice: str | None = None, config: dict | None = None) -> AudioChunk:
+                calls.append(text)
+                return AudioChunk(index=0, path=tmp_path / f"{len(calls)}.wav")
+
+            def synthesize_batch(
+                self, texts: list[str], voice: str | None = None, configs: list[dict] | None = None
+            ) -> list[AudioChunk]:
+                raise TtsTransientError("Batch failed")
+
+        text = "The first sentence is here. And a second one follows."
+        chunks = synthesize_text(text, FlakyBatchEngine(), self._settings(4), sleep_fn=lambda _: None)
+
+        assert calls == ["The first sentence is here.", "And a second one follows."]
+        assert len(chunks) == 2
+
+    def test_failed_batch_redispatches_only_failing_half(self, tmp_path: Path) -> None:
+        """Test a failing batch is halved so the healthy half stays batched."""
+        batches: list[list[str]] = []
+        calls: list[str] = []
+        sentences = ["The alpha one is fine.", "The beta one is fine.", "The gamma one is bad.", "The delta one is fine."]
+
+        class PickyBatchEngine:
+            def synthesize(self, text: str, voice: str | None = None, config: dict | None = None) -> AudioChunk:
+                calls.append(text)
+                if "bad" in text:
+                    raise TtsInputError("unspeakable")
+                return AudioChunk(index=0, path=tmp_path / f"{sentences.index(text)}.wav")
+
+            def synthesize_batch(
+                self, texts: list[str], voice: str | None = None, configs: list[dict] | None = None
+            ) -> list[AudioChunk]:
+                batches.append(list(texts))
+                if any("bad" in text for text in texts):
+                    raise TtsInputError("unspeakable")
+                return [AudioChunk(index=0, path=tmp_path / f"{sentences.index(text)}.wav") for text in texts]
+
+        assert isinstance(PickyBatchEngine(), BatchTtsEngine)
+        chunks = synthesize_text(" ".join(sentences), PickyBatchEngine(), self._settings(4), sleep_fn=lambda _: None)
+
+        assert batches == [sentences, sentences[:2], sentences[2:]]
+        assert calls == sentences[2:]
+        assert [chunk.path.name for chunk in chunks] == ["0.wav", "1.wav", "3.wav"]
+
 
 # ============================================================================
 # Error Log Tests
@@ -528,6 +762,23 @@ class TestErrorLogResilience:
         result = store.load("test-book")
         assert result is None
 
+    def test_error_log_recovers_appended_entries_when_snapshot_corrupt(self, tmp_path: Path) -> None:
+        """Test entries appended to the sidecar survive a corrupted snapshot."""
+        store = ErrorLogStore(tmp_path)
+        log = store.get_logger("test-book", "book-id", "run-1")
+        entries = [
+            log.add_error(ErrorCategory.TTS_SYNTHESIS, ErrorSeverity.ERROR, "first"),
+            log.add_error(ErrorCategory.AUDIO_STITCHING, ErrorSeverity.WARNING, "second"),
+        ]
+        store.append(log, entries)
+
+        (tmp_path / "test-book.json").write_text("invalid json {{{")
+
+        result = ErrorLogStore(tmp_path).load("test-book")
+        assert result is not None
+        assert result.run_id == "run-1"
+        assert [entry.message for entry in result.errors] == ["first", "second"]
+
     def test_error_log_load_missing_file(self, tmp_path: Path) -> None:
         """Test loading from missing error log returns None."""
         store = ErrorLogStore(tmp_path)
@@ -2,138 +2,104 @@
 
 from __future__ import annotations
 
+import dataclasses
+import functools
+import logging
+import os
 import struct
 import subprocess
-import wave
 from pathlib import Path
-from typing import Any
-from unittest.mock import MagicMock, patch
+from typing import Sequence
+from unittest.mock import patch
 
 import pytest
 
-from epub2audio.config import Config, load_config
-from epub2audio.interfaces import AudioChunk
+from epub2audio.config import AudioConfig, Config, LoggingConfig, PathsConfig, TtsConfig
+from epub2audio.epub_reader import EbooklibEpubReader
+from epub2audio.interfaces import AudioChunk, BookMetadata, ChapterAudio, CoverImage
 from epub2audio.logging_setup import initialize_logging
-from epub2audio.pipeline import run_pipeline
-from epub2audio.utils import ensure_dir, generate_run_id
+from epub2audio.pipeline import _cleanup_cover_image, _materialize_cover_image, run_pipeline
+from epub2audio import tts_pipeline, utils
+from epub2audio.utils import ensure_dir
 
+# ffmpeg-heavy: keep these on one xdist worker; everything else is spread per test.
+pytestmark = pytest.mark.xdist_group("integration")
 
-# ============================================================================
-# Test fixtures
-# ============================================================================
 
-
-@pytest.fixture
-def sample_epub(tmp_path: Path) -> Path:
-    """Create a minimal valid EPUB file for testing."""
+@functools.cache
+def _ffmpeg_available() -> bool:
+    """Check if ffmpeg is available in the system (probed once per session)."""
     try:
-        from ebooklib import epub
-    except ImportError:
-        pytest.skip("ebooklib not installed")
-
-    epub_path = tmp_path / "test_book.epub"
-
-    # Create a minimal EPUB
-    book = epub.EpubBook()
-
-    # Set metadata
-    book.set_identifier("test-id-123")
-    book.set_title("Test Audiobook")
-    book.set_language("en")
-    book.add_author("Test Author")
-
-    # Create chapters
-    chapter1 = epub.EpubHtml(
-        title="Chapter One",
-        file_name="chapter1.xhtml",
-        content="<h1>Chapter One</h1><p>This is the first chapter with some sample text for the audiobook.</p>",
-    )
-    chapter2 = epub.EpubHtml(
-        title="Chapter Two",
-        file_name="chapter2.xhtml",
-        content="<h1>Chapter Two</h1><p>This is the second chapter with more sample text for the audiobook.</p>",
-    )
-
-    # Add chapters to the book
-    book.add_item(chapter1)
-    book.add_item(chapter2)
-
-    # Define the spine (reading order)
-    book.spine = ["nav", chapter1, chapter2]
+        result = subprocess.run(
+            ["ffmpeg", "-version"],
+            capture_output=True,
+            check=False,
+        )
+        return result.returncode == 0
+    except FileNotFoundError:
+        return False
 
-    # Set the table of contents
-    book.toc = (chapter1, chapter2)
 
-    # Add navigation files
-    book.add_item(epub.EpubNcx())
-    book.add_item(epub.EpubNav())
+requires_ffmpeg = pytest.mark.skipif(not _ffmpeg_available(), reason="ffmpeg not available")
 
-    # Write the EPUB
-    epub.write_epub(str(epub_path), book, {})
 
-    return epub_path
+# ============================================================================
+# Test fixtures
+# ============================================================================
 
 
 @pytest.fixture
-def sample_epub_with_cover(tmp_path: Path) -> Path:
-    """Create an EPUB with a cover image for testing."""
-    try:
-        from ebooklib import epub
-    except ImportError:
-        pytest.skip("ebooklib not installed")
-
-    epub_path = tmp_path / "test_book_cover.epub"
-
-    # Create a minimal EPUB with cover
-    book = epub.EpubBook()
-
-    # Set metadata
-    book.set_identifier("test-id-cover")
-    book.set_title("Book With Cover")
-    book.set_language("en")
-    book.add_author("Cover Author")
+def sample_epub(_session_sample_epub: Path, tmp_path: Path) -> Path:
+    """Per-test copy of the minimal EPUB built once per session."""
+    return _link_or_copy(_session_sample_epub, tmp_path / "test_book.epub")
 
-    # Create a simple cover image (1x1 red pixel JPEG)
-    cover_data = b"\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00\xff\xdb\x00C\x00\x03\x02\x02\x03\x02\x02\x03\x03\x03\x03\x04\x03\x03\x04\x05\x08\x05\x05\x04\x04\x05\n\x07\x07\x06\x08\x0c\n\x0c\x0c\x0b\n\x0b\x0b\r\x0e\x12\x10\r\x0e\x11\x0e\x0b\x0b\x10\x16\x10\x11\x13\x14\x15\x15\x15\x0c\x0f\x17\x18\x16\x14\x18\x12\x14\x15\x14\xff\xc0\x00\x0b\x08\x00\x01\x00\x01\x01\x01\x11\x00\xff\xc4\x00\x1f\x00\x00\x01\x05\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\xff\xc4\x00\xb5\x10\x00\x02\x01\x03\x03\x02\x04\x03\x05\x05\x04\x04\x00\x00\x01}\x01\x02\x03\x00\x04\x11\x05\x12!\x06\x13AQa\x07\"q\x142\x81\x91\xa1\x08#B\xb1\xc1R\x15r\xd1\xf0$3br\x82\t\n\x16\x17\x18\x19\x1a%&'()*456789:CDEFGHIJSTUVWXYZcdefghijstuvwxyz\x83\x84\x85\x86\x87\x88\x89\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\xa2\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\xb9\xba\xc2\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\xd7\xd8\xd9\xda\xe1\xe2\xe3\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf1\xf2\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xff\xc4\x00\x1f\x01\x00\x03\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\xff\xc4\x00\xb5\x11\x00\x02\x01\x02\x04\x04\x03\x04\x07\x05\x04\x04\x00\x01\x02w\x00\x01\x02\x03\x11\x04\x05!1\x06\x12AQ\x07q\x13\"2\x81\x08\x14B\x91\xa1\xb1\xc1\t#3R\xf0\x15br\xd1\n\x16\x17\x18\x19\x1a%&'()*456789:CDEFGHIJSTUVWXYZcdefghijstuvwxyz\x83\x84\x85\x86\x87\x88\x89\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\xa2\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\xb9\xba\xc2\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\xd7\xd8\xd9\xda\xe2\xe3\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf2\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xff\xda\x00\x08\x01\x01\x00\x00?\x00T\x9f\xff\xd9"
 
-    cover = epub.EpubItem(
-        uid="cover",
-        file_name="cover.jpg",
-        media_type="image/jpeg",
-        content=cover_data,
-    )
-    book.add_item(cover)
-
-    # Add a single chapter
-    chapter = epub.EpubHtml(
-        title="Single Chapter",
-        file_name="chapter.xhtml",
-        content="<h1>Single Chapter</h1><p>Content with cover image.</p>",
-    )
-    book.add_item(chapter)
-    book.spine = ["nav", chapter]
-    book.toc = (chapter,)
-
-    book.add_item(epub.EpubNcx())
-    book.add_item(epub.EpubNav())
+@pytest.fixture
+def sample_epub_with_cover(_session_sample_epub_with_cover: Path, tmp_path: Path) -> Path:
+    """Per-test copy of the EPUB with a cover image built once per session."""
+    return _link_or_copy(_session_sample_epub_with_cover, tmp_path / "test_book_cover.epub")
 
-    epub.write_epub(str(epub_path), book, {})
 
-    return epub_path
+def _link_or_copy(source: Path, target: Path) -> Path:
+    """Hard-link when source and target share a device, otherwise copy the bytes."""
+    if os.stat(source).st_dev == os.stat(target.parent).st_dev:
+        try:
+            os.link(source, target)
+            return target
+        except OSError:
+            pass
+    target.write_bytes(source.read_bytes())
+    return target
 
 
 def _create_minimal_wav(path: Path, sample_rate: int = 24000, channels: int = 1, duration_ms: int = 500) -> None:
     """Create a minimal valid WAV file for testing."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    num_samples = int(sample_rate * (duration_ms / 1000.0))
+    path.write_bytes(_silent_wav_bytes(sample_rate, channels, duration_ms))
 
-    with wave.open(str(path), "wb") as wav_file:
-        wav_file.setnchannels(channels)
-        wav_file.setsampwidth(2)  # 16-bit
-        wav_file.setframerate(sample_rate)
-        # Write silence (16-bit samples = 2 bytes per sample)
-        silence = b'\x00' * (num_samples * channels * 2)
-        wav_file.writeframes(silence)
+
+@functools.lru_cache(maxsize=None)
+def _silent_wav_bytes(sample_rate: int, channels: int, duration_ms: int) -> bytes:
+    """Header plus 16-bit silence for a canonical PCM WAV file."""
+    num_samples = int(sample_rate * (duration_ms / 1000.0))
+    data_len = num_samples * channels * 2
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_len,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,
+        channels,
+        sample_rate,
+        sample_rate * channels * 2,
+        channels * 2,
+        16,
+        b"data",
+        data_len,
+    )
+    return header + bytes(data_len)
 
 
 @pytest.fixture
@@ -149,8 +115,6 @@ def test_config(tmp_path: Path) -> Config:
     for d in (epubs, out, cache, logs, errors):
         ensure_dir(d)
 
-    from epub2audio.config import PathsConfig, LoggingConfig, TtsConfig, AudioConfig
-
     return Config(
         paths=PathsConfig(
             epubs=epubs,
@@ -202,6 +166,7 @@ class _MockTtsEngine:
         self.config = config
         self.cache_dir = cache_dir
         self.counter = 0
+        self._cached_silence_path: dict[tuple[int, int, int], Path] = {}
 
     def synthesize(self, text: str, voice: str | None = None, config: dict | None = None) -> AudioChunk:
         self.counter += 1
@@ -212,33 +177,132 @@ class _MockTtsEngine:
             / f"chunk_{self.counter:04d}.wav"
         )
         ensure_dir(chunk_path.parent)
-        _create_minimal_wav(
-            chunk_path,
-            sample_rate=self.config.tts.sample_rate,
-            channels=self.config.tts.channels,
-            duration_ms=500,
-        )
+        _link_or_copy(self._silence_wav(500), chunk_path)
         return AudioChunk(index=self.counter, path=chunk_path)
 
+    def _silence_wav(self, duration_ms: int) -> Path:
+        """Write each distinct silence WAV once; chunks hard-link to it."""
+        key = (self.config.tts.sample_rate, self.config.tts.channels, duration_ms)
+        path = self._cached_silence_path.get(key)
+        if path is None:
+            path = self.cache_dir / "tts" / "blobs" / f"silence_{key[0]}hz_{key[1]}ch_{key[2]}ms.wav"
+            _create_minimal_wav(path, sample_rate=key[0], channels=key[1], duration_ms=duration_ms)
+            self._cached_silence_path[key] = path
+        return path
+
 
 def _mock_build_engine(config: Config):
-    """Mock implementation of _build_engine."""
+    """Mock implementation of _build_engine.
+
+    Stateless: each call returns a fresh engine writing under the test's own
+    ``config.paths.cache``, so tests can run on separate xdist workers.
+    """
     return _MockTtsEngine(config, config.paths.cache)
 
 
+class _FakeMuxerPackager:
+    """Packager stand-in that writes an M4B skeleton instead of running ffmpeg."""
+
+    def package(
+        self,
+        chapters: Sequence[ChapterAudio],
+        metadata: BookMetadata,
+        out_path: Path,
+        cover_image: Path | None = None,
+    ) -> Path:
+        for chapter in chapters:
+            assert chapter.path.exists()
+        ensure_dir(out_path.parent)
+        title = (metadata.title or "").encode("utf-8")
+        out_path.write_bytes(
+            _mp4_box(b"ftyp", b"M4A \x00\x00\x02\x00M4A isom")
+            + _mp4_box(b"moov", _mp4_box(b"udta", title))
+            + _mp4_box(b"mdat", bytes(1024))
+        )
+        return out_path
+
+
+def _mp4_box(kind: bytes, payload: bytes) -> bytes:
+    return struct.pack(">I4s", 8 + len(payload), kind) + payload
+
+
+def _mock_build_packager(config: Config) -> _FakeMuxerPackager:
+    """Mock implementation of _build_packager."""
+    return _FakeMuxerPackager()
+
+
+@pytest.fixture
+def fast_config(test_config: Config) -> Config:
+    """test_config without the ffmpeg loudness pass, for runs with the fake muxer."""
+    return dataclasses.replace(test_config, audio=dataclasses.replace(test_config.audio, normalize=False))
+
+
 # ============================================================================
 # Integration tests
 # ============================================================================
 
 
+def test_epub_to_m4b_pipeline_with_fake_muxer(sample_epub: Path, fast_config: Config) -> None:
+    """Test the full pipeline flow without spawning ffmpeg."""
+    log_ctx = initialize_logging(fast_config, utils.generate_run_id())
+
+    with (
+        patch("epub2audio.pipeline._build_engine", _mock_build_engine),
+        patch("epub2audio.pipeline._build_packager", _mock_build_packager),
+    ):
+        results = run_pipeline(log_ctx, [sample_epub], fast_config, progress=None)
+
+    assert len(results) == 1
+    result = results[0]
+    assert result.status == "ok"
+    assert result.output_path == fast_config.paths.out / "test-audiobook" / "test-audiobook.m4b"
+    assert result.output_path.read_bytes()[4:8] == b"ftyp"
+    chapter_dir = fast_config.paths.cache / "chapters" / "test-audiobook"
+    assert len(list(chapter_dir.glob("*.wav"))) >= 2
+
+
+def test_epub_to_m4b_resumability_with_fake_muxer(sample_epub: Path, fast_config: Config) -> None:
+    """Test a second run skips a packaged book without spawning ffmpeg or reparsing the EPUB."""
+    with (
+        patch("epub2audio.pipeline._build_engine", _mock_build_engine),
+        patch("epub2audio.pipeline._build_packager", _mock_build_packager),
+        patch.object(EbooklibEpubReader, "read", autospec=True, side_effect=EbooklibEpubReader.read) as read,
+    ):
+        results_1 = run_pipeline(initialize_logging(fast_config, utils.generate_run_id()), [sample_epub], fast_config)
+        results_2 = run_pipeline(initialize_logging(fast_config, utils.generate_run_id()), [sample_epub], fast_config)
+
+    assert results_1[0].status == "ok"
+    assert results_2[0].status == "skipped"
+    assert results_2[0].book_slug == results_1[0].book_slug
+    assert results_2[0].output_path == results_1[0].output_path
+    assert read.call_count == 1
+
+
+def test_fast_skip_rechecks_state_and_output_root(sample_epub: Path, fast_config: Config) -> None:
+    """Test the unchanged-source skip is dropped when the state or output root no longer match."""
+    moved_config = dataclasses.replace(
+        fast_config, paths=dataclasses.replace(fast_config.paths, out=fast_config.paths.out.parent / "moved")
+    )
+    with (
+        patch("epub2audio.pipeline._build_engine", _mock_build_engine),
+        patch("epub2audio.pipeline._build_packager", _mock_build_packager),
+    ):
+        first = run_pipeline(initialize_logging(fast_config, utils.generate_run_id()), [sample_epub], fast_config)
+        moved = run_pipeline(initialize_logging(moved_config, utils.generate_run_id()), [sample_epub], moved_config)
+        (fast_config.paths.cache / "state" / f"{first[0].book_slug}.json").unlink()
+        rebuilt = run_pipeline(initialize_logging(fast_config, utils.generate_run_id()), [sample_epub], fast_config)
+
+    assert first[0].status == "ok"
+    assert moved[0].status == "ok"
+    assert moved[0].output_path == moved_config.paths.out / "test-audiobook" / "test-audiobook.m4b"
+    assert rebuilt[0].status == "ok"
+
+
 @pytest.mark.integration
+@requires_ffmpeg
 def test_epub_to_m4b_full_pipeline(sample_epub: Path, test_config: Config) -> None:
     """Test the full pipeline from EPUB to M4B output."""
-    # Skip if ffmpeg is not available
-    if not _ffmpeg_available():
-        pytest.skip("ffmpeg not available")
-
-    run_id = generate_run_id()
+    run_id = utils.generate_run_id()
     log_ctx = initialize_logging(test_config, run_id)
 
     # Patch _build_engine to return our mock TTS engine
@@ -270,13 +334,10 @@ def test_epub_to_m4b_full_pipeline(sample_epub: Path, test_config: Config) -> No
 
 
 @pytest.mark.integration
+@requires_ffmpeg
 def test_epub_to_m4b_with_cover(sample_epub_with_cover: Path, test_config: Config) -> None:
     """Test the pipeline preserves cover art in the M4B output."""
-    # Skip if ffmpeg is not available
-    if not _ffmpeg_available():
-        pytest.skip("ffmpeg not available")
-
-    run_id = generate_run_id()
+    run_id = utils.generate_run_id()
     log_ctx = initialize_logging(test_config, run_id)
 
     with patch("epub2audio.pipeline._build_engine", _mock_build_engine):
@@ -294,14 +355,11 @@ def test_epub_to_m4b_with_cover(sample_epub_with_cover: Path, test_config: Confi
 
 
 @pytest.mark.integration
+@requires_ffmpeg
 def test_epub_to_m4b_resumability(sample_epub: Path, test_config: Config) -> None:
     """Test that the pipeline can resume from a previous run."""
-    # Skip if ffmpeg is not available
-    if not _ffmpeg_available():
-        pytest.skip("ffmpeg not available")
-
     # First run
-    run_id_1 = generate_run_id()
+    run_id_1 = utils.generate_run_id()
     log_ctx_1 = initialize_logging(test_config, run_id_1)
 
     with patch("epub2audio.pipeline._build_engine", _mock_build_engine):
@@ -314,7 +372,7 @@ def test_epub_to_m4b_resumability(sample_epub: Path, test_config: Config) -> Non
     assert m4b_path_1.exists()
 
     # Second run - should skip processing since M4B already exists
-    run_id_2 = generate_run_id()
+    run_id_2 = utils.generate_run_id()
     log_ctx_2 = initialize_logging(test_config, run_id_2)
 
     with patch("epub2audio.pipeline._build_engine", _mock_build_engine):
@@ -324,19 +382,31 @@ def test_epub_to_m4b_resumability(sample_epub: Path, test_config: Config) -> Non
     assert results_2[0].status == "skipped"
 
 
-# ============================================================================
-# Helper functions
-# ============================================================================
+def test_materialized_cover_is_written_and_cleaned_up() -> None:
+    """Cover bytes become an epub_cover_* temp file that cleanup removes."""
+    logger = logging.getLogger("test-cover")
+    cover = CoverImage(data=b"fake cover content", extension=".png")
 
+    path = _materialize_cover_image(cover, logger)
 
-def _ffmpeg_available() -> bool:
-    """Check if ffmpeg is available in the system."""
-    try:
-        result = subprocess.run(
-            ["ffmpeg", "-version"],
-            capture_output=True,
-            check=False,
-        )
-        return result.returncode == 0
-    except FileNotFoundError:
-        return False
+    assert path is not None
+    assert path.name.startswith("epub_cover_")
+    assert path.suffix == ".png"
+    assert path.read_bytes() == b"fake cover content"
+    assert cover == CoverImage(data=b"fake cover content", extension=".png")
+    _cleanup_cover_image(path, logger)
+    assert not path.exists()
+
+
+def test_run_pipeline_clears_audio_memory_cache(sample_epub: Path, fast_config: Config) -> None:
+    """Test in-memory chunk hits do not outlive the book that produced them."""
+    with (
+        patch("epub2audio.pipeline._build_engine", _mock_build_engine),
+        patch("epub2audio.pipeline._build_packager", _mock_build_packager),
+        patch.object(tts_pipeline._AUDIO_MEMORY_CACHE, "clear", wraps=tts_pipeline._AUDIO_MEMORY_CACHE.clear) as clear,
+    ):
+        results = run_pipeline(initialize_logging(fast_config, utils.generate_run_id()), [sample_epub], fast_config)
+
+    assert results[0].status == "ok"
+    assert clear.call_count == 1
+    assert tts_pipeline._AUDIO_MEMORY_CACHE.stats().size == 0
@@ -1,6 +1,15 @@
 from __future__ import annotations
 
-from epub2audio.onnx_provider import render_onnx_provider_resolution, resolve_onnx_provider_chain
+import sys
+import types
+from unittest.mock import patch
+
+from epub2audio.onnx_provider import (
+    _available_onnx_providers,
+    get_available_onnx_providers,
+    render_onnx_provider_resolution,
+    resolve_onnx_provider_chain,
+)
 
 
 def test_resolve_provider_chain_linux_prefers_cpu() -> None:
@@ -37,3 +46,24 @@ def test_render_provider_resolution_linux_message() -> None:
         platform_name="linux",
     )
     assert "Auto resolved to CPUExecutionProvider on Linux." == message
+
+
+def test_available_providers_are_enumerated_once() -> None:
+    calls: list[int] = []
+
+    def get_available_providers() -> list[str]:
+        calls.append(1)
+        return ["CPUExecutionProvider"]
+
+    fake_ort = types.SimpleNamespace(get_available_providers=get_available_providers)
+    _available_onnx_providers.cache_clear()
+    try:
+        with patch.dict(sys.modules, {"onnxruntime": fake_ort}):
+            first = get_available_onnx_providers()
+            first.append("Mutated")
+            second = get_available_onnx_providers()
+    finally:
+        _available_onnx_providers.cache_clear()
+
+    assert second == ["CPUExecutionProvider"]
+    assert len(calls) == 1
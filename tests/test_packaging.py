@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 import struct
+from unittest.mock import patch
 import wave
 
 import pytest
@@ -24,62 +25,49 @@ from epub2audio.packaging import (
 
 
 class TestEnsureM4bPath:
-    def test_returns_path_when_already_m4b(self) -> None:
-        path = Path("output/book.m4b")
-        result = _ensure_m4b_path(path)
-        assert result == path
-
-    def test_returns_path_when_already_m4b_uppercase(self) -> None:
-        path = Path("output/book.M4B")
-        result = _ensure_m4b_path(path)
-        assert result == path
-
-    def test_changes_suffix_to_m4b(self) -> None:
-        path = Path("output/book.mp3")
-        result = _ensure_m4b_path(path)
-        assert result == Path("output/book.m4b")
-
-    def test_adds_m4b_suffix_when_no_suffix(self) -> None:
-        path = Path("output/book")
-        result = _ensure_m4b_path(path)
-        assert result == Path("output/book.m4b")
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            (Path("output/book.m4b"), Path("output/book.m4b")),
+            (Path("output/book.M4B"), Path("output/book.M4B")),
+            (Path("output/book.mp3"), Path("output/book.m4b")),
+            (Path("output/book"), Path("output/book.m4b")),
+        ],
+        ids=["already-m4b", "already-m4b-uppercase", "changes-suffix", "adds-suffix"],
+    )
+    def test_ensure_m4b_path(self, path: Path, expected: Path) -> None:
+        assert _ensure_m4b_path(path) == expected
 
 
 class TestEscapeMetadataValue:
-    def test_escapes_backslashes(self) -> None:
-        assert _escape_metadata_value(r"test\value") == r"test\\value"
-
-    def test_escapes_newlines(self) -> None:
-        assert _escape_metadata_value("test\nvalue") == r"test\nvalue"
-
-    def test_escapes_equals_sign(self) -> None:
-        assert _escape_metadata_value("test=value") == r"test\=value"
-
-    def test_escapes_semicolon(self) -> None:
-        assert _escape_metadata_value("test;value") == r"test\;value"
-
-    def test_escapes_hash(self) -> None:
-        assert _escape_metadata_value("test#value") == r"test\#value"
-
-    def test_escapes_multiple_special_chars(self) -> None:
-        assert _escape_metadata_value(r"a\b=c;d#e") == r"a\\b\=c\;d\#e"
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (r"test\value", r"test\\value"),
+            ("test\nvalue", r"test\nvalue"),
+            ("test=value", r"test\=value"),
+            ("test;value", r"test\;value"),
+            ("test#value", r"test\#value"),
+            (r"a\b=c;d#e", r"a\\b\=c\;d\#e"),
+        ],
+        ids=["backslash", "newline", "equals", "semicolon", "hash", "multiple"],
+    )
+    def test_escapes_special_chars(self, value: str, expected: str) -> None:
+        assert _escape_metadata_value(value) == expected
 
 
 class TestEscapeConcatPath:
-    def test_escapes_single_quotes(self) -> None:
-        path = Path("/path/to/file's name.wav")
-        result = _escape_concat_path(path)
-        assert result == "/path/to/file'\\''s name.wav"
-
-    def test_does_not_escape_double_quotes(self) -> None:
-        path = Path('/path/to/file"name.wav')
-        result = _escape_concat_path(path)
-        assert result == '/path/to/file"name.wav'
-
-    def test_no_quotes_returns_unchanged(self) -> None:
-        path = Path("/path/to/file.wav")
-        result = _escape_concat_path(path)
-        assert result == "/path/to/file.wav"
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            (Path("/path/to/file's name.wav"), "/path/to/file'\\''s name.wav"),
+            (Path('/path/to/file"name.wav'), '/path/to/file"name.wav'),
+            (Path("/path/to/file.wav"), "/path/to/file.wav"),
+        ],
+        ids=["single-quote", "double-quote-unchanged", "no-quotes"],
+    )
+    def test_escape_concat_path(self, path: Path, expected: str) -> None:
+        assert _escape_concat_path(path) == expected
 
 
 class TestWavDurationMs:
@@ -93,8 +81,7 @@ class TestWavDurationMs:
             wav_file.setsampwidth(2)  # 16-bit
             wav_file.setframerate(sample_rate)
             # Write silence
-            data = struct.pack("<" + "h" * num_samples, *[0] * num_samples)
-            wav_file.writeframes(data)
+            wav_file.writeframes(bytes(2 * num_samples))
 
         duration = _wav_duration_ms(wav_path)
         assert duration == 500  # 0.5 seconds = 500ms
@@ -122,6 +109,28 @@ class TestWavDurationMs:
         duration = _wav_duration_ms(wav_path)
         assert duration == 0
 
+    def test_skips_chunks_before_data(self, tmp_path: Path) -> None:
+        wav_path = tmp_path / "test.wav"
+        list_payload = b"INFOISFT\x0e\x00\x00\x00Lavf60.16.100\x00"
+        fmt = struct.pack("<HHIIHH", 1, 2, 22050, 22050 * 4, 4, 16)
+        data = bytes(22050 * 4 // 4)  # 0.25 seconds of stereo 16-bit
+        body = (
+            b"WAVE"
+            + b"fmt " + struct.pack("<I", len(fmt)) + fmt
+            + b"LIST" + struct.pack("<I", len(list_payload)) + list_payload
+            + b"data" + struct.pack("<I", len(data)) + data
+        )
+        wav_path.write_bytes(b"RIFF" + struct.pack("<I", len(body)) + body)
+
+        assert _wav_duration_ms(wav_path) == 250
+
+    def test_raises_for_non_wav_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "test.wav"
+        path.write_bytes(b"not a wav file at all")
+
+        with pytest.raises(RuntimeError, match="Not a RIFF/WAVE file"):
+            _wav_duration_ms(path)
+
 
 class TestValidateChapterFiles:
     def test_passes_when_all_files_exist(self, tmp_path: Path) -> None:
@@ -181,7 +190,7 @@ class TestResolveCoverImage:
             result = _resolve_cover_image(cover, logger)
 
         assert result is None
-        assert "Cover image missing" in caplog.text
+        assert any("Cover image missing" in record.getMessage() for record in caplog.records)
 
     def test_returns_none_when_file_is_empty(self, tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
         cover = tmp_path / "empty.jpg"
@@ -192,7 +201,7 @@ class TestResolveCoverImage:
             result = _resolve_cover_image(cover, logger)
 
         assert result is None
-        assert "Cover image is empty" in caplog.text
+        assert any("Cover image is empty" in record.getMessage() for record in caplog.records)
 
 
 class TestBuildFfmpegCmd:
@@ -303,21 +312,23 @@ class TestWriteConcatFile:
         assert "'\\''" in content
 
 
-class TestWriteMetadataFile:
-    @staticmethod
-    def _create_minimal_wav(path: Path) -> None:
-        """Create a minimal valid WAV file for testing."""
-        with wave.open(str(path), "wb") as wav_file:
-            wav_file.setnchannels(1)
-            wav_file.setsampwidth(2)
-            wav_file.setframerate(24000)
-            # Write a single frame of silence
-            wav_file.writeframes(struct.pack("<h", 0))
+@pytest.fixture(scope="module")
+def minimal_wav(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A single-frame 24 kHz WAV shared read-only by the metadata tests."""
+    path = tmp_path_factory.mktemp("wav") / "chapter.wav"
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(24000)
+        # Write a single frame of silence
+        wav_file.writeframes(struct.pack("<h", 0))
+    return path
 
-    def test_writes_metadata_with_title_and_author(self, tmp_path: Path) -> None:
+
+class TestWriteMetadataFile:
+    def test_writes_metadata_with_title_and_author(self, tmp_path: Path, minimal_wav: Path) -> None:
         meta_path = tmp_path / "metadata.txt"
-        chapter = tmp_path / "chapter.wav"
-        self._create_minimal_wav(chapter)
+        chapter = minimal_wav
 
         chapters = [ChapterAudio(index=0, title="Chapter 1", path=chapter)]
         metadata = BookMetadata(title="Test Book", author="Test Author")
@@ -332,10 +343,9 @@ class TestWriteMetadataFile:
         assert "genre=Audiobook" in content
         assert "stik=2" in content
 
-    def test_writes_metadata_with_author_only(self, tmp_path: Path) -> None:
+    def test_writes_metadata_with_author_only(self, tmp_path: Path, minimal_wav: Path) -> None:
         meta_path = tmp_path / "metadata.txt"
-        chapter = tmp_path / "chapter.wav"
-        self._create_minimal_wav(chapter)
+        chapter = minimal_wav
 
         chapters = [ChapterAudio(index=0, title="Chapter 1", path=chapter)]
         metadata = BookMetadata(title="", author="Test Author")
@@ -353,10 +363,9 @@ class TestWriteMetadataFile:
         assert metadata_lines[0] == "artist=Test Author"
         assert "album=" not in metadata_lines[0]
 
-    def test_writes_chapter_markers(self, tmp_path: Path) -> None:
+    def test_writes_chapter_markers(self, tmp_path: Path, minimal_wav: Path) -> None:
         meta_path = tmp_path / "metadata.txt"
-        chapter = tmp_path / "chapter.wav"
-        self._create_minimal_wav(chapter)
+        chapter = minimal_wav
 
         chapters = [
             ChapterAudio(index=0, title="First Chapter", path=chapter),
@@ -372,10 +381,9 @@ class TestWriteMetadataFile:
         assert "END=1" in content  # Single frame at 24000Hz ≈ 0.04ms, rounded to 1ms
         assert "title=First Chapter" in content
 
-    def test_generates_chapter_title_when_missing(self, tmp_path: Path) -> None:
+    def test_generates_chapter_title_when_missing(self, tmp_path: Path, minimal_wav: Path) -> None:
         meta_path = tmp_path / "metadata.txt"
-        chapter = tmp_path / "chapter.wav"
-        self._create_minimal_wav(chapter)
+        chapter = minimal_wav
 
         chapters = [ChapterAudio(index=2, title="", path=chapter)]
         metadata = BookMetadata(title="Book", author=None)
@@ -385,10 +393,9 @@ class TestWriteMetadataFile:
         content = meta_path.read_text()
         assert "title=Chapter 3" in content  # index 2 + 1 = Chapter 3
 
-    def test_escapes_special_chars_in_metadata(self, tmp_path: Path) -> None:
+    def test_escapes_special_chars_in_metadata(self, tmp_path: Path, minimal_wav: Path) -> None:
         meta_path = tmp_path / "metadata.txt"
-        chapter = tmp_path / "chapter.wav"
-        self._create_minimal_wav(chapter)
+        chapter = minimal_wav
 
         chapters = [ChapterAudio(index=0, title="Chapter: Test; Value", path=chapter)]
         metadata = BookMetadata(title="Book: Title", author="Author; Name")
@@ -410,6 +417,18 @@ class TestRunFfmpeg:
         with pytest.raises(RuntimeError, match="ffmpeg is required"):
             _run_ffmpeg(cmd, logger)
 
+    def test_raises_without_spawning_when_ffmpeg_not_on_path(self) -> None:
+        logger = logging.getLogger(__name__)
+
+        with (
+            patch("epub2audio.packaging._FFMPEG_PATH", None),
+            patch("epub2audio.packaging.subprocess.run") as run,
+        ):
+            with pytest.raises(RuntimeError, match="ffmpeg is required"):
+                _run_ffmpeg(["ffmpeg", "-version"], logger)
+
+        run.assert_not_called()
+
     def test_raises_on_nonzero_exit_code(self, tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
         logger = logging.getLogger(__name__)
         # Use a command that will fail
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from contextlib import nullcontext
 import json
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from epub2audio.interfaces import PipelineState
@@ -13,6 +16,7 @@ from epub2audio.state_store import (
     _coerce_steps,
     _serialize_state,
 )
+from epub2audio.utils import slugify
 
 
 class TestJsonStateStore:
@@ -33,6 +37,34 @@ class TestJsonStateStore:
         assert path.name == "unsafe-book-id.json"
         assert path.parent == tmp_path
 
+    def test_path_for_reuses_cached_slug(self, tmp_path: Path) -> None:
+        """Repeated lookups for one book_id should slugify it only once."""
+        store = JsonStateStore(tmp_path)
+        book_id = "Cached Slug Book (path_for)"
+
+        with patch("epub2audio.state_store.slugify", wraps=slugify) as slugify_mock:
+            first = store._path_for(book_id)
+            second = store._path_for(book_id)
+
+        assert first == second == tmp_path / "cached-slug-book-path-for.json"
+        assert slugify_mock.call_count == 1
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_save_and_load_surrogate_escaped_path(self, tmp_path: Path, use_orjson: bool) -> None:
+        """Undecodable filename bytes (surrogate escapes) should round-trip."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        store = JsonStateStore(tmp_path)
+        source_path = os.fsdecode(b"/books/caf\xe9.epub")
+        state = PipelineState(book_id="surrogate", steps={}, artifacts={"source_path": source_path})
+
+        with patch("epub2audio.state_store.orjson", None) if not use_orjson else nullcontext():
+            store.save(state)
+            loaded = store.load("surrogate")
+
+        assert loaded is not None
+        assert loaded.artifacts["source_path"] == source_path
+
     def test_load_returns_none_for_missing_file(self, tmp_path: Path) -> None:
         """Loading a non-existent state should return None."""
         store = JsonStateStore(tmp_path)
@@ -121,6 +153,19 @@ class TestJsonStateStore:
         # Verify no temp file exists after successful save
         assert not path.with_suffix(".json.tmp").exists()
 
+    def test_save_skips_write_when_state_unchanged(self, tmp_path: Path) -> None:
+        """Re-saving identical state should not rewrite the file."""
+        store = JsonStateStore(tmp_path)
+        state = PipelineState(book_id="same-book", steps={"step1": True}, artifacts={"key1": "value1"})
+
+        with patch("epub2audio.utils.os.replace", wraps=os.replace) as replace:
+            store.save(state)
+            store.save(PipelineState(book_id="same-book", steps={"step1": True}, artifacts={"key1": "value1"}))
+            assert replace.call_count == 1
+
+            store.save(PipelineState(book_id="same-book", steps={"step1": True, "step2": True}, artifacts={}))
+            assert replace.call_count == 2
+
     def test_save_creates_json_file(self, tmp_path: Path) -> None:
         """Saved file should be valid JSON."""
         store = JsonStateStore(tmp_path)
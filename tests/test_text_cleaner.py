@@ -173,6 +173,12 @@ class TestControlCharacterRemoval:
         result = cleaner.clean(text)
         assert result == "Hello World"
 
+    def test_control_chars_removed_in_non_ascii_text(self, cleaner: BasicTextCleaner) -> None:
+        """Non-ASCII text also drops C0 and C1 control characters."""
+        text = "Caf\u00e9\x00au\x85lait\x7f"
+        result = cleaner.clean(text)
+        assert result == "Caf\u00e9 au lait"
+
     def test_tab_preserved(self, cleaner: BasicTextCleaner) -> None:
         """Tabs are preserved (treated as whitespace, collapsed)."""
         text = "Hello\tWorld"
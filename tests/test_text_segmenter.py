@@ -147,6 +147,17 @@ Third paragraph to finish."""
         # This is expected behavior - it treats '.' as sentence boundary
         assert "1." in segments[0].text or "1.23" in segments[0].text
 
+    def test_short_text_is_normalized_into_one_segment(self) -> None:
+        segmenter = BasicTextSegmenter(max_chars=100, min_chars=10)
+        segments = list(segmenter.segment("  Short   text here.  Next one "))
+        assert segments == [Segment(index=0, text="Short text here. Next one.")]
+
+    def test_short_text_that_grows_when_joined_is_still_packed(self) -> None:
+        # 11 raw characters fit, but the sentence split inserts spaces.
+        segmenter = BasicTextSegmenter(max_chars=12, min_chars=0)
+        segments = list(segmenter.segment("ab.cd.ef.gh"))
+        assert [segment.text for segment in segments] == ["ab. cd. ef.", "gh."]
+
     def test_ellipsis_in_middle_of_text(self) -> None:
         segmenter = BasicTextSegmenter(max_chars=100, min_chars=10)
         text = "And then... suddenly it happened!"
@@ -0,0 +1,98 @@
+"""Tests for the in-memory chunk cache tier."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from epub2audio.audio_cache import AudioCacheLayout
+from epub2audio.interfaces import AudioChunk, TtsEngine
+from epub2audio.tts_cache import PhonemeAudioCache
+from epub2audio.tts_pipeline import TtsSynthesisSettings, clear_audio_memory_cache, synthesize_text
+
+
+def test_get_or_compute_returns_cached_chunk(tmp_path: Path) -> None:
+    cache = PhonemeAudioCache(capacity=4)
+    path = tmp_path / "chunk.wav"
+    calls: list[Path] = []
+
+    def compute() -> AudioChunk:
+        calls.append(path)
+        return AudioChunk(index=0, path=path, duration_ms=500)
+
+    first = cache.get_or_compute(path, compute)
+    second = cache.get_or_compute(path, compute)
+
+    assert first == second == AudioChunk(index=0, path=path, duration_ms=500)
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+
+def test_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = PhonemeAudioCache(capacity=2)
+    calls: list[str] = []
+
+    def compute(name: str):
+        def _compute() -> AudioChunk:
+            calls.append(name)
+            return AudioChunk(index=0, path=tmp_path / name)
+
+        return _compute
+
+    for name in ("a", "b", "a", "c", "a", "b"):
+        cache.get_or_compute(tmp_path / name, compute(name))
+
+    assert calls == ["a", "b", "c", "b"]
+    assert cache.stats().size == 2
+
+
+def test_failed_compute_is_not_cached(tmp_path: Path) -> None:
+    cache = PhonemeAudioCache()
+    path = tmp_path / "chunk.wav"
+
+    def fail() -> AudioChunk:
+        raise RuntimeError("boom")
+
+    for _ in range(2):
+        try:
+            cache.get_or_compute(path, fail)
+        except RuntimeError:
+            pass
+
+    assert cache.stats().size == 0
+    assert cache.stats().misses == 2
+
+
+def test_repeated_text_skips_engine_across_calls(tmp_path: Path) -> None:
+    clear_audio_memory_cache()
+    calls: list[str] = []
+
+    class DummyEngine(TtsEngine):
+        def synthesize(self, text: str, voice: str | None = None, config: dict | None = None) -> AudioChunk:
+            calls.append(text)
+            return AudioChunk(index=0, path=Path(str(config["output_path"])), duration_ms=250)
+
+    settings = TtsSynthesisSettings(
+        model_id="test",
+        max_chars=200,
+        min_chars=10,
+        hard_max_chars=None,
+        max_retries=1,
+        backoff_base=0.0,
+        backoff_jitter=0.0,
+        sample_rate=24000,
+        channels=1,
+        speed=1.0,
+        lang_code=None,
+        ref_audio=None,
+        ref_text=None,
+        ref_audio_id=None,
+    )
+    cache = AudioCacheLayout(tmp_path)
+
+    first = synthesize_text("Chapter One.", DummyEngine(), settings, cache=cache, sleep_fn=lambda _: None)
+    second = synthesize_text("Chapter One.", DummyEngine(), settings, cache=cache, sleep_fn=lambda _: None)
+
+    assert calls == ["Chapter One."]
+    assert first == second
+    clear_audio_memory_cache()
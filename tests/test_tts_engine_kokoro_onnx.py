@@ -1,11 +1,19 @@
 from __future__ import annotations
 
 from pathlib import Path
+import sys
+import threading
+import types
 
 import pytest
 
 from epub2audio.tts_engine import TtsInputError, TtsSizeError
-from epub2audio.tts_engine_kokoro_onnx import KokoroOnnxTtsEngine
+from epub2audio.tts_engine_kokoro_onnx import (
+    KokoroOnnxTtsEngine,
+    _extract_audio_result,
+    _float_to_pcm16,
+    _shared_kokoro_runtime,
+)
 
 
 def test_kokoro_engine_rejects_empty_input(tmp_path: Path) -> None:
@@ -35,3 +43,129 @@ def test_kokoro_engine_writes_audio_with_mocked_runtime(tmp_path: Path, monkeypa
     assert chunk.path == out_path
     assert out_path.exists()
     assert out_path.stat().st_size > 0
+
+
+def test_kokoro_engine_synthesize_batch_validates_before_generating(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    engine = KokoroOnnxTtsEngine(model_id="test", output_dir=tmp_path, max_input_tokens=3)
+    engine._kokoro = object()  # type: ignore[attr-defined]
+    monkeypatch.setattr(engine, "ensure_loaded", lambda: None)
+    generated: list[str] = []
+
+    def fake_generate(runtime: object, text: str, **kwargs: object) -> tuple[list[float], int, int]:
+        generated.append(text)
+        return [0.0, 0.2, -0.2, 0.0], 24000, 1
+
+    monkeypatch.setattr("epub2audio.tts_engine_kokoro_onnx._generate_audio", fake_generate)
+
+    with pytest.raises(TtsSizeError):
+        engine.synthesize_batch(["Hi.", "One two three four"])
+    assert generated == []
+
+    paths = [tmp_path / "a.wav", tmp_path / "b.wav"]
+    chunks = engine.synthesize_batch(
+        ["Hi.", "Bye."],
+        configs=[{"output_path": paths[0]}, {"output_path": paths[1]}],
+    )
+
+    assert [chunk.path for chunk in chunks] == paths
+    assert generated == ["Hi.", "Bye."]
+    assert all(path.stat().st_size > 0 for path in paths)
+
+
+def test_kokoro_runtime_is_shared_per_model_and_providers(tmp_path: Path) -> None:
+    class FakeKokoro:
+        instances = 0
+
+        def __init__(self, model_path: str, voices_path: str, providers: list[str] | None = None) -> None:
+            FakeKokoro.instances += 1
+
+    model_path = tmp_path / "model.onnx"
+    voices_path = tmp_path / "voices.bin"
+    first = _shared_kokoro_runtime(
+        FakeKokoro, model_path=model_path, voices_path=voices_path, providers=["CPUExecutionProvider"]
+    )
+    second = _shared_kokoro_runtime(
+        FakeKokoro, model_path=model_path, voices_path=voices_path, providers=["CPUExecutionProvider"]
+    )
+    other = _shared_kokoro_runtime(
+        FakeKokoro, model_path=model_path, voices_path=voices_path, providers=["CoreMLExecutionProvider"]
+    )
+
+    assert first is second
+    assert other[0] is not first[0]
+    assert FakeKokoro.instances == 2
+
+
+def test_float_to_pcm16_numpy_matches_pure_python() -> None:
+    np = pytest.importorskip("numpy")
+    samples = [0.0, 0.5, -0.5, 1.0, -1.0, 1.7, -3.2, 0.123456, -0.999999]
+
+    assert _float_to_pcm16(np.asarray(samples, dtype=np.float32)) == _float_to_pcm16(
+        [float(value) for value in np.asarray(samples, dtype=np.float32)]
+    )
+    assert _float_to_pcm16(np.asarray(samples)) == _float_to_pcm16(samples)
+
+
+def test_extract_audio_result_keeps_ndarray_output() -> None:
+    np = pytest.importorskip("numpy")
+    mono = np.asarray([0.1, -0.2, 0.3], dtype=np.float32)
+    stereo = np.asarray([[0.1, 0.2], [-0.1, -0.2]], dtype=np.float32)
+
+    audio, rate, channels = _extract_audio_result((mono, 22050), fallback_rate=24000)
+    assert audio is mono
+    assert (rate, channels) == (22050, 1)
+
+    audio, _, channels = _extract_audio_result(stereo, fallback_rate=24000)
+    assert isinstance(audio, np.ndarray)
+    assert channels == 2
+    assert _extract_audio_result(stereo.tolist(), fallback_rate=24000)[0] == audio.tolist()
+
+
+def _install_fake_kokoro(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    class FakeKokoro:
+        def __init__(self, model_path: str, voices_path: str, providers: list[str] | None = None) -> None:
+            pass
+
+    monkeypatch.setitem(
+        sys.modules,
+        "huggingface_hub",
+        types.SimpleNamespace(hf_hub_download=lambda repo_id, filename: str(tmp_path / filename)),
+    )
+    monkeypatch.setitem(sys.modules, "kokoro_onnx", types.SimpleNamespace(Kokoro=FakeKokoro))
+
+
+@pytest.mark.parametrize("share_runtime", [False, True])
+def test_kokoro_workers_overlap_unless_runtime_is_shared(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, share_runtime: bool
+) -> None:
+    _install_fake_kokoro(monkeypatch, tmp_path)
+    # Both workers must be inside _generate_audio at once to pass the barrier.
+    barrier = threading.Barrier(2, timeout=1)
+    overlapped: list[bool] = []
+
+    def fake_generate(*args: object, **kwargs: object) -> tuple[list[float], int, int]:
+        try:
+            barrier.wait()
+            overlapped.append(True)
+        except threading.BrokenBarrierError:
+            overlapped.append(False)
+        return [0.0, 0.1], 24000, 1
+
+    monkeypatch.setattr("epub2audio.tts_engine_kokoro_onnx._generate_audio", fake_generate)
+    engines = [
+        KokoroOnnxTtsEngine(model_id=f"test-{share_runtime}", output_dir=tmp_path / str(idx), share_runtime=share_runtime)
+        for idx in range(2)
+    ]
+    workers = [
+        threading.Thread(target=engine.synthesize, args=(f"Worker {idx} speaks.",))
+        for idx, engine in enumerate(engines)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert (engines[0]._kokoro is engines[1]._kokoro) is share_runtime
+    assert overlapped == ([False, False] if share_runtime else [True, True])
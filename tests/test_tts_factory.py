@@ -1,60 +1,107 @@
 from __future__ import annotations
 
 from dataclasses import replace
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from epub2audio.config import load_config
+from epub2audio.config import Config, load_config
 from epub2audio.tts_engine import MlxTtsEngine, TtsModelError
 from epub2audio.tts_engine_kokoro_onnx import KokoroOnnxTtsEngine
-from epub2audio.tts_factory import backend_diagnostics, build_tts_engine, model_cache_status
+from epub2audio.tts_factory import (
+    backend_diagnostics,
+    build_tts_engine,
+    clear_backend_diagnostics_cache,
+    model_cache_status,
+)
 
 
-def _config(tmp_path: Path):
-    return load_config(cwd=tmp_path)
+@pytest.fixture(scope="module")
+def base_config(tmp_path_factory: pytest.TempPathFactory) -> Config:
+    # Configs are frozen dataclasses; tests derive variants with replace().
+    return load_config(cwd=tmp_path_factory.mktemp("config"))
 
 
-def test_build_tts_engine_kokoro_default(tmp_path: Path) -> None:
-    config = _config(tmp_path)
-    engine = build_tts_engine(config, tmp_path / "out")
-    assert isinstance(engine, KokoroOnnxTtsEngine)
+def test_build_tts_engine_kokoro_default(base_config: Config, tmp_path: Path) -> None:
+    engine = build_tts_engine(base_config, tmp_path / "out")
+    assert type(engine) is KokoroOnnxTtsEngine
 
 
-def test_build_tts_engine_mlx(tmp_path: Path) -> None:
-    config = _config(tmp_path)
-    config = replace(config, tts=replace(config.tts, engine="mlx", model_id="mlx-community/test"))
+def test_build_tts_engine_mlx(base_config: Config, tmp_path: Path) -> None:
+    config = replace(base_config, tts=replace(base_config.tts, engine="mlx", model_id="mlx-community/test"))
     engine = build_tts_engine(config, tmp_path / "out")
-    assert isinstance(engine, MlxTtsEngine)
+    assert type(engine) is MlxTtsEngine
 
 
-def test_build_tts_engine_unsupported(tmp_path: Path) -> None:
-    config = _config(tmp_path)
-    config = replace(config, tts=replace(config.tts, engine="bad_engine"))
+def test_build_tts_engine_unsupported(base_config: Config, tmp_path: Path) -> None:
+    config = replace(base_config, tts=replace(base_config.tts, engine="bad_engine"))
     with pytest.raises(TtsModelError, match="Unsupported TTS engine"):
         build_tts_engine(config, tmp_path / "out")
 
 
-def test_backend_diagnostics_reports_kokoro_checks(tmp_path: Path) -> None:
-    config = _config(tmp_path)
-    checks = backend_diagnostics(config)
+def test_backend_diagnostics_reports_kokoro_checks(base_config: Config) -> None:
+    checks = backend_diagnostics(base_config)
     names = {check.name for check in checks}
     assert "TTS backend" in names
     assert "ONNX providers" in names
 
 
-def test_model_cache_status_reports_missing_required_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+def test_backend_diagnostics_probes_once_per_engine(base_config: Config, monkeypatch: pytest.MonkeyPatch) -> None:
+    probes: list[int] = []
+
+    def fake_providers() -> list[str]:
+        probes.append(1)
+        return ["CPUExecutionProvider"]
+
+    monkeypatch.setattr("epub2audio.tts_factory.get_available_onnx_providers", fake_providers)
+    clear_backend_diagnostics_cache()
+    try:
+        first = backend_diagnostics(base_config)
+        first.clear()
+        second = backend_diagnostics(base_config)
+    finally:
+        clear_backend_diagnostics_cache()
+
+    assert len(probes) == 1
+    assert "ONNX providers" in {check.name for check in second}
+
+
+def test_model_cache_status_reports_missing_required_files(tmp_path: Path) -> None:
     hub = tmp_path / "hub"
     model_root = hub / "models--onnx-community--Kokoro-82M-v1.0-ONNX"
     snapshot = model_root / "snapshots" / "hash123"
     snapshot.mkdir(parents=True)
     (snapshot / "model_q8f16.onnx").write_text("x")
 
-    monkeypatch.setenv("HF_HUB_CACHE", str(hub))
     status = model_cache_status(
         "onnx-community/Kokoro-82M-v1.0-ONNX",
         required_files=("model_q8f16.onnx", "voices-v1.0.bin"),
+        cache_root=hub,
     )
 
     assert status.path == model_root
     assert status.missing_files == ("voices-v1.0.bin",)
+
+
+def test_model_cache_status_follows_hub_symlinks_and_env(tmp_path: Path) -> None:
+    hub = tmp_path / "hub"
+    model_root = hub / "models--onnx-community--Kokoro-82M-v1.0-ONNX"
+    blob = model_root / "blobs" / "abc"
+    blob.parent.mkdir(parents=True)
+    blob.write_text("x")
+    snapshot = model_root / "snapshots" / "hash123"
+    (snapshot / "onnx").mkdir(parents=True)
+    (snapshot / "voices-v1.0.bin").symlink_to(blob)
+    (snapshot / "onnx" / "model.onnx").symlink_to(blob)
+    (snapshot / "dangling.bin").symlink_to(model_root / "blobs" / "missing")
+
+    with patch.dict(os.environ, {"HF_HUB_CACHE": str(hub)}):
+        status = model_cache_status(
+            "onnx-community/Kokoro-82M-v1.0-ONNX",
+            required_files=("voices-v1.0.bin", "onnx/model.onnx", "dangling.bin"),
+        )
+
+    assert status.path == model_root
+    assert status.missing_files == ("dangling.bin",)
@@ -1,19 +1,42 @@
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
+from typing import Callable
 
-from epub2audio.interfaces import AudioChunk, TtsEngine
+from epub2audio.interfaces import AudioChunk, Segment, TtsEngine
 from epub2audio.tts_engine import TtsInputError, TtsTransientError
-from epub2audio.tts_pipeline import TtsSynthesisSettings, synthesize_text
+from epub2audio.tts_pipeline import (
+    TtsSynthesisSettings,
+    _split_text,
+    _split_text_cached,
+    clear_split_cache,
+    synthesize_stream,
+    synthesize_text,
+)
+
+
+class _DummyEngine(TtsEngine):
+    """Engine whose synthesize() delegates to a per-test callable."""
+
+    def __init__(self, respond: Callable[[str], AudioChunk]) -> None:
+        self._respond = respond
+
+    def synthesize(self, text: str, voice: str | None = None, config: dict | None = None) -> AudioChunk:
+        return self._respond(text)
+
+
+def _recording_engine(calls: list[str], tmp_path: Path) -> _DummyEngine:
+    def respond(text: str) -> AudioChunk:
+        calls.append(text)
+        return AudioChunk(index=0, path=tmp_path / f"{len(calls)}.wav")
+
+    return _DummyEngine(respond)
 
 
 def test_synthesize_text_splits_long_text(tmp_path: Path) -> None:
     calls: list[str] = []
-
-    class DummyEngine(TtsEngine):
-        def synthesize(self, text: str, voice: str | None = None, config: dict | None = None) -> AudioChunk:
-            calls.append(text)
-            return AudioChunk(index=0, path=tmp_path / f"{len(calls)}.wav")
+    engine = _recording_engine(calls, tmp_path)
 
     settings = TtsSynthesisSettings(
         model_id="test",
@@ -33,7 +56,7 @@ def test_synthesize_text_splits_long_text(tmp_path: Path) -> None:
     )
 
     text = "Sentence one. Sentence two. Sentence three. Sentence four."
-    chunks = synthesize_text(text, DummyEngine(), settings, sleep_fn=lambda _: None)
+    chunks = synthesize_text(text, engine, settings, sleep_fn=lambda _: None)
 
     assert len(chunks) >= 2
     assert len(calls) >= 2
@@ -42,12 +65,13 @@ def test_synthesize_text_splits_long_text(tmp_path: Path) -> None:
 def test_transient_retry(tmp_path: Path) -> None:
     attempts = {"count": 0}
 
-    class DummyEngine(TtsEngine):
-        def synthesize(self, text: str, voice: str | None = None, config: dict | None = None) -> AudioChunk:
-            attempts["count"] += 1
-            if attempts["count"] < 3:
-                raise TtsTransientError("temporary")
-            return AudioChunk(index=0, path=tmp_path / "ok.wav")
+    def respond(text: str) -> AudioChunk:
+        attempts["count"] += 1
+        if attempts["count"] < 3:
+            raise TtsTransientError("temporary")
+        return AudioChunk(index=0, path=tmp_path / "ok.wav")
+
+    engine = _DummyEngine(respond)
 
     settings = TtsSynthesisSettings(
         model_id="test",
@@ -66,7 +90,7 @@ def test_transient_retry(tmp_path: Path) -> None:
         ref_audio_id=None,
     )
 
-    chunks = synthesize_text("Hello world.", DummyEngine(), settings, sleep_fn=lambda _: None)
+    chunks = synthesize_text("Hello world.", engine, settings, sleep_fn=lambda _: None)
     assert len(chunks) == 1
     assert attempts["count"] == 3
 
@@ -74,10 +98,11 @@ def test_transient_retry(tmp_path: Path) -> None:
 def test_invalid_input_skips(tmp_path: Path) -> None:
     calls: list[str] = []
 
-    class DummyEngine(TtsEngine):
-        def synthesize(self, text: str, voice: str | None = None, config: dict | None = None) -> AudioChunk:
-            calls.append(text)
-            raise TtsInputError("empty")
+    def respond(text: str) -> AudioChunk:
+        calls.append(text)
+        raise TtsInputError("empty")
+
+    engine = _DummyEngine(respond)
 
     settings = TtsSynthesisSettings(
         model_id="test",
@@ -96,6 +121,132 @@ def test_invalid_input_skips(tmp_path: Path) -> None:
         ref_audio_id=None,
     )
 
-    chunks = synthesize_text("!!!", DummyEngine(), settings, sleep_fn=lambda _: None)
+    chunks = synthesize_text("!!!", engine, settings, sleep_fn=lambda _: None)
     assert chunks == []
     assert calls
+
+
+def test_synthesize_stream_flushes_at_sentence_boundaries(tmp_path: Path) -> None:
+    calls: list[str] = []
+    engine = _recording_engine(calls, tmp_path)
+
+    settings = TtsSynthesisSettings(
+        model_id="test",
+        max_chars=200,
+        min_chars=10,
+        hard_max_chars=None,
+        max_retries=1,
+        backoff_base=0.0,
+        backoff_jitter=0.0,
+        sample_rate=24000,
+        channels=1,
+        speed=1.0,
+        lang_code=None,
+        ref_audio=None,
+        ref_text=None,
+        ref_audio_id=None,
+    )
+
+    async def fragments():
+        for fragment in ["Hello ", "there. ", "Second ", "sentence", " here. ", "Trailing words"]:
+            yield fragment
+
+    async def collect() -> list[AudioChunk]:
+        stream = synthesize_stream(fragments(), engine, settings, sleep_fn=lambda _: None)
+        return [chunk async for chunk in stream]
+
+    chunks = asyncio.run(collect())
+
+    assert calls == ["Hello there.", "Second sentence here.", "Trailing words."]
+    assert [chunk.path.name for chunk in chunks] == ["1.wav", "2.wav", "3.wav"]
+
+
+def test_split_text_is_memoized_for_short_text() -> None:
+    settings = TtsSynthesisSettings(
+        model_id="test",
+        max_chars=20,
+        min_chars=5,
+        hard_max_chars=None,
+        max_retries=1,
+        backoff_base=0.0,
+        backoff_jitter=0.0,
+        sample_rate=24000,
+        channels=1,
+        speed=1.0,
+        lang_code=None,
+        ref_audio=None,
+        ref_text=None,
+        ref_audio_id=None,
+    )
+    clear_split_cache()
+
+    first = _split_text("Sentence one. Sentence two. Sentence three.", settings)
+    second = _split_text("Sentence one. Sentence two. Sentence three.", settings)
+
+    assert first == second
+    assert _split_text_cached.cache_info().hits == 1
+    clear_split_cache()
+    assert _split_text_cached.cache_info().currsize == 0
+
+
+def test_synthesize_text_uses_small_first_segment(tmp_path: Path) -> None:
+    calls: list[str] = []
+    engine = _recording_engine(calls, tmp_path)
+
+    settings = TtsSynthesisSettings(
+        model_id="test",
+        max_chars=400,
+        min_chars=200,
+        hard_max_chars=None,
+        max_retries=1,
+        backoff_base=0.0,
+        backoff_jitter=0.0,
+        sample_rate=24000,
+        channels=1,
+        speed=1.0,
+        lang_code=None,
+        ref_audio=None,
+        ref_text=None,
+        ref_audio_id=None,
+    )
+
+    text = " ".join(f"This is sentence number {n} of the chapter." for n in range(20))
+    synthesize_text(text, engine, settings, sleep_fn=lambda _: None)
+
+    assert len(calls[0]) <= 120
+    assert len(calls) >= 3
+    assert " ".join(calls).replace("..", ".") == text
+
+
+def test_small_first_segment_keeps_custom_segmenter_output(tmp_path: Path) -> None:
+    calls: list[str] = []
+    engine = _recording_engine(calls, tmp_path)
+    first = " ".join(f"Opening sentence {n} is here." for n in range(8))
+    later = ["Second segment from the custom segmenter.", "Third segment, left as given"]
+
+    class FixedSegmenter:
+        def segment(self, text: str) -> list[Segment]:
+            return [Segment(index=i, text=part) for i, part in enumerate([first, *later])]
+
+    settings = TtsSynthesisSettings(
+        model_id="test",
+        max_chars=400,
+        min_chars=0,
+        hard_max_chars=None,
+        max_retries=1,
+        backoff_base=0.0,
+        backoff_jitter=0.0,
+        sample_rate=24000,
+        channels=1,
+        speed=1.0,
+        lang_code=None,
+        ref_audio=None,
+        ref_text=None,
+        ref_audio_id=None,
+    )
+
+    synthesize_text("ignored", engine, settings, segmenter=FixedSegmenter(), sleep_fn=lambda _: None)
+
+    assert len(calls[0]) <= 120
+    assert " ".join(calls[: -len(later)]) == first
+    assert calls[-len(later) :] == later
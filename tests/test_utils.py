@@ -1,6 +1,13 @@
 from __future__ import annotations
 
-from epub2audio.utils import slugify
+from datetime import datetime
+from pathlib import Path
+import re
+from unittest.mock import patch
+
+import pytest
+
+from epub2audio.utils import atomic_write_bytes, generate_run_id, slugify
 
 
 def test_slugify_basic() -> None:
@@ -15,3 +22,32 @@ def test_slugify_fallback() -> None:
 
 def test_slugify_preserves_words() -> None:
     assert slugify("Already-Slug") == "already-slug"
+
+
+def test_atomic_write_bytes_replaces_file(tmp_path: Path) -> None:
+    path = tmp_path / "log.json"
+    path.write_bytes(b"old")
+
+    atomic_write_bytes(path, b"new contents")
+
+    assert path.read_bytes() == b"new contents"
+    assert not (tmp_path / "log.json.tmp").exists()
+
+
+def test_atomic_write_bytes_removes_temp_file_on_failure(tmp_path: Path) -> None:
+    path = tmp_path / "state.json"
+    path.write_bytes(b"old")
+
+    with patch("epub2audio.utils.os.fsync", side_effect=OSError("disk full")):
+        with pytest.raises(OSError, match="disk full"):
+            atomic_write_bytes(path, b"new contents")
+
+    assert path.read_bytes() == b"old"
+    assert not (tmp_path / "state.json.tmp").exists()
+
+
+def test_generate_run_id_is_a_timestamp() -> None:
+    run_id = generate_run_id()
+
+    assert re.fullmatch(r"\d{8}-\d{6}", run_id)
+    datetime.strptime(run_id, "%Y%m%d-%H%M%S")